@@ -0,0 +1,219 @@
+"""
+Batch Quote & Forecast CLI
+
+Re-price a file of quote requests, or run a file of forecast ranges, without
+the GUI. Input is CSV or JSONL on stdin or a file; results are written as
+they are produced, so memory stays flat however large the input is.
+
+    python3 batch_cli.py quote inquiries.csv --output quotes.jsonl --workers 4
+    cat ranges.jsonl | python3 batch_cli.py forecast --format jsonl
+
+Quote records have cabin_type, check_in, check_out and optionally
+cabin_count and activities. In CSV, activities are written as
+"hiking:2;kayaking:1". Forecast records have start_date and end_date. An
+"id" field, if present, is copied to the output.
+"""
+
+import argparse
+import csv
+from datetime import date, datetime
+import json
+import sys
+
+from parallel import parallel_map
+from pricing_engine import PricingEngine, parse_date
+
+QUOTE_COLUMNS = ["id", "cabin_type", "check_in", "check_out", "nights", "cabin_count",
+                 "room_total", "activities_total", "grand_total", "error"]
+FORECAST_COLUMNS = ["id", "start_date", "end_date", "num_days", "total_cabin_revenue",
+                    "total_activity_revenue", "total_revenue", "avg_daily_revenue", "avg_occupancy", "error"]
+
+_engine = None
+
+def get_engine():
+    """Per-process pricing engine"""
+    global _engine
+    if _engine is None:
+        _engine = PricingEngine()
+    return _engine
+
+# --- Reading ---
+
+def detect_format(path, fmt):
+    if fmt:
+        return fmt
+    if path and path.endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+def read_records(stream, fmt):
+    """Yield one dict per input record"""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    else:
+        for number, line in enumerate(stream, 1):
+            line = line.strip()
+            if line:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    yield {"_parse_error": f"Line {number} is not valid JSON"}
+                    continue
+                if isinstance(record, dict):
+                    yield record
+                else:
+                    yield {"_parse_error": f"Line {number} is not a JSON object"}
+
+def parse_activities(value):
+    """Activities from a dict, a JSON object string or "key:count;key:count" """
+    if not value:
+        return {}
+    if isinstance(value, dict):
+        return value
+    if not isinstance(value, str):
+        raise ValueError('activities must be an object or a "key:count;key:count" string')
+    value = value.strip()
+    if value.startswith("{"):
+        activities = json.loads(value)
+        if not isinstance(activities, dict):
+            raise ValueError("activities must be a JSON object")
+        return activities
+    activities = {}
+    for part in value.split(";"):
+        if part.strip():
+            key, _, count = part.partition(":")
+            activities[key.strip()] = int(count or 1)
+    return activities
+
+# --- Processing (runs in worker processes) ---
+
+def record_error(record):
+    """Why a record cannot be processed at all, or None"""
+    if not isinstance(record, dict):
+        return f"Record must be an object, not {type(record).__name__}"
+    return record.get("_parse_error")
+
+def date_field(record, key):
+    value = record[key]
+    if not isinstance(value, str):
+        raise ValueError(f"{key} must be a YYYY-MM-DD date")
+    return value
+
+def quote_record(item):
+    """Price one quote record; errors are reported in the result"""
+    record, as_of = item
+    error = record_error(record)
+    if error:
+        return {"id": None, "error": error}
+    result = {"id": record.get("id")}
+    try:
+        quote = get_engine().quote({
+            "cabin_type": record.get("cabin_type") or "forest",
+            "check_in": date_field(record, "check_in"),
+            "check_out": date_field(record, "check_out"),
+            "cabin_count": record.get("cabin_count") or 1,
+            "activities": parse_activities(record.get("activities"))
+        }, now=as_of)
+    except KeyError as e:
+        result["error"] = f"Missing field: {e.args[0]}"
+        return result
+    except (TypeError, ValueError) as e:
+        result["error"] = str(e)
+        return result
+
+    for column in QUOTE_COLUMNS[1:-1]:
+        result[column] = quote[column]
+    result["nightly_prices"] = [night["price"] * quote["cabin_multiplier"] for night in quote["nightly_data"]]
+    return result
+
+def forecast_record(item):
+    """Forecast one date range; errors are reported in the result"""
+    from predicted_revenue import predict_period_revenue
+
+    record, _ = item
+    error = record_error(record)
+    if error:
+        return {"id": None, "error": error}
+    result = {"id": record.get("id")}
+    try:
+        start_date = parse_date(date_field(record, "start_date"))
+        end_date = parse_date(date_field(record, "end_date"))
+        if end_date <= start_date:
+            raise ValueError("End date must be after start date.")
+        forecast = predict_period_revenue(start_date, end_date, vectorized=True)
+    except KeyError as e:
+        result["error"] = f"Missing field: {e.args[0]}"
+        return result
+    except (TypeError, ValueError) as e:
+        result["error"] = str(e)
+        return result
+
+    for column in FORECAST_COLUMNS[1:-1]:
+        result[column] = forecast[column]
+    result["cabin_breakdown"] = forecast["cabin_breakdown"]
+    return result
+
+# --- Writing ---
+
+def to_json(value):
+    """json.dumps fallback for dates and NumPy values (also used by quote_service.py)"""
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d")
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def write_results(results, stream, fmt, columns):
+    """Write each result as soon as it arrives; returns (written, errors)"""
+    written = errors = 0
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+    for result in results:
+        if writer is not None:
+            writer.writerow({k: to_json(v) if isinstance(v, (datetime, date)) else v for k, v in result.items()})
+        else:
+            stream.write(json.dumps(result, default=to_json) + "\n")
+        written += 1
+        errors += "error" in result
+        if written % 1000 == 0:
+            stream.flush()
+    stream.flush()
+    return written, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk quotes and forecasts from CSV or JSONL.")
+    parser.add_argument("job", choices=["quote", "forecast"])
+    parser.add_argument("input", nargs="?", help="input file (default: stdin)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="input format (default: from extension, else jsonl)")
+    parser.add_argument("--output", help="output file (default: stdout)")
+    parser.add_argument("--output-format", choices=["csv", "jsonl"], default="jsonl")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--chunksize", type=int, default=256, help="records per worker task")
+    parser.add_argument("--as-of", help="price quotes as if today were YYYY-MM-DD (default: now)")
+    args = parser.parse_args(argv)
+
+    as_of = parse_date(args.as_of) if args.as_of else datetime.now()
+    fn, columns = (quote_record, QUOTE_COLUMNS) if args.job == "quote" else (forecast_record, FORECAST_COLUMNS)
+
+    source = open(args.input, newline="", encoding="utf-8") if args.input else sys.stdin
+    sink = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        records = read_records(source, detect_format(args.input, args.format))
+        items = ((record, as_of) for record in records)
+        results = parallel_map(fn, items, workers=args.workers, chunksize=args.chunksize)
+        written, errors = write_results(results, sink, args.output_format, columns)
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            sink.close()
+
+    print(f"Processed {written} records ({errors} errors)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
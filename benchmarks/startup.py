@@ -0,0 +1,110 @@
+"""
+Startup Benchmark
+
+Measures the cold-import time of the headless modules, each in a fresh
+interpreter, and checks that none of them pulls in a GUI toolkit. Exits
+non-zero if a module loads customtkinter/tkinter, goes over its time budget,
+or is slower than a saved baseline by more than the allowed margin.
+
+    python3 benchmarks/startup.py
+    python3 benchmarks/startup.py --save startup.json
+    python3 benchmarks/startup.py --baseline startup.json --threshold 0.25 --slack-ms 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module -> import budget in milliseconds (time spent importing it, not
+# interpreter start-up)
+MODULES = {
+    "pricing_engine": 100,
+    "dynamic_pricing": 100,
+    "predicted_revenue": 100,
+    "batch_cli": 250,
+    "quote_service": 300
+}
+GUI_MODULES = ("customtkinter", "tkinter")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "gui": [m for m in {gui!r} if m in sys.modules]}}))
+"""
+
+def measure(module, repeat=5):
+    """Import module in repeat fresh interpreters; returns timings and any GUI modules loaded"""
+    timings, gui = [], set()
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, gui=GUI_MODULES)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        timings.append(result["ms"])
+        gui.update(result["gui"])
+    return {
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "max_ms": max(timings),
+        "gui_modules": sorted(gui)
+    }
+
+def check(results, baseline=None, threshold=0.25, slack_ms=5.0):
+    """List of failure messages (empty if everything passed)
+
+    A module regresses when it is both threshold (relative) and slack_ms
+    (absolute) slower than the baseline, so millisecond-level jitter on the
+    small modules does not fail the run.
+    """
+    failures = []
+    for module, result in results.items():
+        if result["gui_modules"]:
+            failures.append(f"{module} imports {', '.join(result['gui_modules'])}")
+        if result["median_ms"] > MODULES[module]:
+            failures.append(f"{module} took {result['median_ms']:.1f} ms (budget {MODULES[module]} ms)")
+        previous = (baseline or {}).get(module)
+        if previous and result["median_ms"] > max(previous["median_ms"] * (1 + threshold),
+                                                  previous["median_ms"] + slack_ms):
+            failures.append(f"{module} took {result['median_ms']:.1f} ms "
+                            f"(baseline {previous['median_ms']:.1f} ms, +{threshold:.0%} allowed)")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-import latency of the headless modules.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--save", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --save")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown against the baseline")
+    parser.add_argument("--slack-ms", type=float, default=5.0, help="slowdown always allowed, in milliseconds")
+    args = parser.parse_args(argv)
+
+    results = {module: measure(module, args.repeat) for module in MODULES}
+    for module, result in results.items():
+        print(f"{module:<20} median {result['median_ms']:7.1f} ms   min {result['min_ms']:7.1f} ms   "
+              f"budget {MODULES[module]:4d} ms")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    failures = check(results, baseline, args.threshold, args.slack_ms)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
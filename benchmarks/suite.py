@@ -0,0 +1,248 @@
+"""
+Pricing & Forecasting Benchmarks
+
+Times the hot paths of the quote calculator and the revenue model at
+horizons from 1 night to 10 years:
+- price_for_date       PricingEngine.calculate_price_for_date, one night
+- quote                PricingEngine.quote (the headless calculate_quote path)
+- seasons_in_range     get_seasons_in_range
+- daily_revenue        predict_daily_revenue, one day
+- period_revenue       predict_period_revenue (scalar)
+- period_vectorized    predict_period_revenue(vectorized=True)
+
+For every case it records latency percentiles, throughput (nights or days
+per second) and peak memory, and can save the results to JSON and compare
+them with an earlier run:
+
+    python3 benchmarks/suite.py --save before.json
+    python3 benchmarks/suite.py --baseline before.json --threshold 0.2
+    python3 benchmarks/suite.py --quick --only quote
+
+Exits non-zero when a case's median latency (or the --metric chosen) is more
+than threshold slower than in the baseline.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from pricing_engine import PricingEngine, get_seasons_in_range
+import predicted_revenue
+
+HORIZONS = (1, 7, 30, 90, 365, 3650)
+# Fixed dates so runs are comparable: quotes are priced "as of" AS_OF for
+# stays starting START
+AS_OF = datetime(2026, 1, 1)
+START = datetime(2026, 2, 1)
+
+
+# --- Cases ---
+# Each case is (name, horizon, units, make) where make() returns the
+# function to time; units is the number of nights/days one call covers.
+
+def price_for_date_cases():
+    engine = PricingEngine()
+    dates = [START + timedelta(days=i) for i in range(365)]
+    state = {"i": 0}
+
+    def run():
+        i = state["i"] = (state["i"] + 1) % len(dates)
+        engine.calculate_price_for_date(dates[i], 31, "forest")
+    yield "price_for_date", 1, 1, lambda: run
+
+def quote_cases():
+    for nights in HORIZONS:
+        def make(nights=nights):
+            engine = PricingEngine()
+            request = {
+                "cabin_type": "treehouse",
+                "check_in": START,
+                "check_out": START + timedelta(days=nights),
+                "cabin_count": 2,
+                "activities": {"hiking": 2} if nights < 90 else {}
+            }
+            return lambda: engine.quote(request, now=AS_OF)
+        yield "quote", nights, nights, make
+
+def seasons_in_range_cases():
+    for nights in HORIZONS:
+        def make(nights=nights):
+            end = START + timedelta(days=nights)
+            return lambda: get_seasons_in_range(START, end)
+        yield "seasons_in_range", nights, nights, make
+
+def daily_revenue_cases():
+    dates = [START + timedelta(days=i) for i in range(365)]
+    state = {"i": 0}
+
+    def run():
+        i = state["i"] = (state["i"] + 1) % len(dates)
+        predicted_revenue.predict_daily_revenue(dates[i])
+    yield "daily_revenue", 1, 1, lambda: run
+
+def period_revenue_cases():
+    for days in HORIZONS:
+        def make(days=days):
+            end = START + timedelta(days=days)
+            return lambda: predicted_revenue.predict_period_revenue(START, end)
+        yield "period_revenue", days, days, make
+
+def period_vectorized_cases():
+    for days in HORIZONS:
+        def make(days=days):
+            end = START + timedelta(days=days)
+            return lambda: predicted_revenue.predict_period_revenue(START, end, vectorized=True)
+        yield "period_vectorized", days, days, make
+
+CASES = (price_for_date_cases, quote_cases, seasons_in_range_cases, daily_revenue_cases,
+         period_revenue_cases, period_vectorized_cases)
+
+
+# --- Measurement ---
+
+def percentile(sorted_values, q):
+    """Linear-interpolated percentile of an already sorted list"""
+    position = (len(sorted_values) - 1) * q
+    lo = int(position)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (position - lo)
+
+def calls_per_sample(fn, min_sample=0.001):
+    """How many calls to batch per timing sample so a sample takes at least min_sample seconds"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= min_sample or number >= 1 << 20:
+            return number
+        number *= 2
+
+def measure(fn, units, budget=0.5, min_repeats=5, max_repeats=10000):
+    """Time fn until budget seconds are used (within the repeat limits)
+
+    Calls that take microseconds are timed in batches (see
+    calls_per_sample), so each latency sample is the mean of its batch.
+    """
+    first_start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - first_start
+    number = calls_per_sample(fn)
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        deadline = time.perf_counter() + budget
+        while len(timings) < max_repeats and (len(timings) < min_repeats or time.perf_counter() < deadline):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    # Peak memory of one call, measured separately so tracing does not
+    # slow the timed calls
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    median = statistics.median(timings)
+    return {
+        "repeats": len(timings),
+        "calls_per_sample": number,
+        "first_ms": first * 1000,
+        "min_ms": timings[0] * 1000,
+        "mean_ms": statistics.fmean(timings) * 1000,
+        "p50_ms": median * 1000,
+        "p90_ms": percentile(timings, 0.90) * 1000,
+        "p99_ms": percentile(timings, 0.99) * 1000,
+        "calls_per_s": 1 / median if median else float("inf"),
+        "units_per_s": units / median if median else float("inf"),
+        "peak_kib": peak / 1024
+    }
+
+def run_suite(only=None, budget=0.5, max_horizon=None):
+    """{case key: result} for every selected case; keys look like "quote[30]" """
+    results = {}
+    for cases in CASES:
+        for name, horizon, units, make in cases():
+            if only and name not in only:
+                continue
+            if max_horizon and horizon > max_horizon:
+                continue
+            key = f"{name}[{horizon}]"
+            result = measure(make(), units, budget=budget)
+            result.update(case=name, horizon=horizon)
+            results[key] = result
+            print(f"{key:<26} p50 {result['p50_ms']:10.4f} ms   p99 {result['p99_ms']:10.4f} ms   "
+                  f"{result['units_per_s']:14,.0f} /s   peak {result['peak_kib']:10.1f} KiB")
+    return results
+
+def compare(results, baseline, threshold=0.2, metric="p50_ms"):
+    """List of regression messages: cases whose metric grew by more than threshold"""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        change = result[metric] / previous[metric] - 1 if previous[metric] else 0.0
+        if change > threshold:
+            regressions.append(f"{key}: {metric} {previous[metric]:.4f} -> {result[metric]:.4f} (+{change:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark quoting and forecasting hot paths.")
+    parser.add_argument("--only", nargs="+", help="case names to run (default: all)")
+    parser.add_argument("--budget", type=float, default=0.5, help="seconds of timing per case")
+    parser.add_argument("--quick", action="store_true", help="short budget and horizons up to one year")
+    parser.add_argument("--save", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --save")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown against the baseline")
+    parser.add_argument("--metric", choices=["p50_ms", "min_ms", "p90_ms", "mean_ms"], default="p50_ms",
+                        help="latency compared with the baseline (min_ms is steadier on noisy machines)")
+    args = parser.parse_args(argv)
+
+    budget = 0.1 if args.quick else args.budget
+    results = run_suite(args.only, budget, max_horizon=365 if args.quick else None)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({
+                "meta": {
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform()
+                },
+                "results": results
+            }, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, args.metric)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
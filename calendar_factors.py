@@ -0,0 +1,169 @@
+"""
+Calendar Factor Index
+
+Seasonality, weekend and holiday factors only depend on the calendar, so they
+are computed once per year into flat arrays indexed by day-of-year. The
+pricing engine and the revenue model look values up here instead of
+re-deriving them for every night of every quote.
+
+Holidays and events are rules (see holiday_calendar.py) compiled into the
+same per-year tables, so a lookup costs the same however many rules there
+are. Tables are built lazily the first time a year is requested and are
+thrown away (and rebuilt on demand) whenever the index is reconfigured.
+Building and reconfiguring share one lock, so a table built from the old
+configuration is never stored after a reconfiguration.
+"""
+
+from array import array
+from datetime import date as date_cls
+import threading
+
+# Holiday kinds are re-exported for the modules that read the tables
+from holiday_calendar import HOLIDAY_MAJOR, HOLIDAY_NONE, HOLIDAY_SEASON, DateRange, FixedDate, compile_year
+
+SEASONS = ("winter", "spring", "summer", "fall")
+
+# Monthly price factors
+MONTHLY_FACTORS = {
+    1: 1.25, 2: 1.15, 3: 0.85, 4: 0.95, 5: 1.35, 6: 1.85,
+    7: 1.95, 8: 1.95, 9: 1.15, 10: 0.95, 11: 0.85, 12: 1.25
+}
+
+# Weekend premium (Friday, Saturday, Sunday)
+WEEKEND_FACTOR = 1.25
+WEEKEND_DAYS = (4, 5, 6)
+
+# Holiday and event rules with their price multipliers; where rules overlap
+# the later one wins. Major holidays get the "major" occupancy boost, the
+# rest the holiday "season" boost.
+DEFAULT_HOLIDAYS = (
+    DateRange("Holiday season", (12, 20), (12, 30), factor=3.5),
+    FixedDate("Christmas Eve", 12, 24, factor=5.0, major=True),
+    FixedDate("Christmas", 12, 25, factor=5.0, major=True),
+    FixedDate("New Year's Eve", 12, 31, factor=5.0, major=True),
+    FixedDate("New Year's Day", 1, 1, factor=5.0, major=True),
+    FixedDate("Day after New Year", 1, 2, factor=3.5),
+    FixedDate("Post New Year", 1, 3, factor=3.0)
+)
+
+def season_index(month):
+    """Index into SEASONS for a month"""
+    if month in (3, 4, 5):
+        return 1
+    elif month in (6, 7, 8):
+        return 2
+    elif month in (9, 10, 11):
+        return 3
+    return 0
+
+
+class CalendarYear:
+    """Flat per-day factor arrays for one calendar year"""
+
+    __slots__ = ("year", "start_ordinal", "days", "seasonality", "weekend", "holiday_kind", "holiday_boost",
+                 "holiday_rule", "season")
+
+    def __init__(self, year, start_ordinal, days):
+        self.year = year
+        self.start_ordinal = start_ordinal
+        self.days = days
+        self.seasonality = array("d")
+        self.weekend = array("b")
+        self.holiday_kind = array("b")
+        self.holiday_boost = array("d")   # a rule's own occupancy boost, 0.0 where its kind's applies
+        self.holiday_rule = array("h")    # index into the index's holidays, -1 on ordinary days
+        self.season = array("b")
+
+
+class CalendarFactorIndex:
+    """Per-year lookup tables for seasonality, weekend and holiday factors"""
+
+    def __init__(self, monthly_factors=None, weekend_factor=None, weekend_days=None, holidays=None):
+        self.monthly_factors = dict(MONTHLY_FACTORS)
+        self.weekend_factor = WEEKEND_FACTOR
+        self.weekend_days = tuple(WEEKEND_DAYS)
+        self.holidays = DEFAULT_HOLIDAYS
+        self.version = 0
+        self._years = {}
+        self._lock = threading.Lock()
+        self.configure(monthly_factors=monthly_factors, weekend_factor=weekend_factor,
+                       weekend_days=weekend_days, holidays=holidays)
+
+    def configure(self, monthly_factors=None, weekend_factor=None, weekend_days=None, holidays=None):
+        """Change the calendar configuration; tables are rebuilt on next use
+
+        holidays is a sequence of holiday_calendar rules, later rules taking
+        precedence where they overlap.
+        """
+        with self._lock:
+            if monthly_factors is not None:
+                self.monthly_factors = dict(monthly_factors)
+            if weekend_factor is not None:
+                self.weekend_factor = weekend_factor
+            if weekend_days is not None:
+                self.weekend_days = tuple(weekend_days)
+            if holidays is not None:
+                self.holidays = tuple(holidays)
+            self._years = {}
+            self.version += 1
+
+    def year(self, year):
+        """Return the factor tables for a year, building them if needed"""
+        table = self._years.get(year)
+        if table is None:
+            with self._lock:
+                table = self._years.get(year)
+                if table is None:
+                    table = self._build_year(year)
+                    self._years[year] = table
+        return table
+
+    def _build_year(self, year):
+        start_ordinal = date_cls(year, 1, 1).toordinal()
+        days = date_cls(year, 12, 31).toordinal() - start_ordinal + 1
+        table = CalendarYear(year, start_ordinal, days)
+        holiday_factor, table.holiday_kind, table.holiday_boost, table.holiday_rule = \
+            compile_year(self.holidays, year, start_ordinal, days)
+
+        for offset in range(days):
+            day = date_cls.fromordinal(start_ordinal + offset)
+            is_weekend = day.weekday() in self.weekend_days
+            weekend_factor = self.weekend_factor if is_weekend else 1.0
+            table.seasonality.append(self.monthly_factors[day.month] * weekend_factor * holiday_factor[offset])
+            table.weekend.append(is_weekend)
+            table.season.append(season_index(day.month))
+
+        return table
+
+    def seasonality(self, date):
+        """Price seasonality factor (month x weekend x holiday) for a date"""
+        table = self._years.get(date.year) or self.year(date.year)
+        return table.seasonality[date.toordinal() - table.start_ordinal]
+
+    def is_weekend(self, date):
+        table = self._years.get(date.year) or self.year(date.year)
+        return bool(table.weekend[date.toordinal() - table.start_ordinal])
+
+    def holiday_kind(self, date):
+        """HOLIDAY_NONE, HOLIDAY_SEASON or HOLIDAY_MAJOR for a date"""
+        table = self._years.get(date.year) or self.year(date.year)
+        return table.holiday_kind[date.toordinal() - table.start_ordinal]
+
+    def holiday_boost(self, date):
+        """The occupancy boost of the holiday rule on a date, or 0.0 if its kind's boost applies"""
+        table = self._years.get(date.year) or self.year(date.year)
+        return table.holiday_boost[date.toordinal() - table.start_ordinal]
+
+    def holiday(self, date):
+        """The holiday rule that applies on a date, or None"""
+        table = self._years.get(date.year) or self.year(date.year)
+        index = table.holiday_rule[date.toordinal() - table.start_ordinal]
+        return self.holidays[index] if index >= 0 else None
+
+    def season(self, date):
+        table = self._years.get(date.year) or self.year(date.year)
+        return SEASONS[table.season[date.toordinal() - table.start_ordinal]]
+
+
+# Shared index used by the pricing engine and the revenue model
+CALENDAR = CalendarFactorIndex()
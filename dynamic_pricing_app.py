@@ -0,0 +1,832 @@
+"""
+Cabin Booking Quote Calculator - Desktop App
+
+The customtkinter window for the booking calculator. Pricing is done by the
+headless PricingEngine (pricing_engine.py); this module is only loaded when
+the app is created.
+"""
+
+import customtkinter as ctk
+from datetime import datetime, timedelta
+from tkinter import messagebox
+
+from pricing_engine import (CABIN_TYPES, ACTIVITIES, SEASON_BITS, PricingEngine, available_activities, get_season,
+                            season_mask_in_range, seasons_from_mask)
+from instrumentation import instrument
+from live_quote import LiveQuote
+from quote_cache import QuoteCache
+from reservations import UnavailableError
+from virtual_list import VirtualList, set_text
+
+# Configuration
+ctk.set_appearance_mode("Light")
+ctk.set_default_color_theme("blue")
+
+LIVE_QUOTE_DELAY_MS = 250   # wait this long after the last edit before re-quoting
+
+
+class ModernPricingApp(ctk.CTk):
+    """The booking quote window
+
+    ledger is the ReservationLedger bookings are made against (e.g. a
+    QuoteService's); quotes for more cabins than it has free are refused.
+    Without one, quotes are not checked against availability.
+    """
+
+    def __init__(self, ledger=None):
+        super().__init__()
+
+        # Window setup
+        self.title("Cabin Booking Quote")
+        self.geometry("1100x850")
+        self.resizable(True, True)
+        
+        # Pricing State; quotes are checked against the reservation ledger, if any
+        self.ledger = ledger
+        self.engine = PricingEngine(cache=QuoteCache(), ledger=self.ledger)
+        self.live = LiveQuote(self.engine)
+        self.live_mode = ctk.BooleanVar(value=False)
+        self._live_after = None
+        
+        # Selection State
+        self.selected_cabin = ctk.StringVar(value="forest")
+        self.activity_vars = {}
+        self.activity_counts = {}
+        self.available_activities = []
+        self.activity_cards_placed = False
+        
+        self.create_layout()
+
+    def create_layout(self):
+        # Main scrollable container
+        self.main_scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        self.main_scroll.pack(fill="both", expand=True, padx=40, pady=40)
+        
+        # Header
+        header = ctk.CTkFrame(self.main_scroll, fg_color="transparent")
+        header.pack(fill="x", pady=(0, 30))
+        
+        ctk.CTkLabel(
+            header, 
+            text="Cabin Booking Quote", 
+            font=("Helvetica Neue", 36, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w")
+        
+        ctk.CTkLabel(
+            header, 
+            text="Select your cabin, dates, and activities to get an instant quote.", 
+            font=("Helvetica Neue", 16),
+            text_color="#86868b"
+        ).pack(anchor="w", pady=(5, 0))
+
+        # Content Grid
+        content = ctk.CTkFrame(self.main_scroll, fg_color="transparent")
+        content.pack(fill="both", expand=True)
+        content.grid_columnconfigure(0, weight=1)
+        content.grid_columnconfigure(1, weight=1)
+        
+        # Left Column - Inputs
+        left_col = ctk.CTkFrame(content, fg_color="transparent")
+        left_col.grid(row=0, column=0, sticky="nsew", padx=(0, 15))
+        
+        self.create_cabin_selector(left_col)
+        self.create_date_inputs(left_col)
+        self.create_cabin_count(left_col)
+        self.create_activities_section(left_col)
+        
+        # Right Column - Results
+        self.results_card = ctk.CTkFrame(content, fg_color="#FFFFFF", corner_radius=15)
+        self.results_card.grid(row=0, column=1, sticky="nsew", padx=(15, 0))
+        
+        self.create_results_placeholder()
+        
+        # Calculate Button at bottom
+        self.calc_btn = ctk.CTkButton(
+            self.main_scroll,
+            text="Get Quote",
+            font=("Helvetica Neue", 18, "bold"),
+            height=55,
+            corner_radius=27,
+            fg_color="#007AFF",
+            hover_color="#0062CC",
+            command=self.calculate_quote
+        )
+        self.calc_btn.pack(fill="x", pady=(30, 0))
+        
+        # Live quote: re-quote (debounced) whenever an input changes
+        live_row = ctk.CTkFrame(self.main_scroll, fg_color="transparent")
+        live_row.pack(fill="x", pady=(15, 0))
+        
+        ctk.CTkSwitch(
+            live_row,
+            text="Live quote",
+            variable=self.live_mode,
+            font=("Helvetica Neue", 13),
+            text_color="#1D1D1F",
+            progress_color="#007AFF",
+            command=self.schedule_live_quote
+        ).pack(side="left")
+        
+        self.live_status = ctk.CTkLabel(live_row, text="", font=("Helvetica Neue", 12), text_color="#FF3B30")
+        self.live_status.pack(side="left", padx=(15, 0))
+        
+        self.selected_cabin.trace_add("write", self.schedule_live_quote)
+        self.cabins_var.trace_add("write", self.schedule_live_quote)
+        for key in ACTIVITIES:
+            self.activity_vars[key].trace_add("write", self.schedule_live_quote)
+            self.activity_counts[key].trace_add("write", self.schedule_live_quote)
+        for entry in (self.start_date_entry, self.end_date_entry):
+            entry.bind("<KeyRelease>", self.schedule_live_quote, add="+")
+
+    def create_cabin_selector(self, parent):
+        section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
+        section.pack(fill="x", pady=(0, 20))
+        
+        ctk.CTkLabel(
+            section, 
+            text="Select Cabin Type", 
+            font=("Helvetica Neue", 18, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w", padx=20, pady=(20, 15))
+        
+        cabins_frame = ctk.CTkFrame(section, fg_color="transparent")
+        cabins_frame.pack(fill="x", padx=20, pady=(0, 20))
+        cabins_frame.grid_columnconfigure((0, 1, 2), weight=1)
+        
+        for i, (key, cabin) in enumerate(CABIN_TYPES.items()):
+            self.create_cabin_card(cabins_frame, key, cabin, i)
+
+    def create_cabin_card(self, parent, key, cabin, col):
+        def select():
+            self.selected_cabin.set(key)
+            self.update_cabin_selection()
+        
+        card = ctk.CTkFrame(
+            parent, 
+            fg_color="#F5F5F7" if self.selected_cabin.get() != key else "#E8F4FD",
+            corner_radius=12,
+            border_width=2,
+            border_color="#E5E5E5" if self.selected_cabin.get() != key else "#007AFF"
+        )
+        card.grid(row=0, column=col, sticky="nsew", padx=5, pady=5)
+        card.grid_columnconfigure(0, weight=1)
+        
+        # Make entire card clickable
+        card.bind("<Button-1>", lambda e: select())
+        
+        inner = ctk.CTkFrame(card, fg_color="transparent")
+        inner.pack(fill="both", expand=True, padx=15, pady=15)
+        inner.bind("<Button-1>", lambda e: select())
+        
+        # Icon
+        icon_label = ctk.CTkLabel(inner, text=cabin["icon"], font=("Helvetica Neue", 28))
+        icon_label.pack()
+        icon_label.bind("<Button-1>", lambda e: select())
+        
+        # Name
+        name_label = ctk.CTkLabel(
+            inner, 
+            text=cabin["name"], 
+            font=("Helvetica Neue", 14, "bold"),
+            text_color="#1D1D1F"
+        )
+        name_label.pack(pady=(8, 2))
+        name_label.bind("<Button-1>", lambda e: select())
+        
+        # Multiplier
+        mult_text = "Base Price" if cabin["multiplier"] == 1.0 else f"{cabin['multiplier']}x"
+        mult_label = ctk.CTkLabel(
+            inner, 
+            text=mult_text, 
+            font=("Helvetica Neue", 12),
+            text_color="#007AFF" if cabin["multiplier"] > 1 else "#86868b"
+        )
+        mult_label.pack()
+        mult_label.bind("<Button-1>", lambda e: select())
+        
+        # Store reference for updating
+        if not hasattr(self, 'cabin_cards'):
+            self.cabin_cards = {}
+        self.cabin_cards[key] = card
+
+    def update_cabin_selection(self):
+        for key, card in self.cabin_cards.items():
+            if key == self.selected_cabin.get():
+                card.configure(fg_color="#E8F4FD", border_color="#007AFF")
+            else:
+                card.configure(fg_color="#F5F5F7", border_color="#E5E5E5")
+        # The new cabin type may have fewer cabins than currently selected
+        if self.cabins_var.get() > self.max_cabins():
+            self.cabins_var.set(max(1, self.max_cabins()))
+
+    def create_date_inputs(self, parent):
+        section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
+        section.pack(fill="x", pady=(0, 20))
+        
+        ctk.CTkLabel(
+            section, 
+            text="Trip Dates", 
+            font=("Helvetica Neue", 18, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w", padx=20, pady=(20, 15))
+        
+        dates_frame = ctk.CTkFrame(section, fg_color="transparent")
+        dates_frame.pack(fill="x", padx=20, pady=(0, 20))
+        dates_frame.grid_columnconfigure((0, 1), weight=1)
+        
+        # Start Date
+        start_frame = ctk.CTkFrame(dates_frame, fg_color="transparent")
+        start_frame.grid(row=0, column=0, sticky="ew", padx=(0, 10))
+        
+        ctk.CTkLabel(start_frame, text="Check-in", font=("Helvetica Neue", 12), text_color="#86868b").pack(anchor="w")
+        self.start_date_entry = ctk.CTkEntry(
+            start_frame,
+            placeholder_text="YYYY-MM-DD",
+            height=45,
+            font=("Helvetica Neue", 14),
+            border_color="#E5E5E5",
+            fg_color="#F5F5F7"
+        )
+        self.start_date_entry.pack(fill="x", pady=(5, 0))
+        self.start_date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.start_date_entry.bind("<FocusOut>", lambda e: self.update_available_activities())
+        self.start_date_entry.bind("<Return>", lambda e: self.update_available_activities())
+        
+        # End Date
+        end_frame = ctk.CTkFrame(dates_frame, fg_color="transparent")
+        end_frame.grid(row=0, column=1, sticky="ew", padx=(10, 0))
+        
+        ctk.CTkLabel(end_frame, text="Check-out", font=("Helvetica Neue", 12), text_color="#86868b").pack(anchor="w")
+        self.end_date_entry = ctk.CTkEntry(
+            end_frame,
+            placeholder_text="YYYY-MM-DD",
+            height=45,
+            font=("Helvetica Neue", 14),
+            border_color="#E5E5E5",
+            fg_color="#F5F5F7"
+        )
+        self.end_date_entry.pack(fill="x", pady=(5, 0))
+        tomorrow = datetime.now() + timedelta(days=1)
+        self.end_date_entry.insert(0, tomorrow.strftime("%Y-%m-%d"))
+        self.end_date_entry.bind("<FocusOut>", lambda e: self.update_available_activities())
+        self.end_date_entry.bind("<Return>", lambda e: self.update_available_activities())
+        
+        # Update Activities Button
+        ctk.CTkButton(
+            section,
+            text="↻ Update Activities",
+            font=("Helvetica Neue", 12),
+            height=35,
+            corner_radius=8,
+            fg_color="#F5F5F7",
+            text_color="#007AFF",
+            hover_color="#E5E5E5",
+            command=self.update_available_activities
+        ).pack(padx=20, pady=(10, 20), anchor="e")
+
+    def create_cabin_count(self, parent):
+        section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
+        section.pack(fill="x", pady=(0, 20))
+        
+        inner = ctk.CTkFrame(section, fg_color="transparent")
+        inner.pack(fill="x", padx=20, pady=20)
+        
+        ctk.CTkLabel(
+            inner, 
+            text="Number of Cabins", 
+            font=("Helvetica Neue", 18, "bold"),
+            text_color="#1D1D1F"
+        ).pack(side="left")
+        
+        # Counter
+        counter_frame = ctk.CTkFrame(inner, fg_color="#F5F5F7", corner_radius=10)
+        counter_frame.pack(side="right")
+        
+        self.cabins_var = ctk.IntVar(value=1)
+        
+        ctk.CTkButton(
+            counter_frame, 
+            text="-", 
+            width=40, 
+            height=40,
+            fg_color="transparent", 
+            text_color="#1D1D1F",
+            hover_color="#E5E5E5",
+            command=self.decrement_cabins
+        ).pack(side="left", padx=5)
+        
+        ctk.CTkLabel(
+            counter_frame, 
+            textvariable=self.cabins_var, 
+            font=("Helvetica Neue", 18, "bold"),
+            width=40,
+            text_color="#1D1D1F"
+        ).pack(side="left")
+        
+        ctk.CTkButton(
+            counter_frame, 
+            text="+", 
+            width=40, 
+            height=40,
+            fg_color="transparent", 
+            text_color="#1D1D1F",
+            hover_color="#E5E5E5",
+            command=self.increment_cabins
+        ).pack(side="left", padx=5)
+
+    def create_activities_section(self, parent):
+        self.activities_section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
+        self.activities_section.pack(fill="x", pady=(0, 20))
+        
+        header = ctk.CTkFrame(self.activities_section, fg_color="transparent")
+        header.pack(fill="x", padx=20, pady=(20, 15))
+        
+        ctk.CTkLabel(
+            header, 
+            text="Activities", 
+            font=("Helvetica Neue", 18, "bold"),
+            text_color="#1D1D1F"
+        ).pack(side="left")
+        
+        ctk.CTkLabel(
+            header, 
+            text="Optional add-ons", 
+            font=("Helvetica Neue", 12),
+            text_color="#86868b"
+        ).pack(side="right")
+        
+        self.activities_container = ctk.CTkFrame(self.activities_section, fg_color="transparent")
+        self.activities_container.pack(fill="x", padx=20, pady=(0, 20))
+        
+        # Cards are built once, for every activity; date changes only
+        # re-style and re-order them
+        self.available_header = ctk.CTkLabel(
+            self.activities_container,
+            text="Available for your dates",
+            font=("Helvetica Neue", 12, "bold"),
+            text_color="#34C759"
+        )
+        self.unavailable_header = ctk.CTkLabel(
+            self.activities_container,
+            text="Not available for selected dates",
+            font=("Helvetica Neue", 12, "bold"),
+            text_color="#86868b"
+        )
+        self.activity_cards = {}
+        for key, activity in ACTIVITIES.items():
+            self.create_activity_card(key, activity)
+        
+        # Initial load
+        self.update_available_activities()
+
+    def update_available_activities(self):
+        # Get seasons for date range
+        try:
+            start = datetime.strptime(self.start_date_entry.get().strip(), "%Y-%m-%d")
+            end = datetime.strptime(self.end_date_entry.get().strip(), "%Y-%m-%d")
+            if end > start:
+                season_mask = season_mask_in_range(start, end)
+            else:
+                season_mask = SEASON_BITS[get_season(datetime.now())]
+        except:
+            season_mask = SEASON_BITS[get_season(datetime.now())]
+        self.current_seasons = seasons_from_mask(season_mask)
+        
+        # Show ALL activities, but mark unavailable ones
+        available = available_activities(season_mask)
+        if available == self.available_activities and self.activity_cards_placed:
+            return
+        
+        previous = set(self.available_activities)
+        self.available_activities = available
+        self.unavailable_activities = [key for key in ACTIVITIES if key not in available]
+        
+        # Restyle only the cards whose availability changed
+        for key in ACTIVITIES:
+            is_available = key in available
+            if not self.activity_cards_placed or is_available != (key in previous):
+                self.set_activity_available(key, is_available)
+        
+        # Re-order: available cards first, then the greyed out ones
+        for widget in self.activities_container.winfo_children():
+            widget.pack_forget()
+        if self.available_activities:
+            self.available_header.pack(anchor="w", pady=(0, 5))
+            for key in self.available_activities:
+                self.activity_cards[key]["card"].pack(fill="x", pady=5)
+        if self.unavailable_activities:
+            self.unavailable_header.pack(anchor="w", pady=(15, 5) if self.available_activities else (0, 5))
+            for key in self.unavailable_activities:
+                self.activity_cards[key]["card"].pack(fill="x", pady=5)
+        self.activity_cards_placed = True
+
+    def create_activity_card(self, key, activity):
+        card = ctk.CTkFrame(self.activities_container, fg_color="#F5F5F7", corner_radius=10)
+        
+        inner = ctk.CTkFrame(card, fg_color="transparent")
+        inner.pack(fill="x", padx=15, pady=12)
+        
+        # Left side - checkbox and info
+        left = ctk.CTkFrame(inner, fg_color="transparent")
+        left.pack(side="left", fill="x", expand=True)
+        
+        self.activity_vars[key] = ctk.BooleanVar(value=False)
+        
+        checkbox = ctk.CTkCheckBox(
+            left,
+            text=f"{activity['icon']} {activity['name']}",
+            variable=self.activity_vars[key],
+            font=("Helvetica Neue", 14),
+            text_color="#1D1D1F",
+            text_color_disabled="#AAAAAA",
+            fg_color="#007AFF",
+            hover_color="#0062CC"
+        )
+        checkbox.pack(side="left")
+        
+        # Price and season info
+        price_label = ctk.CTkLabel(
+            left,
+            text=f"${activity['price']}/person",
+            font=("Helvetica Neue", 12),
+            text_color="#86868b"
+        )
+        price_label.pack(side="left", padx=(15, 0))
+        
+        # Right side - participant count (only shown for available activities)
+        right = ctk.CTkFrame(inner, fg_color="transparent")
+        right.pack(side="right")
+        
+        self.activity_counts[key] = ctk.IntVar(value=2)
+        
+        ctk.CTkLabel(right, text="Guests:", font=("Helvetica Neue", 12), text_color="#86868b").pack(side="left", padx=(0, 10))
+        
+        count_frame = ctk.CTkFrame(right, fg_color="#FFFFFF", corner_radius=8)
+        count_frame.pack(side="left")
+        
+        ctk.CTkButton(
+            count_frame, text="-", width=30, height=30,
+            fg_color="transparent", text_color="#1D1D1F", hover_color="#E5E5E5",
+            command=lambda k=key: self.decrement_activity(k)
+        ).pack(side="left")
+        
+        ctk.CTkLabel(
+            count_frame, 
+            textvariable=self.activity_counts[key],
+            font=("Helvetica Neue", 14, "bold"),
+            width=30
+        ).pack(side="left")
+        
+        ctk.CTkButton(
+            count_frame, text="+", width=30, height=30,
+            fg_color="transparent", text_color="#1D1D1F", hover_color="#E5E5E5",
+            command=lambda k=key: self.increment_activity(k)
+        ).pack(side="left")
+        
+        self.activity_cards[key] = {"card": card, "checkbox": checkbox, "price_label": price_label, "counter": right}
+
+    def set_activity_available(self, key, available):
+        """Switch an activity card between its available and greyed out look"""
+        activity = ACTIVITIES[key]
+        widgets = self.activity_cards[key]
+        
+        price_text = f"${activity['price']}/person"
+        if not available:
+            season_names = [s.capitalize() for s in activity['seasons']]
+            price_text += f" • {', '.join(season_names)} only"
+            # An activity that can't be booked can't stay selected
+            self.activity_vars[key].set(False)
+        
+        widgets["card"].configure(fg_color="#F5F5F7" if available else "#FAFAFA")
+        widgets["checkbox"].configure(state="normal" if available else "disabled")
+        widgets["price_label"].configure(text=price_text, text_color="#86868b" if available else "#BBBBBB")
+        if available:
+            widgets["counter"].pack(side="right")
+        else:
+            widgets["counter"].pack_forget()
+
+    def increment_activity(self, key):
+        if self.activity_counts[key].get() < 20:
+            self.activity_counts[key].set(self.activity_counts[key].get() + 1)
+
+    def decrement_activity(self, key):
+        if self.activity_counts[key].get() > 1:
+            self.activity_counts[key].set(self.activity_counts[key].get() - 1)
+
+    def create_results_placeholder(self):
+        self.results_placeholder = ctk.CTkFrame(self.results_card, fg_color="transparent")
+        self.results_placeholder.pack(fill="both", expand=True, padx=30, pady=30)
+        self.results_panel = None
+        
+        ctk.CTkLabel(
+            self.results_placeholder, 
+            text="📋", 
+            font=("Helvetica Neue", 48)
+        ).pack(pady=(80, 10))
+        
+        ctk.CTkLabel(
+            self.results_placeholder, 
+            text="Your Quote", 
+            font=("Helvetica Neue", 24, "bold"),
+            text_color="#1D1D1F"
+        ).pack()
+        
+        ctk.CTkLabel(
+            self.results_placeholder, 
+            text="Fill in your trip details and\nclick 'Get Quote' to see pricing.", 
+            font=("Helvetica Neue", 14),
+            text_color="#86868b",
+            justify="center"
+        ).pack(pady=(10, 0))
+
+    def create_results_panel(self):
+        """Build the quote summary once; show_results only updates it"""
+        content = ctk.CTkScrollableFrame(self.results_card, fg_color="transparent")
+        self.results_panel = content
+        self.quote = None
+        
+        # Header
+        ctk.CTkLabel(
+            content, 
+            text="Quote Summary", 
+            font=("Helvetica Neue", 22, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w", pady=(0, 20))
+        
+        # Grand Total
+        total_frame = ctk.CTkFrame(content, fg_color="#007AFF", corner_radius=12)
+        total_frame.pack(fill="x", pady=(0, 20))
+        
+        ctk.CTkLabel(
+            total_frame, 
+            text="Grand Total", 
+            font=("Helvetica Neue", 14),
+            text_color="#FFFFFF"
+        ).pack(pady=(15, 0))
+        
+        self.grand_total_label = ctk.CTkLabel(
+            total_frame, 
+            text="", 
+            font=("Helvetica Neue", 36, "bold"),
+            text_color="#FFFFFF"
+        )
+        self.grand_total_label.pack()
+        
+        self.quote_summary_label = ctk.CTkLabel(
+            total_frame, 
+            text="", 
+            font=("Helvetica Neue", 12),
+            text_color="#FFFFFF"
+        )
+        self.quote_summary_label.pack(pady=(5, 15))
+        
+        # Room Cost Section
+        self.room_total_label = self.create_section_header(content, "🏠 Accommodation", "")
+        
+        room_details = ctk.CTkFrame(content, fg_color="#F5F5F7", corner_radius=10)
+        room_details.pack(fill="x", pady=(5, 15))
+        
+        # Only the visible nights get widgets, however long the stay
+        self.nights_list = VirtualList(
+            room_details,
+            create_row=self.create_night_row,
+            fill_row=self.fill_night_row,
+            row_height=40,
+            visible_rows=12
+        )
+        self.nights_list.pack(fill="x", pady=4)
+        
+        # Cabin multiplier note (shown for premium cabins)
+        self.multiplier_note = ctk.CTkLabel(
+            room_details,
+            text="",
+            font=("Helvetica Neue", 11),
+            text_color="#86868b"
+        )
+        
+        # Activities Section (shown when activities are selected); one row
+        # per activity, built once and hidden when not in the quote
+        self.activities_summary = ctk.CTkFrame(content, fg_color="transparent")
+        self.activities_total_label = self.create_section_header(self.activities_summary, "🎯 Activities", "")
+        
+        activities_details = ctk.CTkFrame(self.activities_summary, fg_color="#F5F5F7", corner_radius=10)
+        activities_details.pack(fill="x", pady=(5, 15))
+        
+        self.activity_summary_rows = {}
+        for key in ACTIVITIES:
+            row = ctk.CTkFrame(activities_details, fg_color="transparent")
+            
+            row.name_label = ctk.CTkLabel(row, text="", font=("Helvetica Neue", 13), text_color="#1D1D1F")
+            row.name_label.pack(side="left")
+            
+            row.total_label = ctk.CTkLabel(row, text="", font=("Helvetica Neue", 13, "bold"), text_color="#1D1D1F")
+            row.total_label.pack(side="right")
+            self.activity_summary_rows[key] = row
+
+    def show_results(self, data):
+        if self.results_panel is None:
+            self.create_results_panel()
+            self.results_placeholder.pack_forget()
+            self.results_panel.pack(fill="both", expand=True, padx=25, pady=25)
+        
+        previous = self.quote
+        self.quote = data
+        
+        set_text(self.grand_total_label, f"${data['grand_total']:,.2f}")
+        summary_text = f"{data['nights']} Night{'s' if data['nights'] != 1 else ''} • {data['cabin_count']} {data['cabin_name']}"
+        set_text(self.quote_summary_label, summary_text)
+        
+        # Room Cost Section
+        set_text(self.room_total_label, f"${data['room_total']:,.2f}")
+        if (previous is None or data['nightly_data'] is not previous['nightly_data']
+                or data['cabin_multiplier'] != previous['cabin_multiplier'] or data['cabin_count'] != previous['cabin_count']):
+            same_stay = previous is not None and previous['check_in'] == data['check_in']
+            self.nights_list.set_items(data['nightly_data'], keep_position=same_stay)
+        
+        # Cabin multiplier note
+        if data['cabin_multiplier'] > 1:
+            set_text(self.multiplier_note, f"Includes {data['cabin_multiplier']}x {data['cabin_name']} rate")
+            if not self.multiplier_note.winfo_manager():
+                self.multiplier_note.pack(pady=(0, 10))
+        else:
+            self.multiplier_note.pack_forget()
+        
+        # Activities Section
+        if data['activities_total'] > 0:
+            set_text(self.activities_total_label, f"${data['activities_total']:,.2f}")
+            if not self.activities_summary.winfo_manager():
+                self.activities_summary.pack(fill="x")
+        else:
+            self.activities_summary.pack_forget()
+        
+        shown = {activity['key']: activity for activity in data['selected_activities']}
+        was_shown = {activity['key'] for activity in previous['selected_activities']} if previous else set()
+        if shown.keys() != was_shown:
+            # Re-pack in ACTIVITIES order so rows keep a stable order
+            for row in self.activity_summary_rows.values():
+                row.pack_forget()
+            for key, row in self.activity_summary_rows.items():
+                if key in shown:
+                    row.pack(fill="x", padx=15, pady=8)
+        for key, activity in shown.items():
+            row = self.activity_summary_rows[key]
+            set_text(row.name_label, f"{activity['icon']} {activity['name']} × {activity['count']}")
+            set_text(row.total_label, f"${activity['total']:,.2f}")
+
+    def create_night_row(self, parent):
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        
+        row.date_label = ctk.CTkLabel(row, text="", font=("Helvetica Neue", 13), text_color="#1D1D1F")
+        row.date_label.pack(side="left", padx=15)
+        
+        row.price_label = ctk.CTkLabel(row, text="", font=("Helvetica Neue", 13, "bold"), text_color="#1D1D1F")
+        row.price_label.pack(side="right", padx=15)
+        return row
+
+    def fill_night_row(self, row, night):
+        data = self.quote
+        date_text = night['date'].strftime("%a, %b %d")
+        tags = []
+        if night['is_holiday']: tags.append("🎄")
+        elif night['is_weekend']: tags.append("📅")
+        
+        price_text = f"${night['price'] * data['cabin_multiplier']:,.2f}"
+        if data['cabin_count'] > 1:
+            price_text += f" × {data['cabin_count']}"
+        
+        set_text(row.date_label, f"{date_text} {' '.join(tags)}")
+        set_text(row.price_label, price_text)
+
+    def create_section_header(self, parent, title, amount):
+        """Section title with an amount on the right; returns the amount label"""
+        header = ctk.CTkFrame(parent, fg_color="transparent")
+        header.pack(fill="x")
+        
+        ctk.CTkLabel(
+            header,
+            text=title,
+            font=("Helvetica Neue", 16, "bold"),
+            text_color="#1D1D1F"
+        ).pack(side="left")
+        
+        amount_label = ctk.CTkLabel(
+            header,
+            text=amount,
+            font=("Helvetica Neue", 16, "bold"),
+            text_color="#007AFF"
+        )
+        amount_label.pack(side="right")
+        return amount_label
+
+    # --- Pricing Logic ---
+
+    def max_cabins(self):
+        """At most 10 cabins, and never more than the selected type has"""
+        return min(10, self.engine.tables.cabins[self.selected_cabin.get()]["count"])
+
+    def increment_cabins(self):
+        if self.cabins_var.get() < self.max_cabins():
+            self.cabins_var.set(self.cabins_var.get() + 1)
+
+    def decrement_cabins(self):
+        if self.cabins_var.get() > 1:
+            self.cabins_var.set(self.cabins_var.get() - 1)
+
+    def selected_activity_counts(self):
+        """Guest counts of the selected, available activities"""
+        activities = {}
+        for key in self.available_activities:
+            if key in self.activity_vars and self.activity_vars[key].get():
+                activities[key] = self.activity_counts[key].get()
+        return activities
+
+    def calculate_quote(self):
+        try:
+            start_str = self.start_date_entry.get().strip()
+            end_str = self.end_date_entry.get().strip()
+            
+            if not start_str or not end_str:
+                messagebox.showwarning("Missing Info", "Please enter both check-in and check-out dates.")
+                return
+                
+            start_date = datetime.strptime(start_str, "%Y-%m-%d")
+            end_date = datetime.strptime(end_str, "%Y-%m-%d")
+            
+            if start_date.date() < datetime.now().date():
+                messagebox.showerror("Invalid Date", "Check-in date cannot be in the past.")
+                return
+                
+            if end_date <= start_date:
+                messagebox.showerror("Invalid Date", "Check-out date must be after check-in date.")
+                return
+            
+            # Build the request from the current selections; the engine
+            # refuses it if the ledger has too few cabins free
+            try:
+                quote = self.engine.quote({
+                    'cabin_type': self.selected_cabin.get(),
+                    'check_in': start_date,
+                    'check_out': end_date,
+                    'cabin_count': self.cabins_var.get(),
+                    'activities': self.selected_activity_counts()
+                })
+            except UnavailableError as e:
+                messagebox.showerror("Not Available", str(e))
+                return
+            except ValueError as e:
+                messagebox.showerror("Invalid Quote", str(e))
+                return
+            
+            # Show results
+            self.show_results(quote)
+            
+        except ValueError:
+            messagebox.showerror("Format Error", "Please use YYYY-MM-DD format for dates.")
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+
+    # --- Live Quote ---
+
+    def schedule_live_quote(self, *args):
+        """Re-quote LIVE_QUOTE_DELAY_MS after the last input change (live mode only)"""
+        if self._live_after is not None:
+            self.after_cancel(self._live_after)
+            self._live_after = None
+        if self.live_mode.get():
+            self._live_after = self.after(LIVE_QUOTE_DELAY_MS, self.live_quote)
+        else:
+            set_text(self.live_status, "")
+
+    def live_quote(self):
+        self._live_after = None
+        self.update_available_activities()
+        
+        try:
+            start_date = datetime.strptime(self.start_date_entry.get().strip(), "%Y-%m-%d")
+            end_date = datetime.strptime(self.end_date_entry.get().strip(), "%Y-%m-%d")
+        except ValueError:
+            set_text(self.live_status, "Please use YYYY-MM-DD format for dates.")
+            return
+        
+        # Only the part of the quote affected by the edit is re-priced
+        try:
+            quote = self.live.update({
+                'cabin_type': self.selected_cabin.get(),
+                'check_in': start_date,
+                'check_out': end_date,
+                'cabin_count': self.cabins_var.get(),
+                'activities': self.selected_activity_counts()
+            })
+        except ValueError as e:
+            set_text(self.live_status, str(e))
+            return
+        
+        set_text(self.live_status, "")
+        self.show_results(quote)
+
+
+# Instrumentation points (see instrumentation.py); timed only while enabled
+instrument(ModernPricingApp, "show_results", "ui.quote_results")
+instrument(ModernPricingApp, "update_available_activities", "ui.activities")
+instrument(ModernPricingApp, "live_quote", "ui.live_quote")
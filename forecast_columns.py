@@ -0,0 +1,161 @@
+"""
+Columnar Forecast Results
+
+Daily forecast records stored as parallel typed arrays instead of one dict
+per day: date ordinal, cabin revenue, activity revenue, and days x cabin
+types matrices of expected occupied cabins and cabin revenue. Aggregations run on whole arrays,
+slicing by date range returns views (no copying), and DayRows gives existing
+consumers a lightweight row view that reads like the old per-day dicts.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+import numpy as np
+
+_UNIX_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+
+class ForecastColumns:
+    """Parallel per-day arrays for a contiguous date range"""
+
+    __slots__ = ("cabin_types", "ordinals", "cabin_revenue", "activity_revenue", "occupancy", "cabin_revenues")
+
+    def __init__(self, cabin_types, ordinals, cabin_revenue, activity_revenue, occupancy, cabin_revenues):
+        self.cabin_types = tuple(cabin_types)
+        self.ordinals = ordinals
+        self.cabin_revenue = cabin_revenue
+        self.activity_revenue = activity_revenue
+        self.occupancy = occupancy
+        self.cabin_revenues = cabin_revenues   # days x cabin types, like occupancy
+
+    @classmethod
+    def allocate(cls, start_date, num_days, cabin_types):
+        """Zeroed columns for num_days days starting at start_date, to be filled in"""
+        start = start_date.toordinal()
+        return cls(
+            cabin_types,
+            np.arange(start, start + num_days, dtype=np.int32),
+            np.zeros(num_days),
+            np.zeros(num_days),
+            np.zeros((num_days, len(cabin_types))),
+            np.zeros((num_days, len(cabin_types)))
+        )
+
+    def set_day(self, index, daily):
+        """Store one predict_daily_revenue record at row index"""
+        self.cabin_revenue[index] = daily["cabin_revenue"]
+        self.activity_revenue[index] = daily["activity_revenue"]
+        occupied = daily["cabins_occupied"]
+        revenues = daily["cabin_revenues"]
+        for column, cabin_type in enumerate(self.cabin_types):
+            self.occupancy[index, column] = occupied[cabin_type]
+            self.cabin_revenues[index, column] = revenues[cabin_type]
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    @property
+    def total_revenue(self):
+        return self.cabin_revenue + self.activity_revenue
+
+    @property
+    def total_occupied(self):
+        return self.occupancy.sum(axis=1)
+
+    @property
+    def rows(self):
+        return DayRows(self)
+
+    def slice_dates(self, start_date, end_date):
+        """Days in [start_date, end_date) as views onto the same arrays"""
+        if not len(self):
+            return self
+        first = int(self.ordinals[0])
+        lo = min(max(start_date.toordinal() - first, 0), len(self))
+        hi = min(max(end_date.toordinal() - first, lo), len(self))
+        return ForecastColumns(
+            self.cabin_types,
+            self.ordinals[lo:hi],
+            self.cabin_revenue[lo:hi],
+            self.activity_revenue[lo:hi],
+            self.occupancy[lo:hi],
+            self.cabin_revenues[lo:hi]
+        )
+
+    def monthly_totals(self):
+        """[(year, month, total revenue, days)] in date order"""
+        if not len(self):
+            return []
+        months = (self.ordinals - _UNIX_EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]")
+        keys, index = np.unique(months, return_inverse=True)
+        revenue = np.bincount(index, weights=self.total_revenue, minlength=len(keys))
+        days = np.bincount(index, minlength=len(keys))
+        result = []
+        for key, month_revenue, month_days in zip(keys.astype(object), revenue, days):
+            result.append((key.year, key.month, float(month_revenue), int(month_days)))
+        return result
+
+
+class DayRows(Sequence):
+    """Read-only sequence of DayRow views over ForecastColumns"""
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("day index out of range")
+        return DayRow(self.columns, index)
+
+
+class DayRow:
+    """One day of a ForecastColumns, readable like a predict_daily_revenue dict"""
+
+    __slots__ = ("columns", "index")
+
+    FIELDS = ("date", "cabin_revenue", "activity_revenue", "total_revenue", "cabins_occupied", "cabin_revenues",
+              "total_cabins_occupied")
+
+    def __init__(self, columns, index):
+        self.columns = columns
+        self.index = index
+
+    def __getitem__(self, key):
+        columns, i = self.columns, self.index
+        if key == "date":
+            return datetime.fromordinal(int(columns.ordinals[i]))
+        if key == "cabin_revenue":
+            return float(columns.cabin_revenue[i])
+        if key == "activity_revenue":
+            return float(columns.activity_revenue[i])
+        if key == "total_revenue":
+            return float(columns.cabin_revenue[i] + columns.activity_revenue[i])
+        if key == "cabins_occupied":
+            return dict(zip(columns.cabin_types, columns.occupancy[i].tolist()))
+        if key == "cabin_revenues":
+            return dict(zip(columns.cabin_types, columns.cabin_revenues[i].tolist()))
+        if key == "total_cabins_occupied":
+            return float(columns.occupancy[i].sum())
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.FIELDS
+
+    def to_dict(self):
+        return {key: self[key] for key in self.FIELDS}
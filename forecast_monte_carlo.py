@@ -0,0 +1,180 @@
+"""
+Monte Carlo Revenue Simulation
+
+The expected-value forecast multiplies fractional occupancy by price. This
+module simulates occupancy instead: every cabin type on every night is drawn
+as a binomial over its inventory count, for many trials, and the resulting
+revenue distribution is summarised as per-day and per-period quantiles
+(P10/P50/P90 by default). Batches are reduced as they finish to per-day
+histograms and per-trial period sums, so memory does not grow with the
+number of trials.
+
+Trials are split into fixed-size batches, each with its own child seed of
+the run's SeedSequence, so a given seed produces identical results no matter
+how many worker processes the batches are spread over.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from forecast_vectorized import activity_rate_by_season, calendar_arrays, predict_period_revenue_vectorized
+import predicted_revenue as model
+
+DEFAULT_QUANTILES = (0.1, 0.5, 0.9)
+
+# Daily revenue quantiles come from a histogram per day with this many bins
+DAILY_REVENUE_BINS = 1024
+
+def quantile_label(q):
+    """Label a quantile the way finance reports it (0.1 -> "p10")"""
+    return f"p{q * 100:g}"
+
+def _simulate_batch(args):
+    """Simulate one batch of trials and reduce it before returning.
+
+    Day-level draws never leave the batch: each day's total revenue and
+    occupied cabins are counted into per-day histograms, and each trial is
+    reduced to its period sums, so what a batch sends back does not grow
+    with the number of trials.
+    """
+    seed_seq, size, counts, occupancy, prices, activity_rate, revenue_scale = args
+    rng = np.random.default_rng(seed_seq)
+    num_days = len(activity_rate)
+
+    cabin_revenue = np.zeros((size, num_days))
+    occupied = np.zeros((size, num_days))
+    for count, rate, price in zip(counts, occupancy, prices):
+        draws = rng.binomial(count, rate, size=(size, num_days))
+        cabin_revenue += draws * price
+        occupied += draws
+
+    activity_revenue = occupied * 2 * activity_rate
+    total_revenue = cabin_revenue + activity_revenue
+
+    # Histogram cells are numbered day * bins + bin
+    day_offsets = np.arange(num_days) * DAILY_REVENUE_BINS
+    revenue_bins = np.minimum((total_revenue * revenue_scale).astype(np.int64), DAILY_REVENUE_BINS - 1)
+    cells = (revenue_bins + day_offsets).ravel()
+    revenue_counts = np.bincount(cells, minlength=num_days * DAILY_REVENUE_BINS)
+    revenue_sums = np.bincount(cells, weights=total_revenue.ravel(), minlength=num_days * DAILY_REVENUE_BINS)
+    occupancy_levels = sum(counts) + 1
+    cells = (occupied.astype(np.int64) + np.arange(num_days) * occupancy_levels).ravel()
+    occupied_counts = np.bincount(cells, minlength=num_days * occupancy_levels)
+
+    return (revenue_counts.reshape(num_days, DAILY_REVENUE_BINS), revenue_sums.reshape(num_days, DAILY_REVENUE_BINS),
+            occupied_counts.reshape(num_days, occupancy_levels),
+            cabin_revenue.sum(axis=1), activity_revenue.sum(axis=1), occupied.sum(axis=1))
+
+def _histogram_quantiles(counts, values, quantiles, n):
+    """np.quantile (linear interpolation) per row of n samples given as a histogram
+
+    counts[day, j] samples of the row take the value values[day, j]; values
+    must increase along each row wherever counts is non-zero.
+    """
+    cumulative = counts.cumsum(axis=1)
+
+    def at_rank(rank):
+        index = (cumulative > rank).argmax(axis=1)
+        return np.take_along_axis(values, index[:, None], axis=1)[:, 0]
+
+    bands = []
+    for q in quantiles:
+        position = (n - 1) * q
+        low = int(position)
+        below, above = at_rank(low), at_rank(min(low + 1, n - 1))
+        bands.append(below + (position - low) * (above - below))
+    return np.array(bands, dtype=float)
+
+def simulate_period_revenue(start_date, end_date, trials=10000, seed=0, workers=None, batch_size=1000,
+                            quantiles=DEFAULT_QUANTILES, inventory=None):
+    """Simulate revenue for a date range and return quantile bands.
+
+    workers > 1 spreads the batches over a process pool; the result only
+    depends on seed, trials and batch_size. Memory grows with the number
+    of days but not with trials.
+    """
+    if trials < 1 or batch_size < 1:
+        raise ValueError("trials and batch_size must be at least 1")
+
+    inventory = inventory or model.CABIN_INVENTORY
+    root = np.random.SeedSequence(seed)
+
+    # Prices and occupancy probabilities are shared by every trial
+    expected = predict_period_revenue_vectorized(start_date, end_date, inventory=inventory)
+    arrays = expected["arrays"]
+    days = calendar_arrays(start_date, end_date)
+    activity_rate = activity_rate_by_season()[days["season"]]
+    counts = [info["count"] for info in inventory.values()]
+    occupancy = [arrays["occupancy"][k] for k in inventory]
+    prices = [arrays["prices"][k] for k in inventory]
+
+    # Each day's revenue histogram spans 0 to that day's revenue with every cabin booked
+    max_revenue = sum(count * (price + 2 * activity_rate) for count, price in zip(counts, prices))
+    max_revenue = np.broadcast_to(np.asarray(max_revenue, dtype=float), activity_rate.shape)
+    revenue_scale = np.divide(DAILY_REVENUE_BINS, max_revenue, out=np.zeros_like(max_revenue), where=max_revenue > 0)
+
+    sizes = [batch_size] * (trials // batch_size)
+    if trials % batch_size:
+        sizes.append(trials % batch_size)
+    batch_seqs = root.spawn(len(sizes))
+    tasks = [(seq, size, counts, occupancy, prices, activity_rate, revenue_scale)
+             for seq, size in zip(batch_seqs, sizes)]
+
+    # Batches are merged in order as they arrive; only their reductions are kept
+    revenue_counts = revenue_sums = occupied_counts = None
+    period_cabin, period_activity, period_occupied = [], [], []
+    pool = ProcessPoolExecutor(max_workers=workers) if workers and workers > 1 and len(tasks) > 1 else None
+    try:
+        for batch in (pool.map(_simulate_batch, tasks) if pool else map(_simulate_batch, tasks)):
+            if revenue_counts is None:
+                revenue_counts, revenue_sums, occupied_counts = batch[0], batch[1], batch[2]
+            else:
+                revenue_counts += batch[0]
+                revenue_sums += batch[1]
+                occupied_counts += batch[2]
+            period_cabin.append(batch[3])
+            period_activity.append(batch[4])
+            period_occupied.append(batch[5])
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    period_cabin = np.concatenate(period_cabin)
+    period_activity = np.concatenate(period_activity)
+    period_total = period_cabin + period_activity
+
+    q = np.asarray(quantiles)
+    labels = [quantile_label(x) for x in quantiles]
+    total_capacity = sum(counts) * max(len(activity_rate), 1)
+
+    def period_bands(per_trial):
+        return dict(zip(labels, np.quantile(per_trial, q).tolist()))
+
+    # A revenue bin's value is the mean of the revenues counted in it, which
+    # is exact whenever a bin only ever saw one revenue (the usual case)
+    revenue_values = np.divide(revenue_sums, revenue_counts, out=np.zeros_like(revenue_sums),
+                               where=revenue_counts > 0)
+    occupied_values = np.broadcast_to(np.arange(occupied_counts.shape[1]), occupied_counts.shape)
+    daily_total = _histogram_quantiles(revenue_counts, revenue_values, quantiles, trials)
+    daily_occupied = _histogram_quantiles(occupied_counts, occupied_values, quantiles, trials)
+
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "trials": trials,
+        "seed": seed,
+        "quantiles": labels,
+        "expected_total_revenue": expected["total_revenue"],
+        "mean_total_revenue": float(period_total.mean()),
+        "period": {
+            "total_revenue": period_bands(period_total),
+            "cabin_revenue": period_bands(period_cabin),
+            "activity_revenue": period_bands(period_activity),
+            "avg_occupancy": period_bands(np.concatenate(period_occupied) / total_capacity)
+        },
+        "daily": {
+            "ordinals": days["ordinals"],
+            "total_revenue": dict(zip(labels, daily_total)),
+            "cabins_occupied": dict(zip(labels, daily_occupied))
+        }
+    }
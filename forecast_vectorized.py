@@ -0,0 +1,171 @@
+"""
+Vectorized Revenue Forecast
+
+Array version of predict_period_revenue: instead of walking the date range
+one day at a time, prices, occupancy, cabin revenue and activity revenue are
+computed as NumPy arrays over the whole range, one array per cabin type.
+
+Both paths draw the same deterministic noise (see noise.py), so totals
+match the scalar path in predicted_revenue.py up to floating-point rounding.
+"""
+
+import numpy as np
+
+from calendar_factors import CALENDAR, SEASONS, HOLIDAY_MAJOR, HOLIDAY_SEASON
+from forecast_columns import ForecastColumns
+from noise import noise_uniform_array
+import predicted_revenue as model
+
+def calendar_arrays(start_date, end_date, calendar=None):
+    """Slice the per-year calendar tables into arrays covering [start_date, end_date)"""
+    calendar = calendar or CALENDAR
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
+
+    seasonality, weekend, holiday_kind, holiday_boost, season = [], [], [], [], []
+    ordinal = start_ordinal
+    while ordinal < end_ordinal:
+        year = calendar.year(start_date.fromordinal(ordinal).year)
+        lo = ordinal - year.start_ordinal
+        hi = min(end_ordinal - year.start_ordinal, year.days)
+        seasonality.append(np.frombuffer(year.seasonality, dtype=np.float64)[lo:hi])
+        weekend.append(np.frombuffer(year.weekend, dtype=np.int8)[lo:hi])
+        holiday_kind.append(np.frombuffer(year.holiday_kind, dtype=np.int8)[lo:hi])
+        holiday_boost.append(np.frombuffer(year.holiday_boost, dtype=np.float64)[lo:hi])
+        season.append(np.frombuffer(year.season, dtype=np.int8)[lo:hi])
+        ordinal = year.start_ordinal + hi
+
+    def join(parts, dtype):
+        return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+    return {
+        "ordinals": np.arange(start_ordinal, max(end_ordinal, start_ordinal), dtype=np.int64),
+        "seasonality": join(seasonality, np.float64),
+        "weekend": join(weekend, np.int8).astype(bool),
+        "holiday_kind": join(holiday_kind, np.int8),
+        "holiday_boost": join(holiday_boost, np.float64),
+        "season": join(season, np.int8)
+    }
+
+def base_price_array(seasonality, noise, weights=None, base_price=None):
+    """Vectorized calculate_base_price for given seasonality and noise arrays"""
+    weights = weights or model.WEIGHTS
+    alpha = model.BASE_PRICE if base_price is None else base_price
+    beta = weights['seasonality']
+    zeta = weights['noise']
+
+    prices = alpha + beta * (seasonality - 1) * alpha + zeta * noise * alpha
+    return np.maximum(prices, alpha * 0.5)
+
+def holiday_modifier_array(days, holiday_boost=None):
+    """Occupancy holiday/weekend modifier for every day in a calendar slice"""
+    holiday_boost = holiday_boost or model.HOLIDAY_OCCUPANCY_BOOST
+    # Holiday rules with their own boost override their kind's
+    return np.select(
+        [days["holiday_boost"] > 0, days["holiday_kind"] == HOLIDAY_MAJOR, days["holiday_kind"] == HOLIDAY_SEASON,
+         days["weekend"]],
+        [days["holiday_boost"], holiday_boost["major"], holiday_boost["season"], holiday_boost["weekend"]],
+        default=1.0
+    )
+
+def activity_rate_by_season(activities=None):
+    """Expected activity revenue per guest for each entry in SEASONS"""
+    activities = model.ACTIVITIES if activities is None else activities
+    rates = np.zeros(len(SEASONS))
+    for i, season in enumerate(SEASONS):
+        for activity in activities.values():
+            if season in activity["seasons"]:
+                rates[i] += activity["participation_rate"] * activity["price"]
+    return rates
+
+def predict_period_revenue_vectorized(start_date, end_date, inventory=None, seasonal_occupancy=None,
+                                      holiday_boost=None, activities=None, calendar=None, days=None,
+                                      weights=None, tables=None):
+    """Predict revenue for a date range using whole-range arrays.
+
+    Returns the same fields as predict_period_revenue (including the
+    columnar "columns"/"days") plus an "arrays" dict holding the per-day
+    series per cabin type.
+    The inventory, occupancy, activity, weight and calendar tables default
+    to those of tables (a pricing_config.PricingTables; by default the
+    process-wide tables behind predicted_revenue.py's constants). days is
+    an already computed calendar_arrays slice of the range, for callers
+    forecasting many inventories over the same dates.
+    """
+    tables = tables or model.DEFAULT_TABLES
+    inventory = inventory or tables.cabins
+    seasonal_occupancy = seasonal_occupancy or tables.seasonal_occupancy
+    holiday_boost = holiday_boost or tables.holiday_boost
+    activities = tables.activities if activities is None else activities
+    weights = weights or tables.weights
+    calendar = calendar or tables.calendar
+
+    if days is None:
+        days = calendar_arrays(start_date, end_date, calendar)
+    num_days = len(days["ordinals"])
+
+    seasonal_mod = np.array([seasonal_occupancy[s] for s in SEASONS])[days["season"]]
+    demand_mod = seasonal_mod * holiday_modifier_array(days, holiday_boost)
+
+    prices, occupancy, occupied, revenue = {}, {}, {}, {}
+    cabin_revenue = np.zeros(num_days)
+    total_occupied = np.zeros(num_days)
+    cabin_breakdown = {}
+    total_possible_nights = 0
+
+    for cabin_type, info in inventory.items():
+        noise = noise_uniform_array(days["ordinals"], cabin_type, -0.02, 0.02)
+        prices[cabin_type] = base_price_array(days["seasonality"], noise, weights, tables.base_price) * info["multiplier"]
+        occupancy[cabin_type] = np.minimum(info["base_occupancy"] * demand_mod, tables.occupancy_cap)
+        occupied[cabin_type] = info["count"] * occupancy[cabin_type]
+        revenue[cabin_type] = occupied[cabin_type] * prices[cabin_type]
+
+        cabin_revenue += revenue[cabin_type]
+        total_occupied += occupied[cabin_type]
+        total_possible_nights += info["count"] * num_days
+        cabin_breakdown[cabin_type] = {
+            "revenue": float(revenue[cabin_type].sum()),
+            "nights_sold": float(occupied[cabin_type].sum())
+        }
+
+    activity_revenue = total_occupied * 2 * activity_rate_by_season(activities)[days["season"]]
+    total_revenue = cabin_revenue + activity_revenue
+    columns = ForecastColumns(
+        inventory.keys(),
+        days["ordinals"].astype(np.int32),
+        cabin_revenue,
+        activity_revenue,
+        np.column_stack([occupied[k] for k in inventory]) if inventory else np.zeros((num_days, 0)),
+        np.column_stack([revenue[k] for k in inventory]) if inventory else np.zeros((num_days, 0))
+    )
+
+    period_data = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "num_days": num_days,
+        "total_cabin_revenue": float(cabin_revenue.sum()),
+        "total_activity_revenue": float(activity_revenue.sum()),
+        "total_revenue": float(total_revenue.sum()),
+        "avg_daily_revenue": 0,
+        "avg_occupancy": 0,
+        "cabin_breakdown": cabin_breakdown,
+        "columns": columns,
+        "days": columns.rows,
+        "arrays": {
+            "ordinals": days["ordinals"],
+            "prices": prices,
+            "occupancy": occupancy,
+            "occupied": occupied,
+            "cabin_revenue_by_type": revenue,
+            "cabin_revenue": cabin_revenue,
+            "activity_revenue": activity_revenue,
+            "total_revenue": total_revenue
+        }
+    }
+
+    if num_days > 0:
+        period_data["avg_daily_revenue"] = period_data["total_revenue"] / num_days
+    if total_possible_nights > 0:
+        period_data["avg_occupancy"] = float(total_occupied.sum()) / total_possible_nights
+
+    return period_data
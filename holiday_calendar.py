@@ -0,0 +1,400 @@
+"""
+Holiday and Event Calendar
+
+Holidays, school breaks and local events are declared as rules, each with
+its own price factor, holiday kind (major or part of the holiday season)
+and, optionally, its own occupancy boost:
+
+- FixedDate("Christmas", 12, 25, factor=5.0, major=True)
+- NthWeekday("Thanksgiving", 11, 3, 4, days=4)          # 4th Thursday, and the weekend after
+- EasterOffset("Easter weekend", -2, days=4)             # Good Friday to Easter Monday
+- DateRange("Spring break", (3, 14), (3, 29), factor=1.3, boost=1.15)
+- OneOff("Lake festival", date(2027, 8, 6), date(2027, 8, 8), factor=1.8)
+
+compile_year() turns a rule list into day-of-year arrays, which
+CalendarFactorIndex stores alongside its other per-year tables, so looking a
+date up costs the same however many rules there are. When rules overlap on
+a day, the later rule wins. From the command line:
+
+    python3 holiday_calendar.py 2027
+    python3 holiday_calendar.py 2027 --config pricing.json
+"""
+
+import argparse
+from array import array
+from calendar import monthrange
+from datetime import date
+import sys
+
+# Holiday kinds stored in the per-year tables
+HOLIDAY_NONE = 0
+HOLIDAY_SEASON = 1
+HOLIDAY_MAJOR = 2
+
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# compile_year only looks one year either side for days that spill over, so
+# offset and multi-day rules stay within half a year of their anchor day
+MAX_OFFSET = 183
+MAX_DAYS = 183
+
+
+def easter_sunday(year):
+    """Western (Gregorian) Easter Sunday of a year (anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+def _month_day_string(month, day):
+    return f"{month:02d}-{day:02d}"
+
+def _check_span(offset, days):
+    if not -MAX_OFFSET <= offset <= MAX_OFFSET:
+        raise ValueError(f"offset must be between -{MAX_OFFSET} and {MAX_OFFSET} days")
+    if not 1 <= days <= MAX_DAYS:
+        raise ValueError(f"days must be 1 to {MAX_DAYS}")
+
+def _days(first_ordinal, last_ordinal):
+    # The dates first to last (ordinals), skipping any before 0001-01-01 or after 9999-12-31
+    for ordinal in range(max(first_ordinal, 1), min(last_ordinal, date.max.toordinal()) + 1):
+        yield date.fromordinal(ordinal)
+
+
+# --- Rules ---
+
+class HolidayRule:
+    """A holiday or event: its name, price factor, kind and occupancy boost
+
+    boost replaces the occupancy boost of the holiday's kind (the "major" or
+    "season" entry of HOLIDAY_OCCUPANCY_BOOST) on the rule's days; None
+    keeps the kind's boost. Subclasses yield the rule's dates in a year.
+    """
+
+    __slots__ = ("name", "factor", "major", "boost")
+
+    def __init__(self, name, factor=1.0, major=False, boost=None):
+        if factor <= 0:
+            raise ValueError("factor must be positive")
+        if boost is not None and boost <= 0:
+            raise ValueError("boost must be positive")
+        self.name = name
+        self.factor = factor
+        self.major = bool(major)
+        self.boost = boost
+
+    @property
+    def kind(self):
+        return HOLIDAY_MAJOR if self.major else HOLIDAY_SEASON
+
+    def dates(self, year):
+        """The rule's dates that fall in a calendar year"""
+        raise NotImplementedError
+
+    def to_config(self):
+        """The rule as a calendar.holidays entry (see rule_from_config)"""
+        entry = {"name": self.name} if self.name else {}
+        entry.update(self._when())
+        entry["factor"] = self.factor
+        entry["major"] = self.major
+        if self.boost is not None:
+            entry["boost"] = self.boost
+        return entry
+
+    def _when(self):
+        raise NotImplementedError
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in self._when().items())
+        return f"{type(self).__name__}({self.name!r}, {fields}, factor={self.factor!r}, major={self.major!r})"
+
+
+class FixedDate(HolidayRule):
+    """The same month and day every year (February 29 only in leap years)"""
+
+    __slots__ = ("month", "day")
+
+    def __init__(self, name, month, day, **kwargs):
+        super().__init__(name, **kwargs)
+        date(2000, month, day)  # raises ValueError for impossible dates
+        self.month = month
+        self.day = day
+
+    def dates(self, year):
+        try:
+            yield date(year, self.month, self.day)
+        except ValueError:
+            pass
+
+    def _when(self):
+        return {"date": _month_day_string(self.month, self.day)}
+
+
+class NthWeekday(HolidayRule):
+    """The nth weekday of a month (n=-1 for the last), plus offset days, for days days
+
+    Weekdays count from Monday (0). A month without a 5th such weekday has
+    no date that year.
+    """
+
+    __slots__ = ("month", "weekday", "n", "offset", "days")
+
+    def __init__(self, name, month, weekday, n, offset=0, days=1, **kwargs):
+        super().__init__(name, **kwargs)
+        if month not in range(1, 13):
+            raise ValueError("month must be 1-12")
+        if weekday not in range(7):
+            raise ValueError("weekday must be 0-6 (Monday is 0)")
+        if n not in (1, 2, 3, 4, 5, -1, -2, -3, -4, -5):
+            raise ValueError("n must be 1 to 5, or -1 to -5 counting from the end of the month")
+        _check_span(offset, days)
+        self.month = month
+        self.weekday = weekday
+        self.n = n
+        self.offset = offset
+        self.days = days
+
+    def anchor(self, year):
+        """The nth weekday itself, or None if the month has no such day"""
+        first_weekday, length = monthrange(year, self.month)
+        if self.n > 0:
+            day = 1 + (self.weekday - first_weekday) % 7 + 7 * (self.n - 1)
+        else:
+            day = length - (first_weekday + length - 1 - self.weekday) % 7 - 7 * (-self.n - 1)
+        return date(year, self.month, day) if 1 <= day <= length else None
+
+    def dates(self, year):
+        anchor = self.anchor(year)
+        if anchor is not None:
+            first = anchor.toordinal() + self.offset
+            yield from _days(first, first + self.days - 1)
+
+    def _when(self):
+        return {"month": self.month, "weekday": self.weekday, "n": self.n, "offset": self.offset, "days": self.days}
+
+
+class EasterOffset(HolidayRule):
+    """Days relative to Easter Sunday (offset=-2 is Good Friday), for days days"""
+
+    __slots__ = ("offset", "days")
+
+    def __init__(self, name, offset=0, days=1, **kwargs):
+        super().__init__(name, **kwargs)
+        _check_span(offset, days)
+        self.offset = offset
+        self.days = days
+
+    def dates(self, year):
+        first = easter_sunday(year).toordinal() + self.offset
+        yield from _days(first, first + self.days - 1)
+
+    def _when(self):
+        return {"easter": self.offset, "days": self.days}
+
+
+class DateRange(HolidayRule):
+    """Every day from one month-day to another, inclusive, every year
+
+    A range whose end comes before its start wraps around New Year (e.g.
+    (12, 20) to (1, 3)); its days in a year are the start of one such
+    period and the end of the previous one.
+    """
+
+    __slots__ = ("start", "end")
+
+    def __init__(self, name, start, end, **kwargs):
+        super().__init__(name, **kwargs)
+        date(2000, *start)
+        date(2000, *end)
+        self.start = tuple(start)
+        self.end = tuple(end)
+
+    def dates(self, year):
+        if self.start <= self.end:
+            spans = [(self.start, self.end)]
+        else:
+            spans = [((1, 1), self.end), (self.start, (12, 31))]
+        for (first_month, first_day), (last_month, last_day) in spans:
+            yield from _days(_clamp(year, first_month, first_day).toordinal(),
+                             _clamp(year, last_month, last_day).toordinal())
+
+    def _when(self):
+        return {"from": _month_day_string(*self.start), "to": _month_day_string(*self.end)}
+
+
+class OneOff(HolidayRule):
+    """Specific dates (first to last, inclusive): a local event or blackout in one year"""
+
+    __slots__ = ("first", "last")
+
+    def __init__(self, name, first, last=None, **kwargs):
+        super().__init__(name, **kwargs)
+        last = last or first
+        if last < first:
+            raise ValueError("last date is before the first")
+        self.first = first
+        self.last = last
+
+    def dates(self, year):
+        first = max(self.first, date(year, 1, 1))
+        last = min(self.last, date(year, 12, 31))
+        yield from _days(first.toordinal(), last.toordinal())
+
+    def _when(self):
+        if self.first == self.last:
+            return {"date": self.first.isoformat()}
+        return {"from": self.first.isoformat(), "to": self.last.isoformat()}
+
+
+def _clamp(year, month, day):
+    # February 29 in a range falls back to the 28th in common years
+    if month == 2 and day == 29 and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        return date(year, 2, 28)
+    return date(year, month, day)
+
+
+# --- Configuration entries ---
+
+_WHEN_KEYS = {"date", "from", "to", "month", "weekday", "n", "offset", "days", "easter"}
+_RULE_KEYS = {"name", "factor", "major", "boost"}
+
+def _parse_date(value, key):
+    """A "MM-DD" string -> (month, day), a "YYYY-MM-DD" string -> date"""
+    try:
+        parts = [int(part) for part in str(value).split("-")]
+        if len(parts) == 3:
+            return date(*parts)
+        if len(parts) == 2:
+            date(2000, *parts)  # a leap year, so 02-29 is allowed
+            return tuple(parts)
+    except ValueError:
+        pass
+    raise ValueError(f"{key} must be a MM-DD or YYYY-MM-DD date")
+
+def _integer(entry, key, default=None):
+    value = entry.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{key} must be an integer")
+    return value
+
+def rule_from_config(entry):
+    """Build a rule from a calendar.holidays entry; raises ValueError if it is invalid
+
+    The entry has a "factor", optionally "name", "major" and "boost", and
+    one way of giving its dates:
+
+    - {"date": "12-25"}                                   FixedDate
+    - {"from": "12-20", "to": "12-30"}                    DateRange
+    - {"month": 11, "weekday": 3, "n": 4, "offset": 0, "days": 1}   NthWeekday
+    - {"easter": -2, "days": 4}                           EasterOffset
+    - {"date": "2027-08-06"} or {"from": "2027-08-06", "to": "2027-08-08"}   OneOff
+    """
+    if not isinstance(entry, dict):
+        raise ValueError("must be a table/object")
+    unknown = [key for key in entry if key not in _WHEN_KEYS | _RULE_KEYS]
+    if unknown:
+        raise ValueError(f"has unknown keys {', '.join(unknown)}")
+
+    factor = entry.get("factor")
+    if isinstance(factor, bool) or not isinstance(factor, (int, float)):
+        raise ValueError("factor must be a number")
+    boost = entry.get("boost")
+    if boost is not None and (isinstance(boost, bool) or not isinstance(boost, (int, float))):
+        raise ValueError("boost must be a number")
+    name = entry.get("name", "")
+    if not isinstance(name, str):
+        raise ValueError("name must be a string")
+    common = {"factor": factor, "major": bool(entry.get("major", False)), "boost": boost}
+
+    when = {key for key in entry if key in _WHEN_KEYS}
+    if "easter" in when:
+        _only(when, {"easter", "days"})
+        return EasterOffset(name, _integer(entry, "easter"), _integer(entry, "days", 1), **common)
+    if "month" in when:
+        _only(when, {"month", "weekday", "n", "offset", "days"})
+        return NthWeekday(name, _integer(entry, "month"), _integer(entry, "weekday"), _integer(entry, "n"),
+                          _integer(entry, "offset", 0), _integer(entry, "days", 1), **common)
+    if "date" in when:
+        _only(when, {"date"})
+        day = _parse_date(entry["date"], "date")
+        return OneOff(name, day, **common) if isinstance(day, date) else FixedDate(name, *day, **common)
+    if when == {"from", "to"}:
+        first, last = _parse_date(entry["from"], "from"), _parse_date(entry["to"], "to")
+        if isinstance(first, date) != isinstance(last, date):
+            raise ValueError("from and to must both be MM-DD or both be YYYY-MM-DD")
+        return OneOff(name, first, last, **common) if isinstance(first, date) else DateRange(name, first, last,
+                                                                                             **common)
+    raise ValueError('needs "date", "from" and "to", "month"/"weekday"/"n" or "easter"')
+
+def _only(when, allowed):
+    extra = sorted(when - allowed)
+    if extra:
+        raise ValueError(f"cannot combine {', '.join(sorted(when & allowed))} with {', '.join(extra)}")
+
+
+# --- Compiling ---
+
+def compile_year(rules, year, start_ordinal, days):
+    """Per-day holiday arrays for one year: (factor, kind, boost, rule index)
+
+    factor is the price multiplier (1.0 on ordinary days), kind a
+    HOLIDAY_* value, boost the rule's occupancy boost (0.0 where the kind's
+    boost applies) and rule the index into rules of the rule that set the
+    day (-1 on ordinary days). Later rules overwrite earlier ones.
+    """
+    factor = array("d", [1.0]) * days
+    kind = array("b", [HOLIDAY_NONE]) * days
+    boost = array("d", [0.0]) * days
+    rule_index = array("h", [-1]) * days
+    for index, rule in enumerate(rules):
+        # Offsets and multi-day rules can spill over from the years either side
+        for neighbour in range(max(year - 1, date.min.year), min(year + 1, date.max.year) + 1):
+            for day in rule.dates(neighbour):
+                offset = day.toordinal() - start_ordinal
+                if 0 <= offset < days:
+                    factor[offset] = rule.factor
+                    kind[offset] = rule.kind
+                    boost[offset] = rule.boost or 0.0
+                    rule_index[offset] = index
+    return factor, kind, boost, rule_index
+
+
+def main(argv=None):
+    from calendar_factors import CALENDAR
+
+    parser = argparse.ArgumentParser(description="List the holidays and events of a year.")
+    parser.add_argument("year", type=int)
+    parser.add_argument("--config", help="JSON or TOML pricing configuration with a calendar section")
+    args = parser.parse_args(argv)
+
+    calendar = CALENDAR
+    if args.config:
+        from pricing_config import ConfigError, load_tables
+        try:
+            calendar = load_tables(args.config).calendar
+        except ConfigError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    table = calendar.year(args.year)
+    print(f"{'date':<12}{'day':<11}{'holiday':<28}{'kind':<8}{'price':>7}{'boost':>8}")
+    for offset, index in enumerate(table.holiday_rule):
+        if index < 0:
+            continue
+        day = date.fromordinal(table.start_ordinal + offset)
+        rule = calendar.holidays[index]
+        boost = f"{rule.boost:.2f}" if rule.boost is not None else "kind"
+        print(f"{day.isoformat():<12}{WEEKDAY_NAMES[day.weekday()]:<11}{rule.name or '-':<28}"
+              f"{'major' if rule.major else 'season':<8}{rule.factor:>6.2f}x{boost:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+Instrumentation
+
+Opt-in timers, call counters and latency histograms for the pricing,
+forecasting and UI hot paths, plus a one-shot profiler for a forecast.
+
+Modules declare their instrumentation points next to the code:
+
+    instrument(PricingEngine, "calculate_seasonality", "pricing.seasonality")
+
+enable() swaps each point for a timing wrapper and disable() puts the
+original function back, so while instrumentation is off the hot paths run
+exactly the code they always did (no flag checks, no wrappers). Points
+declared after enable() (e.g. by a GUI module imported later) are wrapped
+as soon as they are declared. Timings are inclusive: a stage's time
+includes any instrumented stages it calls. Only the current process is
+measured; process-pool workers are not. Module functions bound elsewhere
+with "from module import name" keep the unwrapped function, so only calls
+made through the module (or from inside it) are timed.
+
+Set CABIN_INSTRUMENTATION=1 to enable instrumentation at start-up, or to a
+file path to also write the metrics there on exit. From the command line:
+
+    python3 instrumentation.py metrics 2026-01-01 2027-01-01
+    python3 instrumentation.py profile 2026-01-01 2036-01-01 --output forecast.prof
+"""
+
+import argparse
+import atexit
+from bisect import bisect_left
+from datetime import timedelta
+import functools
+import os
+import sys
+import threading
+import time
+
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+           0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_points = {}       # (owner, attr) -> [stage, original, wrapper]
+_stats = {}        # stage -> StageStats
+_enabled = False
+
+
+class StageStats:
+    """Call count, total time and latency histogram of one stage"""
+
+    __slots__ = ("calls", "total", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def record(self, elapsed):
+        with _lock:
+            self.calls += 1
+            self.total += elapsed
+            self.buckets[bisect_left(BUCKETS, elapsed)] += 1
+
+
+def _timed(fn, stats):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stats.record(time.perf_counter() - start)
+    return wrapper
+
+def _install(owner, attr, point):
+    stage, original, wrapper = point
+    if wrapper is None:
+        point[2] = wrapper = _timed(original, _stats.setdefault(stage, StageStats()))
+    setattr(owner, attr, wrapper)
+
+
+# --- Declaring points ---
+
+def instrument(owner, attr, stage):
+    """Declare owner.attr (a module function or a class method) as a timed stage"""
+    key = (owner, attr)
+    if key in _points:
+        return
+    point = [stage, owner.__dict__[attr], None]
+    _points[key] = point
+    if _enabled:
+        _install(owner, attr, point)
+
+
+# --- Switching on and off ---
+
+def enable():
+    """Start timing every declared point (and any declared later)"""
+    global _enabled
+    _enabled = True
+    for (owner, attr), point in _points.items():
+        _install(owner, attr, point)
+
+def disable():
+    """Restore the original functions; collected metrics are kept"""
+    global _enabled
+    _enabled = False
+    for (owner, attr), point in _points.items():
+        setattr(owner, attr, point[1])
+
+def is_enabled():
+    return _enabled
+
+def reset():
+    """Zero every stage's metrics"""
+    with _lock:
+        for stats in _stats.values():
+            stats.calls = 0
+            stats.total = 0.0
+            stats.buckets = [0] * (len(BUCKETS) + 1)
+
+
+# --- Reading metrics ---
+
+def snapshot():
+    """{stage: {"calls", "total_seconds", "mean_seconds", "buckets"}} for stages called at least once"""
+    with _lock:
+        result = {}
+        for stage, stats in sorted(_stats.items()):
+            if stats.calls:
+                result[stage] = {
+                    "calls": stats.calls,
+                    "total_seconds": stats.total,
+                    "mean_seconds": stats.total / stats.calls,
+                    "buckets": list(stats.buckets)
+                }
+        return result
+
+def export_text(prefix="cabin"):
+    """Metrics in the Prometheus text exposition format"""
+    lines = [
+        f"# HELP {prefix}_stage_calls_total Calls per instrumented stage",
+        f"# TYPE {prefix}_stage_calls_total counter"
+    ]
+    stages = snapshot()
+    for stage, stats in stages.items():
+        lines.append(f'{prefix}_stage_calls_total{{stage="{stage}"}} {stats["calls"]}')
+
+    lines.append(f"# HELP {prefix}_stage_seconds Time spent per instrumented stage (inclusive)")
+    lines.append(f"# TYPE {prefix}_stage_seconds histogram")
+    for stage, stats in stages.items():
+        cumulative = 0
+        for bound, count in zip(BUCKETS + ("+Inf",), stats["buckets"]):
+            cumulative += count
+            lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+        lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {stats["total_seconds"]:.9f}')
+        lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {stats["calls"]}')
+    return "\n".join(lines) + "\n"
+
+def report():
+    """Plain table of calls, total and mean time per stage, slowest first"""
+    stages = sorted(snapshot().items(), key=lambda item: -item[1]["total_seconds"])
+    lines = [f"{'stage':<28}{'calls':>10}{'total ms':>12}{'mean us':>12}"]
+    for stage, stats in stages:
+        lines.append(f"{stage:<28}{stats['calls']:>10}{stats['total_seconds'] * 1000:>12.2f}"
+                     f"{stats['mean_seconds'] * 1e6:>12.2f}")
+    return "\n".join(lines)
+
+
+# --- Profiling ---
+
+def profile_forecast(start_date, end_date, vectorized=False, output=None, sort="cumulative", limit=30):
+    """cProfile one predict_period_revenue run; returns the pstats listing.
+
+    With output, the raw profile is also written there (for snakeviz,
+    pstats, etc.).
+    """
+    import cProfile
+    import io
+    import pstats
+
+    from predicted_revenue import predict_period_revenue
+
+    # A one-day warm-up run first, so the profile shows the forecast rather
+    # than the imports done on first use
+    predict_period_revenue(start_date, start_date + timedelta(days=1), vectorized=vectorized)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    predict_period_revenue(start_date, end_date, vectorized=vectorized)
+    profiler.disable()
+
+    if output:
+        profiler.dump_stats(output)
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+def _write_on_exit(path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(export_text())
+
+_env = os.environ.get("CABIN_INSTRUMENTATION", "")
+if _env:
+    enable()
+    if _env not in ("1", "true", "yes"):
+        atexit.register(_write_on_exit, _env)
+
+
+def main(argv=None):
+    # Run as a script this file is __main__; the points are registered with
+    # the imported "instrumentation" module
+    import instrumentation
+    import predicted_revenue
+    from pricing_engine import PricingEngine, parse_date
+
+    parser = argparse.ArgumentParser(description="Stage metrics or a profile of one forecast.")
+    parser.add_argument("command", choices=["metrics", "profile"])
+    parser.add_argument("start_date", help="YYYY-MM-DD")
+    parser.add_argument("end_date", help="YYYY-MM-DD")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy forecast")
+    parser.add_argument("--format", choices=["table", "prometheus"], default="table", help="metrics output")
+    parser.add_argument("--output", help="profile: also write the raw cProfile data here")
+    parser.add_argument("--sort", default="cumulative", help="profile: pstats sort key")
+    parser.add_argument("--limit", type=int, default=30, help="profile: rows to print")
+    args = parser.parse_args(argv)
+
+    start_date, end_date = parse_date(args.start_date), parse_date(args.end_date)
+    if end_date <= start_date:
+        parser.error("end_date must be after start_date")
+
+    if args.command == "profile":
+        print(instrumentation.profile_forecast(start_date, end_date, args.vectorized, args.output, args.sort, args.limit))
+        return 0
+
+    # One forecast of the period and one quote for a stay at its start
+    instrumentation.enable()
+    predicted_revenue.predict_period_revenue(start_date, end_date, vectorized=args.vectorized)
+    PricingEngine().quote({
+        "cabin_type": "forest",
+        "check_in": start_date,
+        "check_out": min(end_date, start_date + timedelta(days=7)),
+        "activities": {}
+    }, now=start_date)
+    instrumentation.disable()
+
+    if args.format == "table":
+        print(instrumentation.report())
+    else:
+        sys.stdout.write(instrumentation.export_text())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Live Quote
+
+Keeps a quote up to date while a guest edits the request one field at a
+time, re-pricing only what the edit affects:
+- cabin count: rescale the room total (nightly prices are unchanged)
+- cabin type: read the new cabin's nightly prices from the price index
+- activities: re-price the activity subtotal only
+- check-out: price only the nights added, or drop the nights removed
+
+Anything else (a new check-in date, a new booking window tier, changed
+pricing parameters or calendar) falls back to a full PricingEngine.quote.
+Results always equal what a full quote would return.
+"""
+
+from datetime import datetime
+
+from pricing_engine import booking_window_tier, copy_quote
+
+
+class LiveQuote:
+    """Incrementally maintained quote for one PricingEngine"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.counters = {"full": 0, "count": 0, "cabin": 0, "activities": 0, "checkout": 0}
+        self.reset()
+
+    def reset(self):
+        """Forget the current quote; the next update is priced in full"""
+        self.quote = None
+        self._state = None
+
+    def update(self, request, now=None):
+        """Quote for request, re-using as much of the previous quote as possible.
+
+        Raises ValueError (like PricingEngine.quote) for requests that cannot
+        be quoted; the previous quote is kept in that case.
+        """
+        now = now or datetime.now()
+        engine = self.engine
+        cabin_type, check_in, check_out, cabin_count, activities = engine.parse_request(request, now)
+        activities = {key: int(count) for key, count in activities.items()}
+        tier = booking_window_tier((check_in - now).days, engine.tables.booking_window_tiers)
+        generation = (engine.price_index.generation, engine.calendar.version)
+
+        previous = self._state
+        if (previous is None or previous["check_in"] != check_in or previous["tier"] != tier
+                or previous["generation"] != generation):
+            quote = engine.quote(request, now=now)
+            base_room_total = engine.price_index.range_total(cabin_type, tier, check_in, check_out)
+            self._remember(quote, tier, generation, base_room_total, activities)
+            self.counters["full"] += 1
+            return quote
+
+        nightly_data = previous["nightly_data"]
+        base_room_total = previous["base_room_total"]
+        selected_activities = previous["selected_activities"]
+        activities_total = previous["activities_total"]
+
+        if cabin_type != previous["cabin_type"]:
+            # Nightly noise differs per cabin type, so its prices are read
+            # (not recomputed) from the price index
+            nightly_data = engine.nightly_data(cabin_type, tier, check_in, check_out)
+            base_room_total = engine.price_index.range_total(cabin_type, tier, check_in, check_out)
+            self.counters["cabin"] += 1
+        elif check_out != previous["check_out"]:
+            if check_out > previous["check_out"]:
+                nightly_data = nightly_data + engine.nightly_data(cabin_type, tier, previous["check_out"], check_out)
+            else:
+                nightly_data = nightly_data[:(check_out - check_in).days]
+            base_room_total = engine.price_index.range_total(cabin_type, tier, check_in, check_out)
+            self.counters["checkout"] += 1
+        elif cabin_count != previous["cabin_count"]:
+            self.counters["count"] += 1
+
+        # Activity availability depends on the stay, so a new check-out
+        # re-checks them as well
+        if activities != previous["activities"] or check_out != previous["check_out"]:
+            selected_activities, activities_total = engine.price_activities(activities, check_in, check_out)
+            self.counters["activities"] += activities != previous["activities"]
+
+        quote = engine.assemble_quote(cabin_type, check_in, check_out, cabin_count, base_room_total,
+                                      nightly_data, selected_activities, activities_total)
+        self._remember(quote, tier, generation, base_room_total, activities)
+        return quote
+
+    def _remember(self, quote, tier, generation, base_room_total, activities):
+        # The returned quote is the caller's to change, so the parts the next
+        # update re-uses are kept as a private copy
+        self.quote = quote
+        quote = copy_quote(quote)
+        self._state = {
+            "cabin_type": quote["cabin_type"],
+            "check_in": quote["check_in"],
+            "check_out": quote["check_out"],
+            "cabin_count": quote["cabin_count"],
+            "tier": tier,
+            "generation": generation,
+            "base_room_total": base_room_total,
+            "nightly_data": quote["nightly_data"],
+            "activities": activities,
+            "selected_activities": quote["selected_activities"],
+            "activities_total": quote["activities_total"]
+        }
@@ -0,0 +1,57 @@
+"""
+Deterministic Noise
+
+Counter-based noise for the pricing formula's u term. Instead of drawing from
+the global random module, each value is a hash (SplitMix64) of a seed, a
+stream (the cabin type) and a counter (the date's ordinal). The same inputs
+always give the same noise, so quotes and forecasts are reproducible and can
+be cached.
+
+noise_uniform and noise_uniform_array produce bit-identical values, so the
+scalar and vectorized paths agree exactly.
+"""
+
+import zlib
+
+NOISE_SEED = 0
+
+_MASK = 0xFFFFFFFFFFFFFFFF
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+def _mix64(x):
+    """SplitMix64 finalizer on a Python int"""
+    x = (x + _GOLDEN) & _MASK
+    x = ((x ^ (x >> 30)) * _MIX1) & _MASK
+    x = ((x ^ (x >> 27)) * _MIX2) & _MASK
+    return x ^ (x >> 31)
+
+_stream_bases = {}
+
+def stream_base(stream, seed=NOISE_SEED):
+    """Starting counter value for a (seed, stream) pair"""
+    key = (stream, seed)
+    base = _stream_bases.get(key)
+    if base is None:
+        stream_id = zlib.crc32((stream or "").encode("utf-8"))
+        base = _mix64(((seed & 0xFFFFFFFF) << 32) | stream_id)
+        _stream_bases[key] = base
+    return base
+
+def noise_uniform(counter, stream, low, high, seed=NOISE_SEED):
+    """Uniform value in [low, high) for one counter (e.g. a date ordinal)"""
+    x = _mix64((stream_base(stream, seed) + counter * _GOLDEN) & _MASK)
+    return low + (high - low) * ((x >> 11) * (1.0 / (1 << 53)))
+
+def noise_uniform_array(counters, stream, low, high, seed=NOISE_SEED):
+    """Vectorized noise_uniform over an array of counters"""
+    import numpy as np
+
+    with np.errstate(over="ignore"):
+        x = np.asarray(counters).astype(np.uint64) * np.uint64(_GOLDEN) + np.uint64(stream_base(stream, seed))
+        x = x + np.uint64(_GOLDEN)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(_MIX1)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(_MIX2)
+        x = x ^ (x >> np.uint64(31))
+    return low + (high - low) * ((x >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53)))
@@ -0,0 +1,55 @@
+"""
+Parallel Helpers
+
+Bounded, order-preserving fan-out over a process pool. Work is submitted in
+chunks and only a fixed window of chunks is in flight at once, so memory
+stays flat no matter how long the input iterator is.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+def chunked(iterable, size):
+    """Yield lists of up to size items from an iterable"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+# Forecast range and its calendar arrays, set in each worker by
+# init_shared_range so they are computed once in the parent, not per task
+shared_range = {}
+
+def init_shared_range(start_date, end_date, days):
+    """Pool initializer for parallel_map: store a range's calendar arrays in shared_range"""
+    shared_range.update(start_date=start_date, end_date=end_date, days=days)
+
+def _apply_chunk(fn, chunk):
+    return [fn(item) for item in chunk]
+
+def parallel_map(fn, iterable, workers=1, chunksize=64, window=None, initializer=None, initargs=()):
+    """Lazily yield fn(item) for every item, in input order.
+
+    With workers > 1 the items are sent to a process pool in chunks of
+    chunksize, keeping at most window chunks (default 2 per worker) pending.
+    fn must be picklable, i.e. a module-level function.
+    """
+    if not workers or workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for item in iterable:
+            yield fn(item)
+        return
+
+    window = window or workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending = deque()
+        for chunk in chunked(iterable, chunksize):
+            pending.append(pool.submit(_apply_chunk, fn, chunk))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,241 @@
+"""
+Portfolio Forecast
+
+Forecasts revenue for many properties at once, each with its own cabin
+inventory, occupancy baselines and activity mix, and rolls the results up
+per property, per region and for the whole portfolio.
+
+A property is a dict:
+
+    {
+        "id": "pine-ridge",
+        "region": "north",
+        "inventory": {"forest": {"count": 6, "multiplier": 1.0, "base_occupancy": 0.6}, ...},
+        "seasonal_occupancy": {...},   # optional, default SEASONAL_OCCUPANCY
+        "holiday_boost": {...},        # optional, default HOLIDAY_OCCUPANCY_BOOST
+        "activities": ["hiking", "kayaking"]   # optional keys of ACTIVITIES, or a dict like it
+    }
+
+The calendar factors of the date range are computed once in the parent and
+handed to each worker process when it starts; properties are sent to the
+workers in chunks, largest first, so a few big properties do not end up
+last in line. From the command line:
+
+    python3 portfolio.py properties.json 2027-01-01 2028-01-01 --workers 4 --output portfolio.json
+"""
+
+import argparse
+from collections.abc import Mapping
+import json
+import math
+import sys
+
+from forecast_vectorized import calendar_arrays, predict_period_revenue_vectorized
+from parallel import init_shared_range, parallel_map, shared_range
+import predicted_revenue as model
+
+DEFAULT_REGION = "default"
+
+
+# --- Property definitions ---
+
+def _plain(value):
+    # The model's tables are read-only mapping proxies, which cannot be
+    # pickled to worker processes; specs carry plain dict copies
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+def validate_property(prop):
+    """Check a property definition and fill in its defaults; returns a new dict.
+
+    Raises ValueError describing the first problem found.
+    """
+    if not isinstance(prop, dict):
+        raise ValueError("Property must be an object")
+    prop_id = prop.get("id")
+    if prop_id is None:
+        raise ValueError("Property is missing its id")
+    inventory = prop.get("inventory")
+    if not isinstance(inventory, Mapping) or not inventory:
+        raise ValueError(f"Property {prop_id}: inventory must be a non-empty object")
+    for cabin_type, info in inventory.items():
+        for field in ("count", "multiplier", "base_occupancy"):
+            if field not in info:
+                raise ValueError(f"Property {prop_id}: cabin type {cabin_type} is missing {field}")
+        if info["count"] < 0:
+            raise ValueError(f"Property {prop_id}: cabin type {cabin_type} has a negative count")
+
+    activities = prop.get("activities", model.ACTIVITIES)
+    if isinstance(activities, (list, tuple)):
+        unknown = [key for key in activities if key not in model.ACTIVITIES]
+        if unknown:
+            raise ValueError(f"Property {prop_id}: unknown activities {', '.join(unknown)}")
+        activities = {key: model.ACTIVITIES[key] for key in activities}
+
+    return {
+        "id": prop_id,
+        "name": prop.get("name", prop_id),
+        "region": prop.get("region", DEFAULT_REGION),
+        "inventory": _plain(inventory),
+        "seasonal_occupancy": _plain(prop.get("seasonal_occupancy", model.SEASONAL_OCCUPANCY)),
+        "holiday_boost": _plain(prop.get("holiday_boost", model.HOLIDAY_OCCUPANCY_BOOST)),
+        "activities": _plain(activities)
+    }
+
+def load_properties(path):
+    """Read property definitions from a JSON file (a list, or {"properties": [...]})"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("properties")
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: expected a list of properties")
+    return data
+
+
+# --- Workers ---
+
+def forecast_property(item):
+    """(index, property) -> (index, property summary); runs in a worker process.
+
+    Only the summary and monthly totals are sent back, not the per-day arrays.
+    """
+    index, prop = item
+    inventory = prop["inventory"]
+    result = predict_period_revenue_vectorized(
+        shared_range["start_date"], shared_range["end_date"], inventory=inventory,
+        seasonal_occupancy=prop["seasonal_occupancy"], holiday_boost=prop["holiday_boost"],
+        activities=prop["activities"], days=shared_range["days"]
+    )
+    nights_sold = sum(cabin["nights_sold"] for cabin in result["cabin_breakdown"].values())
+    return index, {
+        "id": prop["id"],
+        "name": prop["name"],
+        "region": prop["region"],
+        "total_revenue": result["total_revenue"],
+        "total_cabin_revenue": result["total_cabin_revenue"],
+        "total_activity_revenue": result["total_activity_revenue"],
+        "avg_daily_revenue": result["avg_daily_revenue"],
+        "avg_occupancy": result["avg_occupancy"],
+        "nights_sold": nights_sold,
+        "nights_available": sum(info["count"] for info in inventory.values()) * result["num_days"],
+        "cabin_breakdown": result["cabin_breakdown"],
+        "monthly": result["columns"].monthly_totals()
+    }
+
+def _cost(prop):
+    # One set of day arrays per cabin type, plus the activity arrays
+    return len(prop["inventory"]) + 1
+
+
+# --- Roll-ups ---
+
+def _rollup(summaries, num_days):
+    monthly = {}
+    for summary in summaries:
+        for year, month, revenue, days in summary["monthly"]:
+            previous = monthly.get((year, month), (0.0, days))
+            monthly[(year, month)] = (previous[0] + revenue, days)
+
+    total_revenue = sum(s["total_revenue"] for s in summaries)
+    nights_sold = sum(s["nights_sold"] for s in summaries)
+    nights_available = sum(s["nights_available"] for s in summaries)
+    return {
+        "properties": len(summaries),
+        "total_revenue": total_revenue,
+        "total_cabin_revenue": sum(s["total_cabin_revenue"] for s in summaries),
+        "total_activity_revenue": sum(s["total_activity_revenue"] for s in summaries),
+        "avg_daily_revenue": total_revenue / num_days if num_days else 0,
+        "avg_occupancy": nights_sold / nights_available if nights_available else 0,
+        "nights_sold": nights_sold,
+        "nights_available": nights_available,
+        "monthly": [(year, month, revenue, days) for (year, month), (revenue, days) in sorted(monthly.items())]
+    }
+
+
+# --- Portfolio forecast ---
+
+def forecast_portfolio(properties, start_date, end_date, workers=1, chunksize=None):
+    """Forecast every property over [start_date, end_date) and roll the results up.
+
+    Returns {"properties": [summary per property, in input order],
+    "regions": {region: roll-up}, "portfolio": roll-up}. Property ids must
+    be unique. chunksize defaults to about four chunks per worker.
+    """
+    properties = [validate_property(prop) for prop in properties]
+    ids = set()
+    for prop in properties:
+        if prop["id"] in ids:
+            raise ValueError(f"Duplicate property id: {prop['id']}")
+        ids.add(prop["id"])
+
+    days = calendar_arrays(start_date, end_date)
+    num_days = len(days["ordinals"])
+
+    # Largest properties first, so the last chunks to finish are small ones
+    order = sorted(range(len(properties)), key=lambda i: -_cost(properties[i]))
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(properties) / (max(workers, 1) * 4)))
+
+    summaries = [None] * len(properties)
+    results = parallel_map(
+        forecast_property, ((i, properties[i]) for i in order), workers=workers, chunksize=chunksize,
+        initializer=init_shared_range, initargs=(start_date, end_date, days)
+    )
+    for index, summary in results:
+        summaries[index] = summary
+
+    regions = {}
+    for summary in summaries:
+        regions.setdefault(summary["region"], []).append(summary)
+
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "num_days": num_days,
+        "properties": summaries,
+        "regions": {region: _rollup(members, num_days) for region, members in sorted(regions.items())},
+        "portfolio": _rollup(summaries, num_days)
+    }
+
+
+def main(argv=None):
+    from batch_cli import to_json
+    from pricing_engine import parse_date
+
+    parser = argparse.ArgumentParser(description="Forecast revenue for a portfolio of properties.")
+    parser.add_argument("properties", help="JSON file of property definitions")
+    parser.add_argument("start_date", help="YYYY-MM-DD")
+    parser.add_argument("end_date", help="YYYY-MM-DD")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--chunksize", type=int, help="properties per worker task")
+    parser.add_argument("--output", help="write the full result as JSON to this file")
+    args = parser.parse_args(argv)
+
+    start_date, end_date = parse_date(args.start_date), parse_date(args.end_date)
+    if end_date <= start_date:
+        parser.error("end_date must be after start_date")
+
+    try:
+        result = forecast_portfolio(load_properties(args.properties), start_date, end_date,
+                                    workers=args.workers, chunksize=args.chunksize)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{'region':<20}{'properties':>12}{'revenue':>18}{'occupancy':>12}")
+    for region, rollup in result["regions"].items():
+        print(f"{region:<20}{rollup['properties']:>12}{rollup['total_revenue']:>18,.0f}{rollup['avg_occupancy']:>12.1%}")
+    portfolio = result["portfolio"]
+    print(f"{'portfolio':<20}{portfolio['properties']:>12}{portfolio['total_revenue']:>18,.0f}"
+          f"{portfolio['avg_occupancy']:>12.1%}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, default=to_json, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
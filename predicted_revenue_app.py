@@ -0,0 +1,540 @@
+"""
+Revenue Prediction Model - Desktop App
+
+The customtkinter window for the revenue model. The forecast itself lives in
+predicted_revenue.py, which imports without any GUI toolkit; this module is
+only loaded when the app is created.
+"""
+
+import customtkinter as ctk
+from datetime import datetime, timedelta
+import calendar
+import queue
+import threading
+
+from forecast_columns import ForecastColumns
+from instrumentation import instrument
+from predicted_revenue import CABIN_INVENTORY, stream_period_revenue
+from virtual_list import VirtualList, set_text
+
+# Configuration
+ctk.set_appearance_mode("Light")
+ctk.set_default_color_theme("blue")
+
+CHUNK_DAYS = 30     # days forecast between progress updates
+POLL_MS = 50        # how often the window checks for finished chunks
+
+
+class ForecastJob:
+    """A period forecast running on a worker thread
+
+    The worker posts ("progress", summary, months) after every chunk of
+    days, then one of ("done", period_data, months), ("cancelled", summary,
+    months) or ("error", message, []). months holds the (year, month,
+    revenue, days) rows for months completed since the previous message.
+    The worker never touches widgets; the window polls the queue with
+    after().
+    """
+    
+    def __init__(self, start_date, end_date, chunk_days=CHUNK_DAYS):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.chunk_days = chunk_days
+        self.num_days = max((end_date - start_date).days, 0)
+        self.messages = queue.Queue()
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+    
+    def start(self):
+        self.thread.start()
+    
+    def cancel(self):
+        self.cancelled.set()
+    
+    def _run(self):
+        try:
+            columns = ForecastColumns.allocate(self.start_date, self.num_days, CABIN_INVENTORY.keys())
+            stream = stream_period_revenue(self.start_date, self.end_date, chunk_size=self.chunk_days)
+            index = 0
+            month = None
+            for chunk in stream:
+                months = []
+                for daily in chunk:
+                    columns.set_day(index, daily)
+                    index += 1
+                    date = daily["date"]
+                    if month is None or (month[0], month[1]) != (date.year, date.month):
+                        if month is not None:
+                            months.append(tuple(month))
+                        month = [date.year, date.month, 0.0, 0]
+                    month[2] += daily["total_revenue"]
+                    month[3] += 1
+                if self.cancelled.is_set():
+                    self.messages.put(("cancelled", stream.summary(), months))
+                    return
+                self.messages.put(("progress", stream.summary(), months))
+            
+            period_data = stream.summary()
+            period_data["columns"] = columns
+            period_data["days"] = columns.rows
+            self.messages.put(("done", period_data, [tuple(month)] if month is not None else []))
+        except Exception as e:
+            self.messages.put(("error", str(e), []))
+
+
+class RevenuePredictionApp(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+        
+        self.title("Revenue Prediction Model")
+        self.geometry("1200x900")
+        self.resizable(True, True)
+        
+        self.create_layout()
+    
+    def create_layout(self):
+        # Main scrollable container
+        main_scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        main_scroll.pack(fill="both", expand=True, padx=40, pady=40)
+        
+        # Header
+        header = ctk.CTkFrame(main_scroll, fg_color="transparent")
+        header.pack(fill="x", pady=(0, 30))
+        
+        ctk.CTkLabel(
+            header,
+            text="📊 Revenue Prediction Model",
+            font=("Helvetica Neue", 36, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w")
+        
+        ctk.CTkLabel(
+            header,
+            text="Forecast revenue based on cabin inventory, pricing, and occupancy projections.",
+            font=("Helvetica Neue", 16),
+            text_color="#86868b"
+        ).pack(anchor="w", pady=(5, 0))
+        
+        # Inventory Summary
+        self.create_inventory_section(main_scroll)
+        
+        # Prediction Controls
+        self.create_controls_section(main_scroll)
+        
+        # Results Section
+        self.results_frame = ctk.CTkFrame(main_scroll, fg_color="transparent")
+        self.results_frame.pack(fill="both", expand=True, pady=(20, 0))
+        
+        self.create_results_placeholder()
+    
+    def create_inventory_section(self, parent):
+        section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
+        section.pack(fill="x", pady=(0, 20))
+        
+        ctk.CTkLabel(
+            section,
+            text="Cabin Inventory",
+            font=("Helvetica Neue", 20, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w", padx=25, pady=(25, 15))
+        
+        inventory_frame = ctk.CTkFrame(section, fg_color="transparent")
+        inventory_frame.pack(fill="x", padx=25, pady=(0, 25))
+        inventory_frame.grid_columnconfigure((0, 1, 2), weight=1)
+        
+        for i, (key, cabin) in enumerate(CABIN_INVENTORY.items()):
+            card = ctk.CTkFrame(inventory_frame, fg_color="#F5F5F7", corner_radius=12)
+            card.grid(row=0, column=i, sticky="nsew", padx=8, pady=5)
+            
+            inner = ctk.CTkFrame(card, fg_color="transparent")
+            inner.pack(fill="both", expand=True, padx=20, pady=20)
+            
+            ctk.CTkLabel(inner, text=cabin["icon"], font=("Helvetica Neue", 32)).pack()
+            ctk.CTkLabel(inner, text=cabin["name"], font=("Helvetica Neue", 16, "bold"), text_color="#1D1D1F").pack(pady=(10, 5))
+            ctk.CTkLabel(inner, text=f"{cabin['count']} Units", font=("Helvetica Neue", 14), text_color="#007AFF").pack()
+            ctk.CTkLabel(inner, text=f"{cabin['multiplier']}x Rate", font=("Helvetica Neue", 12), text_color="#86868b").pack()
+            ctk.CTkLabel(inner, text=f"~{int(cabin['base_occupancy']*100)}% Base Occupancy", font=("Helvetica Neue", 11), text_color="#86868b").pack(pady=(5, 0))
+    
+    def create_controls_section(self, parent):
+        section = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
+        section.pack(fill="x", pady=(0, 20))
+        
+        ctk.CTkLabel(
+            section,
+            text="Forecast Period",
+            font=("Helvetica Neue", 20, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w", padx=25, pady=(25, 15))
+        
+        controls = ctk.CTkFrame(section, fg_color="transparent")
+        controls.pack(fill="x", padx=25, pady=(0, 25))
+        controls.grid_columnconfigure((0, 1, 2, 3), weight=1)
+        
+        # Start Date
+        start_frame = ctk.CTkFrame(controls, fg_color="transparent")
+        start_frame.grid(row=0, column=0, sticky="ew", padx=10)
+        
+        ctk.CTkLabel(start_frame, text="Start Date", font=("Helvetica Neue", 12), text_color="#86868b").pack(anchor="w")
+        self.start_entry = ctk.CTkEntry(start_frame, placeholder_text="YYYY-MM-DD", height=40, font=("Helvetica Neue", 14))
+        self.start_entry.pack(fill="x", pady=(5, 0))
+        self.start_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        
+        # End Date
+        end_frame = ctk.CTkFrame(controls, fg_color="transparent")
+        end_frame.grid(row=0, column=1, sticky="ew", padx=10)
+        
+        ctk.CTkLabel(end_frame, text="End Date", font=("Helvetica Neue", 12), text_color="#86868b").pack(anchor="w")
+        self.end_entry = ctk.CTkEntry(end_frame, placeholder_text="YYYY-MM-DD", height=40, font=("Helvetica Neue", 14))
+        self.end_entry.pack(fill="x", pady=(5, 0))
+        # Default to 1 year from now
+        one_year = datetime.now() + timedelta(days=365)
+        self.end_entry.insert(0, one_year.strftime("%Y-%m-%d"))
+        
+        # Quick Select Buttons
+        quick_frame = ctk.CTkFrame(controls, fg_color="transparent")
+        quick_frame.grid(row=0, column=2, sticky="ew", padx=10)
+        
+        ctk.CTkLabel(quick_frame, text="Quick Select", font=("Helvetica Neue", 12), text_color="#86868b").pack(anchor="w")
+        
+        btn_row = ctk.CTkFrame(quick_frame, fg_color="transparent")
+        btn_row.pack(fill="x", pady=(5, 0))
+        
+        ctk.CTkButton(btn_row, text="1 Month", width=70, height=35, fg_color="#F5F5F7", text_color="#007AFF", hover_color="#E5E5E5",
+                     command=lambda: self.set_period(30)).pack(side="left", padx=2)
+        ctk.CTkButton(btn_row, text="3 Months", width=70, height=35, fg_color="#F5F5F7", text_color="#007AFF", hover_color="#E5E5E5",
+                     command=lambda: self.set_period(90)).pack(side="left", padx=2)
+        ctk.CTkButton(btn_row, text="1 Year", width=70, height=35, fg_color="#F5F5F7", text_color="#007AFF", hover_color="#E5E5E5",
+                     command=lambda: self.set_period(365)).pack(side="left", padx=2)
+        
+        # Calculate Button
+        calc_frame = ctk.CTkFrame(controls, fg_color="transparent")
+        calc_frame.grid(row=0, column=3, sticky="ew", padx=10)
+        
+        ctk.CTkLabel(calc_frame, text=" ", font=("Helvetica Neue", 12)).pack(anchor="w")
+        self.generate_button = ctk.CTkButton(
+            calc_frame,
+            text="Generate Forecast",
+            height=40,
+            font=("Helvetica Neue", 14, "bold"),
+            fg_color="#007AFF",
+            hover_color="#0062CC",
+            command=self.generate_forecast
+        )
+        self.generate_button.pack(fill="x", pady=(5, 0))
+        
+        # Progress (shown while a forecast is running)
+        self.progress_row = ctk.CTkFrame(controls, fg_color="transparent")
+        self.progress_row.grid(row=1, column=0, columnspan=4, sticky="ew", padx=10, pady=(15, 0))
+        
+        self.progress_bar = ctk.CTkProgressBar(self.progress_row, height=8, progress_color="#007AFF")
+        self.progress_bar.pack(side="left", fill="x", expand=True)
+        self.progress_bar.set(0)
+        
+        self.cancel_button = ctk.CTkButton(
+            self.progress_row,
+            text="Cancel",
+            width=80,
+            height=30,
+            fg_color="#F5F5F7",
+            text_color="#FF3B30",
+            hover_color="#E5E5E5",
+            command=self.cancel_forecast
+        )
+        self.cancel_button.pack(side="right", padx=(15, 0))
+        
+        self.progress_label = ctk.CTkLabel(self.progress_row, text="", font=("Helvetica Neue", 12), text_color="#86868b")
+        self.progress_label.pack(side="right", padx=(15, 0))
+        
+        self.progress_row.grid_remove()
+        self.job = None
+    
+    def set_period(self, days):
+        start = datetime.now()
+        end = start + timedelta(days=days)
+        
+        self.start_entry.delete(0, "end")
+        self.start_entry.insert(0, start.strftime("%Y-%m-%d"))
+        
+        self.end_entry.delete(0, "end")
+        self.end_entry.insert(0, end.strftime("%Y-%m-%d"))
+    
+    def create_results_placeholder(self):
+        placeholder = ctk.CTkFrame(self.results_frame, fg_color="#FFFFFF", corner_radius=15)
+        placeholder.pack(fill="both", expand=True)
+        self.results_placeholder = placeholder
+        self.results_panel = None
+        
+        ctk.CTkLabel(
+            placeholder,
+            text="📈",
+            font=("Helvetica Neue", 64)
+        ).pack(pady=(80, 10))
+        
+        ctk.CTkLabel(
+            placeholder,
+            text="Revenue Forecast",
+            font=("Helvetica Neue", 24, "bold"),
+            text_color="#1D1D1F"
+        ).pack()
+        
+        ctk.CTkLabel(
+            placeholder,
+            text="Select a date range and click 'Generate Forecast'\nto see predicted revenue.",
+            font=("Helvetica Neue", 14),
+            text_color="#86868b",
+            justify="center"
+        ).pack(pady=(10, 80))
+    
+    def generate_forecast(self):
+        if self.job is not None:
+            return
+        try:
+            start_str = self.start_entry.get().strip()
+            end_str = self.end_entry.get().strip()
+            
+            start_date = datetime.strptime(start_str, "%Y-%m-%d")
+            end_date = datetime.strptime(end_str, "%Y-%m-%d")
+            
+            if end_date <= start_date:
+                ctk.CTkInputDialog(text="End date must be after start date.", title="Error")
+                return
+        except ValueError:
+            ctk.CTkInputDialog(text="Please use YYYY-MM-DD format.", title="Format Error")
+            return
+        
+        # Forecast on a worker thread; results are drawn as chunks arrive
+        self.job = ForecastJob(start_date, end_date)
+        self.begin_results(self.job.num_days)
+        self.generate_button.configure(state="disabled")
+        self.cancel_button.configure(state="normal")
+        self.progress_bar.set(0)
+        self.progress_label.configure(text=f"0 of {self.job.num_days} days")
+        self.progress_row.grid()
+        self.job.start()
+        self.after(POLL_MS, self.poll_forecast)
+    
+    def cancel_forecast(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.cancel_button.configure(state="disabled")
+            self.progress_label.configure(text="Cancelling...")
+    
+    def poll_forecast(self):
+        job = self.job
+        if job is None:
+            return
+        
+        # Apply every message that arrived since the last poll; only the
+        # newest summary needs drawing
+        summary = None
+        finished = None
+        error = None
+        try:
+            while finished is None:
+                kind, payload, months = job.messages.get_nowait()
+                if kind == "error":
+                    finished = kind
+                    error = payload
+                    break
+                summary = payload
+                self.add_month_rows(months)
+                if kind != "progress":
+                    finished = kind
+        except queue.Empty:
+            pass
+        
+        if summary is not None:
+            self.update_results(summary)
+            done = summary["num_days"]
+            self.progress_bar.set(done / job.num_days if job.num_days else 1)
+            self.progress_label.configure(text=f"{done:,} of {job.num_days:,} days")
+        
+        if finished is None:
+            self.after(POLL_MS, self.poll_forecast)
+            return
+        
+        self.job = None
+        self.generate_button.configure(state="normal")
+        if finished == "done":
+            self.progress_row.grid_remove()
+        else:
+            self.cancel_button.configure(state="disabled")
+            done = summary["num_days"] if summary is not None else 0
+            reason = "Cancelled" if finished == "cancelled" else "Failed"
+            message = f"{reason} after {done:,} of {job.num_days:,} days"
+            self.progress_label.configure(text=f"{message}: {error}" if error else message)
+    
+    def display_results(self, data):
+        """Draw a finished forecast (period_data from predict_period_revenue) in one go"""
+        self.begin_results(data['num_days'])
+        self.update_results(data)
+        self.add_month_rows(data['columns'].monthly_totals())
+    
+    def begin_results(self, num_days):
+        """Clear the result panels for a new forecast; update_results and add_month_rows fill them in"""
+        if self.results_panel is None:
+            self.create_results_panel()
+            self.results_placeholder.pack_forget()
+            self.results_panel.pack(fill="both", expand=True)
+        
+        for label in self.metric_labels.values():
+            set_text(label, "-")
+        set_text(self.cabin_total_label, "-")
+        for label in self.cabin_breakdown_labels.values():
+            set_text(label, "-")
+        set_text(self.activity_total_label, "-")
+        set_text(self.activity_share_label, "")
+        
+        # Monthly Breakdown (if period is long enough)
+        self.month_list.set_items([])
+        self.show_months = num_days > 30
+        if self.show_months:
+            self.monthly_section.pack(fill="x", pady=(0, 20))
+        else:
+            self.monthly_section.pack_forget()
+    
+    def create_results_panel(self):
+        """Build the result panels once; later forecasts only update their labels"""
+        self.results_panel = ctk.CTkFrame(self.results_frame, fg_color="transparent")
+        
+        # Summary Cards Row
+        summary_row = ctk.CTkFrame(self.results_panel, fg_color="transparent")
+        summary_row.pack(fill="x", pady=(0, 20))
+        summary_row.grid_columnconfigure((0, 1, 2, 3), weight=1)
+        
+        self.metric_labels = {
+            "total_revenue": self.create_metric_card(summary_row, 0, "Total Revenue", "-", "#007AFF", "💰"),
+            "avg_daily_revenue": self.create_metric_card(summary_row, 1, "Avg Daily Revenue", "-", "#34C759", "📊"),
+            "avg_occupancy": self.create_metric_card(summary_row, 2, "Avg Occupancy", "-", "#FF9500", "🛏️"),
+            "num_days": self.create_metric_card(summary_row, 3, "Days Forecast", "-", "#5856D6", "📅")
+        }
+        
+        # Revenue Breakdown
+        breakdown_section = ctk.CTkFrame(self.results_panel, fg_color="#FFFFFF", corner_radius=15)
+        breakdown_section.pack(fill="x", pady=(0, 20))
+        
+        ctk.CTkLabel(
+            breakdown_section,
+            text="Revenue Breakdown",
+            font=("Helvetica Neue", 20, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w", padx=25, pady=(25, 15))
+        
+        breakdown_content = ctk.CTkFrame(breakdown_section, fg_color="transparent")
+        breakdown_content.pack(fill="x", padx=25, pady=(0, 25))
+        breakdown_content.grid_columnconfigure((0, 1), weight=1)
+        
+        # Cabin Revenue
+        cabin_frame = ctk.CTkFrame(breakdown_content, fg_color="#F5F5F7", corner_radius=12)
+        cabin_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 10), pady=5)
+        
+        ctk.CTkLabel(cabin_frame, text="🏠 Accommodation Revenue", font=("Helvetica Neue", 16, "bold"), text_color="#1D1D1F").pack(anchor="w", padx=20, pady=(20, 10))
+        self.cabin_total_label = ctk.CTkLabel(cabin_frame, text="-", font=("Helvetica Neue", 28, "bold"), text_color="#007AFF")
+        self.cabin_total_label.pack(anchor="w", padx=20)
+        
+        self.cabin_breakdown_labels = {}
+        for cabin_type, info in CABIN_INVENTORY.items():
+            row = ctk.CTkFrame(cabin_frame, fg_color="transparent")
+            row.pack(fill="x", padx=20, pady=5)
+            
+            ctk.CTkLabel(row, text=f"{info['icon']} {info['name']}", font=("Helvetica Neue", 13), text_color="#1D1D1F").pack(side="left")
+            self.cabin_breakdown_labels[cabin_type] = ctk.CTkLabel(row, text="-", font=("Helvetica Neue", 13), text_color="#86868b")
+            self.cabin_breakdown_labels[cabin_type].pack(side="right")
+        
+        ctk.CTkLabel(cabin_frame, text="").pack(pady=5)  # Spacer
+        
+        # Activity Revenue
+        activity_frame = ctk.CTkFrame(breakdown_content, fg_color="#F5F5F7", corner_radius=12)
+        activity_frame.grid(row=0, column=1, sticky="nsew", padx=(10, 0), pady=5)
+        
+        ctk.CTkLabel(activity_frame, text="🎯 Activity Revenue", font=("Helvetica Neue", 16, "bold"), text_color="#1D1D1F").pack(anchor="w", padx=20, pady=(20, 10))
+        self.activity_total_label = ctk.CTkLabel(activity_frame, text="-", font=("Helvetica Neue", 28, "bold"), text_color="#34C759")
+        self.activity_total_label.pack(anchor="w", padx=20)
+        
+        self.activity_share_label = ctk.CTkLabel(activity_frame, text="", font=("Helvetica Neue", 13), text_color="#86868b")
+        self.activity_share_label.pack(anchor="w", padx=20, pady=(5, 20))
+        
+        self.create_monthly_breakdown()
+    
+    def update_results(self, data):
+        """Show the totals in data (a full or partial period summary)"""
+        set_text(self.metric_labels["total_revenue"], f"${data['total_revenue']:,.0f}")
+        set_text(self.metric_labels["avg_daily_revenue"], f"${data['avg_daily_revenue']:,.0f}")
+        set_text(self.metric_labels["avg_occupancy"], f"{data['avg_occupancy']*100:.1f}%")
+        set_text(self.metric_labels["num_days"], f"{data['num_days']}")
+        
+        set_text(self.cabin_total_label, f"${data['total_cabin_revenue']:,.0f}")
+        for cabin_type, breakdown in data['cabin_breakdown'].items():
+            set_text(self.cabin_breakdown_labels[cabin_type], f"${breakdown['revenue']:,.0f} ({breakdown['nights_sold']:.0f} nights)")
+        
+        set_text(self.activity_total_label, f"${data['total_activity_revenue']:,.0f}")
+        activity_pct = (data['total_activity_revenue'] / data['total_revenue'] * 100) if data['total_revenue'] > 0 else 0
+        set_text(self.activity_share_label, f"{activity_pct:.1f}% of total revenue")
+    
+    def create_metric_card(self, parent, col, title, value, color, icon):
+        card = ctk.CTkFrame(parent, fg_color="#FFFFFF", corner_radius=15)
+        card.grid(row=0, column=col, sticky="nsew", padx=8, pady=5)
+        
+        inner = ctk.CTkFrame(card, fg_color="transparent")
+        inner.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        header = ctk.CTkFrame(inner, fg_color="transparent")
+        header.pack(fill="x")
+        
+        ctk.CTkLabel(header, text=icon, font=("Helvetica Neue", 24)).pack(side="left")
+        ctk.CTkLabel(header, text=title, font=("Helvetica Neue", 12), text_color="#86868b").pack(side="left", padx=(10, 0))
+        
+        value_label = ctk.CTkLabel(inner, text=value, font=("Helvetica Neue", 28, "bold"), text_color=color)
+        value_label.pack(anchor="w", pady=(10, 0))
+        return value_label
+    
+    def create_monthly_breakdown(self):
+        # Packed by begin_results for periods longer than a month
+        section = ctk.CTkFrame(self.results_panel, fg_color="#FFFFFF", corner_radius=15)
+        self.monthly_section = section
+        
+        ctk.CTkLabel(
+            section,
+            text="Monthly Forecast",
+            font=("Helvetica Neue", 20, "bold"),
+            text_color="#1D1D1F"
+        ).pack(anchor="w", padx=25, pady=(25, 15))
+        
+        # Rows are added by add_month_rows as months complete; only the
+        # visible months get widgets
+        self.month_list = VirtualList(
+            section,
+            create_row=self.create_month_row,
+            fill_row=self.fill_month_row,
+            row_height=54,
+            visible_rows=12
+        )
+        self.month_list.pack(fill="x", padx=25, pady=(0, 25))
+    
+    def create_month_row(self, parent):
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        
+        inner = ctk.CTkFrame(row, fg_color="#F5F5F7", corner_radius=8)
+        inner.pack(fill="both", expand=True, pady=3)
+        
+        row.month_label = ctk.CTkLabel(inner, text="", font=("Helvetica Neue", 14, "bold"), text_color="#1D1D1F")
+        row.month_label.pack(side="left", padx=15)
+        row.revenue_label = ctk.CTkLabel(inner, text="", font=("Helvetica Neue", 14, "bold"), text_color="#007AFF")
+        row.revenue_label.pack(side="right", padx=15)
+        return row
+    
+    def fill_month_row(self, row, month_totals):
+        year, month, revenue, days = month_totals
+        row.month_label.configure(text=f"{calendar.month_name[month]} {year}")
+        row.revenue_label.configure(text=f"${revenue:,.0f}")
+    
+    def add_month_rows(self, months):
+        """Append (year, month, revenue, days) rows to the monthly breakdown"""
+        if self.show_months:
+            self.month_list.append_items(months)
+
+
+# Instrumentation points (see instrumentation.py); timed only while enabled
+instrument(RevenuePredictionApp, "update_results", "ui.forecast_results")
+instrument(RevenuePredictionApp, "add_month_rows", "ui.month_rows")
+instrument(RevenuePredictionApp, "poll_forecast", "ui.poll_forecast")
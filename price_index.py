@@ -0,0 +1,111 @@
+"""
+Prefix-Sum Price Index
+
+A nightly price depends only on the date, the cabin type (through its noise
+stream) and the booking window tier. For every (cabin type, tier) pair the
+index keeps the nightly base prices over whole calendar years together with
+their running (prefix) sums, so the base room total for any check-in /
+check-out pair is prefix[check_out] - prefix[check_in]: two array lookups
+instead of one formula evaluation per night.
+
+Tables are built lazily, one calendar year each and only for the years that
+are requested (a stay across New Year reads two), and dropped when the
+engine's pricing parameters or the calendar configuration change.
+"""
+
+from array import array
+from datetime import date
+import threading
+
+
+class PriceTable:
+    """Nightly base prices and their prefix sums from origin (an ordinal) onward"""
+
+    __slots__ = ("origin", "prices", "prefix")
+
+    def __init__(self, origin, prices):
+        self.origin = origin
+        self.prices = prices
+        self.prefix = array("d", [0.0])
+        running = 0.0
+        for price in prices:
+            running += price
+            self.prefix.append(running)
+
+    @property
+    def end(self):
+        return self.origin + len(self.prices)
+
+
+class PriceIndex:
+    """Per (cabin type, tier, year) prefix sums of nightly base prices for an engine
+
+    tier_days_until gives, for each booking window tier, a lead time that
+    falls in that tier; prices are evaluated with it.
+    """
+
+    def __init__(self, engine, tier_days_until):
+        self.engine = engine
+        self.tier_days_until = tuple(tier_days_until)
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop every table; they are rebuilt on next use
+
+        generation counts invalidations, so callers holding prices read
+        from the index can tell when they are stale.
+        """
+        with self._lock:
+            self._invalidate()
+
+    def _invalidate(self):
+        # Called with the lock held. Tables are only built under the lock
+        # too, so one built from the old parameters cannot be stored after
+        # this has run.
+        self._tables = {}
+        self._calendar_version = self.engine.calendar.version
+        self.generation += 1
+
+    def year_table(self, cabin_type, tier, year):
+        """Table for (cabin_type, tier) covering one calendar year"""
+        key = (cabin_type, tier, year)
+        table = self._tables.get(key) if self.engine.calendar.version == self._calendar_version else None
+        if table is None:
+            with self._lock:
+                if self.engine.calendar.version != self._calendar_version:
+                    self._invalidate()
+                table = self._tables.get(key)
+                if table is None:
+                    origin = date(year, 1, 1).toordinal()
+                    end = date(year, 12, 31).toordinal() + 1
+                    table = PriceTable(origin, array("d", [self._price(cabin_type, tier, ordinal)
+                                                           for ordinal in range(origin, end)]))
+                    self._tables[key] = table
+        return table
+
+    def _spans(self, cabin_type, tier, start, end):
+        # (table, first, stop) per calendar year of [start, end), as offsets into the year's table
+        while start < end:
+            table = self.year_table(cabin_type, tier, date.fromordinal(start).year)
+            stop = min(end, table.end)
+            yield table, start - table.origin, stop - table.origin
+            start = stop
+
+    def _price(self, cabin_type, tier, ordinal):
+        return self.engine.calculate_price_for_date(date.fromordinal(ordinal), self.tier_days_until[tier], cabin_type)
+
+    def range_total(self, cabin_type, tier, start_date, end_date):
+        """Sum of nightly base prices for the nights in [start_date, end_date)"""
+        total = 0.0
+        for table, first, stop in self._spans(cabin_type, tier, start_date.toordinal(), end_date.toordinal()):
+            total += table.prefix[stop] - table.prefix[first]
+        return total
+
+    def nightly_prices(self, cabin_type, tier, start_date, end_date):
+        """Nightly base prices for [start_date, end_date) without re-evaluating the formula"""
+        prices = []
+        for table, first, stop in self._spans(cabin_type, tier, start_date.toordinal(), end_date.toordinal()):
+            prices.extend(table.prices[first:stop])
+        return prices
@@ -0,0 +1,227 @@
+"""
+Revenue-Maximizing Price Optimizer
+
+Searches, per season, the BASE_PRICE and the per-cabin-type multipliers that
+maximize expected revenue (cabin plus activity revenue) when occupancy
+responds to price (see calculate_elastic_occupancy_rate in
+predicted_revenue.py).
+
+Every candidate is evaluated in one NumPy batch: for each cabin type the
+revenue of every (base price, multiplier) pair on every day of the range is
+a days x base prices x multipliers array, summed per season with a single
+matrix product. Cabin types only interact through the shared base price, so
+for each season and base price the best multiplier of each cabin type is
+picked independently, and then the best base price. From the command line:
+
+    python3 price_optimizer.py 2027-01-01 2028-01-01
+    python3 price_optimizer.py 2027-01-01 2028-01-01 --base-range 60 250 --base-steps 39
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from calendar_factors import SEASONS
+from forecast_vectorized import (activity_rate_by_season, base_price_array, calendar_arrays, holiday_modifier_array,
+                                 predict_period_revenue_vectorized)
+from noise import noise_uniform_array
+import predicted_revenue as model
+
+GUESTS_PER_CABIN = 2
+
+def default_base_prices(steps=31):
+    """Candidate base prices: 50% to 200% of BASE_PRICE"""
+    return np.linspace(0.5, 2.0, steps) * model.BASE_PRICE
+
+def default_multipliers(inventory, steps=13):
+    """Candidate multipliers per cabin type: 70% to 130% of its current multiplier"""
+    scale = np.linspace(0.7, 1.3, steps)
+    return {cabin_type: info["multiplier"] * scale for cabin_type, info in inventory.items()}
+
+
+def _edge(index, size):
+    # "low"/"high" when a pick is the first/last of several candidates
+    if size > 1 and index == 0:
+        return "low"
+    if size > 1 and index == size - 1:
+        return "high"
+    return None
+
+def optimize_prices(start_date, end_date, base_prices=None, multipliers=None, inventory=None,
+                    elasticity=None, seasonal_occupancy=None, holiday_boost=None, activities=None):
+    """Best base price per season and multiplier per cabin type and season.
+
+    base_prices is a sequence of candidate base prices and multipliers a
+    {cabin_type: candidate multipliers} dict (defaults: default_base_prices
+    and default_multipliers). Returns the schedule per season with its
+    expected revenue and occupancy, the totals of the whole schedule, and
+    the same figures at the current prices as "baseline".
+
+    A pick on the first or last of its candidates is not known to be an
+    optimum: revenue may keep rising past the searched range, as it always
+    does with price for a cabin type whose elasticity is below 1. Such picks
+    are marked with "base_price_edge" / "multiplier_edge" ("low" or "high",
+    else None) and listed in "at_edge".
+    """
+    inventory = inventory or model.CABIN_INVENTORY
+    elasticity = elasticity or model.PRICE_ELASTICITY
+    seasonal_occupancy = seasonal_occupancy or model.SEASONAL_OCCUPANCY
+    base_prices = np.asarray(default_base_prices() if base_prices is None else base_prices, dtype=np.float64)
+    multipliers = multipliers or default_multipliers(inventory)
+    if not len(base_prices) or np.any(base_prices <= 0):
+        raise ValueError("base_prices must be a non-empty sequence of positive prices")
+    for cabin_type in inventory:
+        candidates = np.asarray(multipliers.get(cabin_type, ()), dtype=np.float64)
+        if not len(candidates) or np.any(candidates <= 0):
+            raise ValueError(f"{cabin_type}: multipliers must be a non-empty sequence of positive values")
+        if cabin_type not in elasticity:
+            raise ValueError(f"{cabin_type}: no price elasticity")
+
+    days = calendar_arrays(start_date, end_date)
+    num_days = len(days["ordinals"])
+    # season x day indicator: summing a day array per season is one matmul
+    season_days = (days["season"][None, :] == np.arange(len(SEASONS))[:, None]).astype(np.float64)
+    demand_mod = np.array([seasonal_occupancy[s] for s in SEASONS])[days["season"]] \
+        * holiday_modifier_array(days, holiday_boost)
+    guest_revenue = GUESTS_PER_CABIN * activity_rate_by_season(activities)[days["season"]]
+
+    evaluated = {}
+    for cabin_type, info in inventory.items():
+        candidates = np.asarray(multipliers[cabin_type], dtype=np.float64)
+        # Nightly price = base price * multiplier * day factor (seasonality and noise)
+        noise = noise_uniform_array(days["ordinals"], cabin_type, -0.02, 0.02)
+        day_factor = base_price_array(days["seasonality"], noise) / model.BASE_PRICE
+        level = np.multiply.outer(base_prices, candidates)                    # (base, mult)
+        relative = level / (model.BASE_PRICE * info["multiplier"])
+        demand = info["base_occupancy"] * demand_mod
+        occupancy = np.minimum(demand[:, None, None] * relative[None] ** -elasticity[cabin_type],
+                               model.OCCUPANCY_CAP)                           # (day, base, mult)
+        occupied = info["count"] * occupancy
+        room = occupied * day_factor[:, None, None] * level[None]
+        activity = occupied * guest_revenue[:, None, None]
+
+        shape = (len(SEASONS), len(base_prices), len(candidates))
+        evaluated[cabin_type] = {
+            "multipliers": candidates,
+            "room": (season_days @ room.reshape(num_days, -1)).reshape(shape),
+            "activity": (season_days @ activity.reshape(num_days, -1)).reshape(shape),
+            "occupied": (season_days @ occupied.reshape(num_days, -1)).reshape(shape)
+        }
+
+    season_lengths = season_days.sum(axis=1)
+    total_count = sum(info["count"] for info in inventory.values())
+    schedule = {}
+    for s, season in enumerate(SEASONS):
+        if not season_lengths[s]:
+            continue
+        # Best multiplier per cabin type for every base price, then the best base price
+        best = {}
+        season_revenue = np.zeros(len(base_prices))
+        for cabin_type, data in evaluated.items():
+            revenue = data["room"][s] + data["activity"][s]
+            best[cabin_type] = revenue.argmax(axis=1)
+            season_revenue += revenue.max(axis=1)
+        b = int(season_revenue.argmax())
+
+        cabins = {}
+        for cabin_type, data in evaluated.items():
+            m = int(best[cabin_type][b])
+            occupied = data["occupied"][s, b, m]
+            cabins[cabin_type] = {
+                "multiplier": float(data["multipliers"][m]),
+                "multiplier_edge": _edge(m, len(data["multipliers"])),
+                "avg_nightly_price": float(data["room"][s, b, m] / occupied) if occupied else 0.0,
+                "occupancy": float(occupied / (inventory[cabin_type]["count"] * season_lengths[s]))
+                if inventory[cabin_type]["count"] else 0.0,
+                "cabin_revenue": float(data["room"][s, b, m]),
+                "activity_revenue": float(data["activity"][s, b, m])
+            }
+        schedule[season] = {
+            "days": int(season_lengths[s]),
+            "base_price": float(base_prices[b]),
+            "base_price_edge": _edge(b, len(base_prices)),
+            "cabins": cabins,
+            "revenue": float(season_revenue[b]),
+            "occupancy": sum(c["occupancy"] * inventory[k]["count"] for k, c in cabins.items()) / total_count
+            if total_count else 0.0
+        }
+
+    at_edge = []
+    for season, plan in schedule.items():
+        if plan["base_price_edge"]:
+            at_edge.append(f"{season} base price ({plan['base_price_edge']})")
+        at_edge.extend(f"{season} {cabin_type} multiplier ({cabin['multiplier_edge']})"
+                       for cabin_type, cabin in plan["cabins"].items() if cabin["multiplier_edge"])
+
+    cabin_revenue = sum(c["cabin_revenue"] for p in schedule.values() for c in p["cabins"].values())
+    activity_revenue = sum(c["activity_revenue"] for p in schedule.values() for c in p["cabins"].values())
+    occupied_nights = sum(p["occupancy"] * p["days"] for p in schedule.values()) * total_count
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "num_days": num_days,
+        "candidates": len(base_prices) * sum(len(d["multipliers"]) for d in evaluated.values()),
+        "schedule": schedule,
+        "at_edge": at_edge,
+        "expected_revenue": cabin_revenue + activity_revenue,
+        "expected_cabin_revenue": cabin_revenue,
+        "expected_activity_revenue": activity_revenue,
+        "expected_occupancy": occupied_nights / (total_count * num_days) if total_count and num_days else 0.0,
+        "baseline": _baseline(start_date, end_date, inventory, seasonal_occupancy, holiday_boost, activities)
+    }
+
+def _baseline(start_date, end_date, inventory, seasonal_occupancy, holiday_boost, activities):
+    # At the current prices the elastic model equals the standard forecast
+    result = predict_period_revenue_vectorized(start_date, end_date, inventory=inventory,
+                                               seasonal_occupancy=seasonal_occupancy,
+                                               holiday_boost=holiday_boost, activities=activities)
+    return {
+        "base_price": model.BASE_PRICE,
+        "multipliers": {cabin_type: info["multiplier"] for cabin_type, info in inventory.items()},
+        "revenue": result["total_revenue"],
+        "occupancy": result["avg_occupancy"]
+    }
+
+
+def main(argv=None):
+    from pricing_engine import parse_date
+
+    parser = argparse.ArgumentParser(description="Find the revenue-maximizing prices per season.")
+    parser.add_argument("start_date", help="YYYY-MM-DD")
+    parser.add_argument("end_date", help="YYYY-MM-DD")
+    parser.add_argument("--base-range", nargs=2, type=float, metavar=("MIN", "MAX"),
+                        help="base price range to search (default: 50%%-200%% of BASE_PRICE)")
+    parser.add_argument("--base-steps", type=int, default=31, help="base prices tried")
+    parser.add_argument("--multiplier-steps", type=int, default=13, help="multipliers tried per cabin type")
+    args = parser.parse_args(argv)
+
+    start_date, end_date = parse_date(args.start_date), parse_date(args.end_date)
+    if end_date <= start_date:
+        parser.error("end_date must be after start_date")
+    base_prices = np.linspace(*args.base_range, args.base_steps) if args.base_range \
+        else default_base_prices(args.base_steps)
+
+    result = optimize_prices(start_date, end_date, base_prices=base_prices,
+                             multipliers=default_multipliers(model.CABIN_INVENTORY, args.multiplier_steps))
+    def edge_note(edge):
+        return f"   * {edge} edge of range" if edge else ""
+
+    for season, plan in result["schedule"].items():
+        print(f"{season:<8} base ${plan['base_price']:.2f}   revenue ${plan['revenue']:,.0f}   "
+              f"occupancy {plan['occupancy']:.1%}{edge_note(plan['base_price_edge'])}")
+        for cabin_type, cabin in plan["cabins"].items():
+            print(f"    {cabin_type:<12} x{cabin['multiplier']:.2f}   avg ${cabin['avg_nightly_price']:.2f}/night   "
+                  f"occupancy {cabin['occupancy']:.1%}{edge_note(cabin['multiplier_edge'])}")
+    baseline = result["baseline"]
+    change = result["expected_revenue"] / baseline["revenue"] - 1 if baseline["revenue"] else 0.0
+    print(f"Expected revenue ${result['expected_revenue']:,.0f} (occupancy {result['expected_occupancy']:.1%}); "
+          f"current prices ${baseline['revenue']:,.0f} (occupancy {baseline['occupancy']:.1%}), {change:+.1%}")
+    if result["at_edge"]:
+        print(f"* {len(result['at_edge'])} picks are on the edge of the searched range: revenue may keep rising "
+              "beyond it, so they are not known optima.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,543 @@
+"""
+Pricing Configuration
+
+Every tunable table of the quote calculator and the revenue model (cabin
+types and inventory, activities, prices and weights, booking window tiers,
+occupancy assumptions and, optionally, the calendar factors) is defined once
+in DEFAULT_CONFIG and can be replaced from a JSON or TOML file:
+
+    python3 pricing_config.py dump > pricing.json      # the defaults, as a starting point
+    python3 pricing_config.py check pricing.json       # validate a file
+    CABIN_PRICING_CONFIG=pricing.json python3 dynamic_pricing.py
+
+A configuration is validated once and compiled into a PricingTables object:
+read-only mappings and tuples (plus its own calendar factor index) that
+PricingEngine and the forecast read directly. Top-level sections missing from
+a file keep their default. CABIN_PRICING_CONFIG replaces the defaults for the
+whole process at import; a long-running process can instead follow a file
+with ConfigWatcher, which compiles each new version off to the side and hands
+it over complete, so readers never see a half-loaded configuration.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from types import MappingProxyType
+
+from calendar_factors import (CALENDAR, DEFAULT_HOLIDAYS, MONTHLY_FACTORS, SEASONS, WEEKEND_DAYS, WEEKEND_FACTOR,
+                              CalendarFactorIndex)
+from holiday_calendar import rule_from_config
+
+logger = logging.getLogger(__name__)
+
+CONFIG_ENV = "CABIN_PRICING_CONFIG"
+CALENDAR_KEYS = ("monthly_factors", "weekend_factor", "weekend_days", "holidays")
+
+DEFAULT_CONFIG = {
+    "base_price": 100.0,
+    "competitor_price": 100.0,
+    "weights": {
+        "seasonality": 0.3,
+        "competitor": 0.25,
+        "booking_window": 0.2,
+        "external": 0.15,
+        "noise": 0.1
+    },
+    "external_factors": {"weather": 1.0, "event": 1.0},
+    "booking_window": {
+        # [minimum days until check-in, factor], longest lead time first
+        "tiers": [
+            [30, 0.85],  # Early booking discount
+            [14, 0.90],  # Standard advance booking
+            [7, 0.95],   # Short-term booking
+            [3, 1.0],    # Normal rate
+            [1, 1.15]    # Last-minute premium
+        ],
+        "same_day_factor": 1.25
+    },
+    "occupancy": {
+        "cap": 0.95,
+        "seasonal": {
+            "winter": 1.1,   # Dec, Jan, Feb - second best (skiing season in mountains)
+            "spring": 0.85,  # Mar, Apr, May
+            "summer": 1.2,   # Jun, Jul, Aug - peak season
+            "fall": 0.75     # Sep, Oct, Nov - lowest season
+        },
+        "holiday_boost": {
+            "major": 1.5,    # Dec 24, 25, 31, Jan 1
+            "season": 1.3,   # Dec 20-30, Jan 2-3
+            "weekend": 1.15  # Fri, Sat, Sun
+        }
+    },
+    # count and base_occupancy drive the forecast; elasticity is the price
+    # elasticity of demand (see calculate_elastic_occupancy_rate)
+    "cabins": {
+        "forest": {
+            "name": "Forest Cabin",
+            "description": "Cozy cabin nestled in the woods.",
+            "icon": "🌲",
+            "multiplier": 1.0,
+            "count": 4,
+            "base_occupancy": 0.65,
+            "elasticity": 1.4
+        },
+        "treehouse": {
+            "name": "Treehouse Cabin",
+            "description": "Elevated living with panoramic views.",
+            "icon": "🏡",
+            "multiplier": 1.8,
+            "count": 3,
+            "base_occupancy": 0.55,
+            "elasticity": 1.1
+        },
+        "lakeview": {
+            "name": "Lakeview Cabin",
+            "description": "Luxury waterfront villa with private dock.",
+            "icon": "🏖️",
+            "multiplier": 2.8,
+            "count": 3,
+            "base_occupancy": 0.45,
+            "elasticity": 0.8
+        }
+    },
+    "activities": {
+        "hiking": {"name": "Guided Hiking", "price": 20, "seasons": ["spring", "summer", "fall", "winter"],
+                   "icon": "🥾", "participation_rate": 0.4},
+        "kayaking": {"name": "Kayaking", "price": 40, "seasons": ["spring", "summer", "fall"],
+                     "icon": "🛶", "participation_rate": 0.35},
+        "bike": {"name": "Bike Rentals", "price": 30, "seasons": ["spring", "summer", "fall"],
+                 "icon": "🚴", "participation_rate": 0.3},
+        "hunting": {"name": "Hunting Tour", "price": 150, "seasons": ["fall", "winter"],
+                    "icon": "🎯", "participation_rate": 0.15},
+        "bungee": {"name": "Bungee Jumping", "price": 100, "seasons": ["summer"],
+                   "icon": "🪂", "participation_rate": 0.1},
+        "zipline": {"name": "Zipline", "price": 60, "seasons": ["spring", "summer", "fall"],
+                    "icon": "🎿", "participation_rate": 0.25},
+        "tubing": {"name": "Couch Tubing / Banana Boat", "price": 45, "seasons": ["summer"],
+                   "icon": "🍌", "participation_rate": 0.2}
+    }
+    # "calendar": {"monthly_factors": [12 factors, Jan-Dec], "weekend_factor": ..., "weekend_days": [4, 5, 6],
+    #              "holidays": [{"name": "Christmas", "date": "12-25", "factor": 5.0, "major": true},
+    #                           {"from": "12-20", "to": "12-30", "factor": 3.5},
+    #                           {"month": 11, "weekday": 3, "n": 4, "factor": 2.0, "boost": 1.3},
+    #                           {"easter": -2, "days": 4, "factor": 1.5}, ...]}
+    # (holiday rule syntax: see holiday_calendar.rule_from_config). Without a
+    # calendar section the tables in calendar_factors.py are used.
+}
+
+
+class ConfigError(ValueError):
+    """A configuration file that cannot be read or does not validate"""
+
+
+# --- Loading ---
+
+def load_config(path):
+    """Read a configuration file (.toml, else JSON) into a dict"""
+    try:
+        if path.endswith(".toml"):
+            try:
+                import tomllib
+            except ImportError:
+                raise ConfigError("TOML configuration needs Python 3.11+ (tomllib); use JSON instead") from None
+            with open(path, "rb") as f:
+                return tomllib.load(f)
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except OSError as e:
+        raise ConfigError(f"Cannot read {path}: {e.strerror}") from None
+    except ValueError as e:
+        if isinstance(e, ConfigError):
+            raise
+        raise ConfigError(f"{path}: {e}") from None
+
+
+# --- Validation ---
+
+def _number(value, where, minimum=None, maximum=None, positive=False):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ConfigError(f"{where} must be a number")
+    if positive and value <= 0:
+        raise ConfigError(f"{where} must be positive")
+    if minimum is not None and value < minimum:
+        raise ConfigError(f"{where} must be at least {minimum}")
+    if maximum is not None and value > maximum:
+        raise ConfigError(f"{where} must be at most {maximum}")
+    return value
+
+def _section(config, key):
+    value = config[key]
+    if not isinstance(value, dict):
+        raise ConfigError(f"{key} must be a table/object")
+    return value
+
+def _list(value, where):
+    if not isinstance(value, list):
+        raise ConfigError(f"{where} must be a list")
+    return value
+
+def _keys(table, required, where):
+    missing = [key for key in required if key not in table]
+    if missing:
+        raise ConfigError(f"{where} is missing {', '.join(missing)}")
+    unknown = [key for key in table if key not in required]
+    if unknown:
+        raise ConfigError(f"{where} has unknown keys {', '.join(unknown)}")
+
+def validate_config(raw):
+    """Check a configuration dict; returns the normalized configuration.
+
+    Top-level sections that are missing take their DEFAULT_CONFIG value.
+    Raises ConfigError describing the first problem found.
+    """
+    if not isinstance(raw, dict):
+        raise ConfigError("Configuration must be a table/object")
+    allowed = set(DEFAULT_CONFIG) | {"calendar"}
+    unknown = [key for key in raw if key not in allowed]
+    if unknown:
+        raise ConfigError(f"Unknown configuration sections: {', '.join(unknown)}")
+    config = {**DEFAULT_CONFIG, **raw}
+
+    result = {
+        "base_price": _number(config["base_price"], "base_price", positive=True),
+        "competitor_price": _number(config["competitor_price"], "competitor_price", minimum=0)
+    }
+
+    weights = _section(config, "weights")
+    _keys(weights, DEFAULT_CONFIG["weights"], "weights")
+    result["weights"] = {key: _number(value, f"weights.{key}") for key, value in weights.items()}
+
+    external = _section(config, "external_factors")
+    _keys(external, DEFAULT_CONFIG["external_factors"], "external_factors")
+    result["external_factors"] = {key: _number(value, f"external_factors.{key}", positive=True)
+                                  for key, value in external.items()}
+
+    window = _section(config, "booking_window")
+    _keys(window, DEFAULT_CONFIG["booking_window"], "booking_window")
+    tiers = []
+    for i, tier in enumerate(_list(window["tiers"], "booking_window.tiers")):
+        if not isinstance(tier, (list, tuple)) or len(tier) != 2:
+            raise ConfigError(f"booking_window.tiers[{i}] must be [minimum days, factor]")
+        min_days = tier[0]
+        if isinstance(min_days, bool) or not isinstance(min_days, int) or min_days < 1:
+            raise ConfigError(f"booking_window.tiers[{i}] minimum days must be a whole number of at least 1")
+        if tiers and min_days >= tiers[-1][0]:
+            raise ConfigError("booking_window.tiers must be ordered from the longest lead time down")
+        tiers.append([min_days, _number(tier[1], f"booking_window.tiers[{i}] factor", positive=True)])
+    result["booking_window"] = {
+        "tiers": tiers,
+        "same_day_factor": _number(window["same_day_factor"], "booking_window.same_day_factor", positive=True)
+    }
+
+    occupancy = _section(config, "occupancy")
+    _keys(occupancy, DEFAULT_CONFIG["occupancy"], "occupancy")
+    for key in ("seasonal", "holiday_boost"):
+        if not isinstance(occupancy[key], dict):
+            raise ConfigError(f"occupancy.{key} must be a table/object")
+    _keys(occupancy["seasonal"], SEASONS, "occupancy.seasonal")
+    _keys(occupancy["holiday_boost"], DEFAULT_CONFIG["occupancy"]["holiday_boost"], "occupancy.holiday_boost")
+    result["occupancy"] = {
+        "cap": _number(occupancy["cap"], "occupancy.cap", maximum=1.0, positive=True),
+        "seasonal": {season: _number(occupancy["seasonal"][season], f"occupancy.seasonal.{season}", positive=True)
+                     for season in SEASONS},
+        "holiday_boost": {key: _number(value, f"occupancy.holiday_boost.{key}", positive=True)
+                          for key, value in occupancy["holiday_boost"].items()}
+    }
+
+    cabins = _section(config, "cabins")
+    if not cabins:
+        raise ConfigError("cabins must define at least one cabin type")
+    result["cabins"] = {}
+    for key, cabin in cabins.items():
+        where = f"cabins.{key}"
+        if not isinstance(cabin, dict):
+            raise ConfigError(f"{where} must be a table/object")
+        cabin = {"description": "", "icon": "", **cabin}
+        _keys(cabin, DEFAULT_CONFIG["cabins"]["forest"], where)
+        count = cabin["count"]
+        if isinstance(count, bool) or not isinstance(count, int) or count < 0:
+            raise ConfigError(f"{where}.count must be a whole number of at least 0")
+        result["cabins"][key] = {
+            "name": str(cabin["name"]),
+            "description": str(cabin["description"]),
+            "icon": str(cabin["icon"]),
+            "multiplier": _number(cabin["multiplier"], f"{where}.multiplier", positive=True),
+            "count": count,
+            "base_occupancy": _number(cabin["base_occupancy"], f"{where}.base_occupancy", minimum=0, maximum=1),
+            "elasticity": _number(cabin["elasticity"], f"{where}.elasticity", minimum=0)
+        }
+
+    activities = _section(config, "activities")
+    result["activities"] = {}
+    for key, activity in activities.items():
+        where = f"activities.{key}"
+        if not isinstance(activity, dict):
+            raise ConfigError(f"{where} must be a table/object")
+        activity = {"icon": "", **activity}
+        _keys(activity, DEFAULT_CONFIG["activities"]["hiking"], where)
+        seasons = activity["seasons"]
+        if not isinstance(seasons, list) or not seasons or any(not isinstance(s, str) or s not in SEASONS
+                                                               for s in seasons):
+            raise ConfigError(f"{where}.seasons must list one or more of {', '.join(SEASONS)}")
+        result["activities"][key] = {
+            "name": str(activity["name"]),
+            "price": _number(activity["price"], f"{where}.price", minimum=0),
+            "seasons": list(seasons),
+            "icon": str(activity["icon"]),
+            "participation_rate": _number(activity["participation_rate"], f"{where}.participation_rate",
+                                          minimum=0, maximum=1)
+        }
+
+    if "calendar" in config:
+        result["calendar"] = _validate_calendar(_section(config, "calendar"))
+    return result
+
+def _validate_calendar(calendar):
+    unknown = [key for key in calendar if key not in CALENDAR_KEYS]
+    if unknown:
+        raise ConfigError(f"calendar has unknown keys {', '.join(unknown)}")
+    result = {}
+    if "monthly_factors" in calendar:
+        factors = calendar["monthly_factors"]
+        if not isinstance(factors, list) or len(factors) != 12:
+            raise ConfigError("calendar.monthly_factors must list 12 factors, January first")
+        result["monthly_factors"] = [_number(f, f"calendar.monthly_factors[{i}]", positive=True)
+                                     for i, f in enumerate(factors)]
+    if "weekend_factor" in calendar:
+        result["weekend_factor"] = _number(calendar["weekend_factor"], "calendar.weekend_factor", positive=True)
+    if "weekend_days" in calendar:
+        days = calendar["weekend_days"]
+        if not isinstance(days, list) or any(isinstance(d, bool) or d not in range(7) for d in days):
+            raise ConfigError("calendar.weekend_days must list weekdays 0-6 (Monday is 0)")
+        result["weekend_days"] = list(days)
+    if "holidays" in calendar:
+        if not isinstance(calendar["holidays"], list):
+            raise ConfigError("calendar.holidays must be a list")
+        result["holidays"] = []
+        for i, holiday in enumerate(calendar["holidays"]):
+            try:
+                rule = rule_from_config(holiday)
+            except ValueError as e:
+                raise ConfigError(f"calendar.holidays[{i}] {e}") from None
+            result["holidays"].append(rule.to_config())
+    return result
+
+def default_calendar():
+    """The calendar section equivalent to the tables in calendar_factors.py"""
+    return {
+        "monthly_factors": [MONTHLY_FACTORS[month] for month in range(1, 13)],
+        "weekend_factor": WEEKEND_FACTOR,
+        "weekend_days": list(WEEKEND_DAYS),
+        "holidays": [rule.to_config() for rule in DEFAULT_HOLIDAYS]
+    }
+
+def calendar_arguments(calendar):
+    """CalendarFactorIndex keyword arguments for a validated calendar section"""
+    kwargs = {}
+    if "monthly_factors" in calendar:
+        kwargs["monthly_factors"] = {month: f for month, f in enumerate(calendar["monthly_factors"], start=1)}
+    if "weekend_factor" in calendar:
+        kwargs["weekend_factor"] = calendar["weekend_factor"]
+    if "weekend_days" in calendar:
+        kwargs["weekend_days"] = calendar["weekend_days"]
+    if "holidays" in calendar:
+        # Later entries override earlier ones for the same day
+        kwargs["holidays"] = [rule_from_config(holiday) for holiday in calendar["holidays"]]
+    return kwargs
+
+
+# --- Compiled tables ---
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class PricingTables:
+    """Read-only lookup tables compiled from one validated configuration
+
+    Mappings are MappingProxyType views and sequences are tuples, so one
+    PricingTables can be shared by any number of engines and threads. The
+    calendar index builds its per-year arrays on first use but is never
+    reconfigured. digest identifies the configuration's content.
+    """
+
+    __slots__ = ("digest", "source", "config_json", "base_price", "competitor_price", "weights",
+                 "external_factors", "booking_window_tiers", "same_day_factor", "tier_days_until",
+                 "occupancy_cap", "seasonal_occupancy", "holiday_boost", "cabins", "price_elasticity",
+                 "activities", "activity_season_masks", "activity_rates", "calendar")
+
+    def __init__(self, config, source=None, calendar=None):
+        set_ = object.__setattr__
+        config_json = json.dumps(config, sort_keys=True, ensure_ascii=False)
+        set_(self, "config_json", config_json)
+        set_(self, "digest", hashlib.sha256(config_json.encode("utf-8")).hexdigest()[:16])
+        set_(self, "source", source)
+        set_(self, "base_price", config["base_price"])
+        set_(self, "competitor_price", config["competitor_price"])
+        set_(self, "weights", _freeze(config["weights"]))
+        set_(self, "external_factors", _freeze(config["external_factors"]))
+
+        window = config["booking_window"]
+        set_(self, "booking_window_tiers", _freeze(window["tiers"]))
+        set_(self, "same_day_factor", window["same_day_factor"])
+        # A lead time inside each tier, used to price the tier as a whole
+        set_(self, "tier_days_until", tuple(min_days for min_days, _ in window["tiers"]) + (0,))
+
+        occupancy = config["occupancy"]
+        set_(self, "occupancy_cap", occupancy["cap"])
+        set_(self, "seasonal_occupancy", _freeze(occupancy["seasonal"]))
+        set_(self, "holiday_boost", _freeze(occupancy["holiday_boost"]))
+
+        set_(self, "cabins", _freeze(config["cabins"]))
+        set_(self, "price_elasticity", MappingProxyType({k: c["elasticity"] for k, c in config["cabins"].items()}))
+        set_(self, "activities", _freeze(config["activities"]))
+        # Seasons each activity is offered in, as a mask (bit i = SEASONS[i])
+        set_(self, "activity_season_masks", MappingProxyType({
+            key: sum(1 << SEASONS.index(s) for s in set(activity["seasons"]))
+            for key, activity in config["activities"].items()
+        }))
+        # Expected activity revenue per guest-night in each season
+        set_(self, "activity_rates", MappingProxyType({
+            season: sum(a["participation_rate"] * a["price"] for a in config["activities"].values()
+                        if season in a["seasons"])
+            for season in SEASONS
+        }))
+
+        kwargs = calendar_arguments(config.get("calendar", {}))
+        if calendar is None:
+            calendar = CalendarFactorIndex(**kwargs)
+        elif kwargs:
+            calendar.configure(**kwargs)
+        set_(self, "calendar", calendar)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PricingTables is read-only")
+
+    def config(self):
+        """The validated configuration as a new plain dict (e.g. to send to another process)"""
+        return json.loads(self.config_json)
+
+
+def compile_config(raw, source=None, calendar=None):
+    """Validate a configuration dict and compile it into PricingTables"""
+    return PricingTables(validate_config(raw), source, calendar)
+
+def load_tables(path):
+    """Load, validate and compile a configuration file"""
+    return compile_config(load_config(path), source=os.path.abspath(path))
+
+def _default_tables():
+    path = os.environ.get(CONFIG_ENV)
+    raw = load_config(path) if path else DEFAULT_CONFIG
+    # The process-wide defaults share calendar_factors.CALENDAR, so code
+    # using it directly sees the same calendar
+    return compile_config(raw, source=os.path.abspath(path) if path else None, calendar=CALENDAR)
+
+DEFAULT_TABLES = _default_tables()
+
+
+# --- Hot reload ---
+
+class ConfigWatcher:
+    """Follows a configuration file and compiles each new version
+
+    A daemon thread polls the file's modification time and size every
+    interval seconds. A changed file is loaded, validated and compiled on
+    that thread, then on_reload(tables) is called with the finished
+    PricingTables; the caller swaps it in with a single assignment. A file
+    that fails to load, or that on_reload refuses by raising, leaves the
+    current tables in place and is reported in last_error until a later
+    version loads. Unexpected errors are also logged; the thread keeps
+    polling either way.
+    """
+
+    def __init__(self, path, on_reload, interval=1.0):
+        self.path = path
+        self.on_reload = on_reload
+        self.interval = interval
+        self.reloads = 0
+        self.last_error = None
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self):
+        """Reload if the file changed since the last check; returns True if new tables were handed over"""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            tables = load_tables(self.path)
+            self.on_reload(tables)
+        except ConfigError as e:
+            self.last_error = str(e)
+            return False
+        except Exception as e:
+            logger.exception("Keeping the current configuration; reloading %s failed", self.path)
+            self.last_error = f"{self.path}: {type(e).__name__}: {e}"
+            return False
+        self.reloads += 1
+        self.last_error = None
+        return True
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Configuration watcher check failed")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate or print pricing configuration files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check = subparsers.add_parser("check", help="validate a JSON/TOML configuration file")
+    check.add_argument("path")
+    subparsers.add_parser("dump", help="print the default configuration (with its calendar) as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "dump":
+        config = validate_config({**DEFAULT_CONFIG, "calendar": default_calendar()})
+        json.dump(config, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return 0
+    try:
+        tables = load_tables(args.path)
+    except ConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"OK: {len(tables.cabins)} cabin types, {len(tables.activities)} activities, "
+          f"{'custom' if 'calendar' in tables.config() else 'default'} calendar (digest {tables.digest})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
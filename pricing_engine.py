@@ -0,0 +1,392 @@
+"""
+Headless Pricing Engine for Cabin Booking Quotes
+
+All of the quote math used by the booking calculator lives here so it can be
+called without a GUI:
+- Seasonality, booking window and nightly price calculations
+- Single quotes and batch quotes for many requests in one call
+- Optionally, checking quotes against a reservation ledger (reservations.py)
+
+The booking calculator in dynamic_pricing_app.py is a thin client of this engine.
+"""
+
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
+import sys
+from types import MappingProxyType
+
+from calendar_factors import HOLIDAY_NONE, SEASONS, season_index
+from instrumentation import instrument
+from noise import NOISE_SEED, noise_uniform
+from price_index import PriceIndex
+from pricing_config import DEFAULT_TABLES
+
+# Cabin types, activities and pricing parameters come from the pricing
+# configuration (pricing_config.py); these names are read-only views of the
+# process-wide default tables.
+CABIN_TYPES = DEFAULT_TABLES.cabins
+ACTIVITIES = DEFAULT_TABLES.activities
+BASE_PRICE = DEFAULT_TABLES.base_price
+COMPETITOR_PRICE = DEFAULT_TABLES.competitor_price
+WEIGHTS = DEFAULT_TABLES.weights
+EXTERNAL_FACTORS = DEFAULT_TABLES.external_factors
+
+# Booking window tiers: (minimum days until check-in, factor)
+BOOKING_WINDOW_TIERS = DEFAULT_TABLES.booking_window_tiers
+SAME_DAY_FACTOR = DEFAULT_TABLES.same_day_factor
+
+# A lead time inside each tier, used to price the tier as a whole
+TIER_DAYS_UNTIL = DEFAULT_TABLES.tier_days_until
+
+DATE_FORMAT = "%Y-%m-%d"
+
+def get_season(date):
+    """Determine season from date"""
+    month = date.month
+    if month in [3, 4, 5]:
+        return "spring"
+    elif month in [6, 7, 8]:
+        return "summer"
+    elif month in [9, 10, 11]:
+        return "fall"
+    else:
+        return "winter"
+
+# Season bitmasks: one bit per entry in SEASONS
+SEASON_BITS = {season: 1 << i for i, season in enumerate(SEASONS)}
+ALL_SEASONS_MASK = (1 << len(SEASONS)) - 1
+
+# Mask of seasons touched by a run of consecutive months, indexed by
+# [first month - 1][number of months - 1]
+MONTH_SPAN_MASKS = [
+    [0] * 12 for _ in range(12)
+]
+for _first in range(12):
+    _mask = 0
+    for _span in range(12):
+        _mask |= 1 << season_index((_first + _span) % 12 + 1)
+        MONTH_SPAN_MASKS[_first][_span] = _mask
+
+# Seasons each activity is offered in, as a mask
+ACTIVITY_SEASON_MASKS = DEFAULT_TABLES.activity_season_masks
+
+def season_mask_in_range(start_date, end_date):
+    """Bitmask of the seasons covered by the nights in [start_date, end_date)"""
+    nights = -(-(end_date - start_date) // timedelta(days=1))
+    if nights <= 0:
+        return 0
+    last_night = start_date + timedelta(days=nights - 1)
+    months = (last_night.year - start_date.year) * 12 + last_night.month - start_date.month + 1
+    if months >= 12:
+        return ALL_SEASONS_MASK
+    return MONTH_SPAN_MASKS[start_date.month - 1][months - 1]
+
+def seasons_from_mask(mask):
+    return {season for season, bit in SEASON_BITS.items() if mask & bit}
+
+def get_seasons_in_range(start_date, end_date):
+    """Get all seasons covered by a date range"""
+    return seasons_from_mask(season_mask_in_range(start_date, end_date))
+
+def available_activities(season_mask, tables=DEFAULT_TABLES):
+    """Keys of the activities bookable in any season of the mask, in ACTIVITIES order"""
+    return [key for key, mask in tables.activity_season_masks.items() if mask & season_mask]
+
+def booking_window_tier(days_until, tiers=BOOKING_WINDOW_TIERS):
+    """Index of the booking window tier for a lead time (same day is the last tier)"""
+    for tier, (min_days, _) in enumerate(tiers):
+        if days_until >= min_days:
+            return tier
+    return len(tiers)
+
+def parse_date(value):
+    """Accept a datetime, a date or a YYYY-MM-DD string and return a datetime"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return datetime.strptime(value.strip(), DATE_FORMAT)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    raise TypeError(f"Dates must be YYYY-MM-DD strings, not {type(value).__name__}")
+
+
+def copy_quote(quote):
+    """A copy of a quote dict that shares nothing mutable with it (dates are immutable)"""
+    copy = dict(quote)
+    copy["nightly_data"] = [dict(night) for night in quote["nightly_data"]]
+    copy["selected_activities"] = [dict(activity) for activity in quote["selected_activities"]]
+    return copy
+
+
+class PricingEngine:
+    """Stateless-per-request quote calculator shared by the GUI and batch callers"""
+
+    def __init__(self, base_price=None, competitor_price=None, weights=None, external_factors=None,
+                 calendar=None, noise_seed=NOISE_SEED, cache=None, tables=None, ledger=None):
+        # Cabin types, activities, booking window tiers and the defaults of
+        # the pricing parameters come from tables (see pricing_config.py)
+        self.tables = tables or DEFAULT_TABLES
+        self.calendar = calendar or self.tables.calendar
+        self.noise_seed = noise_seed
+        self.cache = cache
+        # With a ReservationLedger, requests for more cabins than are free are refused
+        self.ledger = ledger
+        self._base_price = self.tables.base_price if base_price is None else base_price
+        self._competitor_price = self.tables.competitor_price if competitor_price is None else competitor_price
+        self._weights = MappingProxyType(dict(self.tables.weights if weights is None else weights))
+        self._external_factors = MappingProxyType(dict(self.tables.external_factors if external_factors is None
+                                                       else external_factors))
+        self.price_index = PriceIndex(self, self.tables.tier_days_until)
+
+    # Pricing parameters are read-only views; changing one through its
+    # setter (or set_parameters) invalidates any cached quotes.
+
+    @property
+    def base_price(self):
+        return self._base_price
+
+    @base_price.setter
+    def base_price(self, value):
+        self.set_parameters(base_price=value)
+
+    @property
+    def competitor_price(self):
+        return self._competitor_price
+
+    @competitor_price.setter
+    def competitor_price(self, value):
+        self.set_parameters(competitor_price=value)
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @weights.setter
+    def weights(self, value):
+        self.set_parameters(weights=value)
+
+    @property
+    def external_factors(self):
+        return self._external_factors
+
+    @external_factors.setter
+    def external_factors(self, value):
+        self.set_parameters(external_factors=value)
+
+    def set_parameters(self, base_price=None, competitor_price=None, weights=None, external_factors=None):
+        """Update pricing parameters; weights/external_factors are merged into the current values"""
+        if base_price is not None:
+            self._base_price = base_price
+        if competitor_price is not None:
+            self._competitor_price = competitor_price
+        if weights is not None:
+            self._weights = MappingProxyType({**self._weights, **weights})
+        if external_factors is not None:
+            self._external_factors = MappingProxyType({**self._external_factors, **external_factors})
+        self.price_index.invalidate()
+        if self.cache is not None:
+            self.cache.invalidate()
+
+    def calculate_seasonality(self, date):
+        return self.calendar.seasonality(date)
+
+    def calculate_booking_window(self, days_until):
+        tiers = self.tables.booking_window_tiers
+        tier = booking_window_tier(days_until, tiers)
+        return tiers[tier][1] if tier < len(tiers) else self.tables.same_day_factor
+
+    def calculate_price_for_date(self, date, days_until_checkin, cabin_type=None):
+        alpha = self.base_price
+        c_t = self.competitor_price
+
+        s_t = self.calculate_seasonality(date)
+        b_t = self.calculate_booking_window(days_until_checkin)
+        w_t = self.external_factors['weather'] * self.external_factors['event']
+        u = noise_uniform(date.toordinal(), cabin_type, -0.05, 0.05, self.noise_seed)
+
+        beta = self.weights['seasonality']
+        gamma = self.weights['competitor']
+        delta = self.weights['booking_window']
+        epsilon = self.weights['external']
+        zeta = self.weights['noise']
+
+        seasonality_adj = beta * (s_t - 1) * alpha
+        competitor_adj = gamma * (c_t - alpha)
+        booking_adj = delta * (b_t - 1) * alpha
+        external_adj = epsilon * (w_t - 1) * alpha
+        noise_adj = zeta * u * alpha
+
+        final_price = alpha + seasonality_adj + competitor_adj + booking_adj + external_adj + noise_adj
+        return max(final_price, alpha * 0.5)
+
+    def room_total(self, cabin_type, check_in, check_out, days_until_checkin, cabin_count=1):
+        """Room total for a stay straight from the prefix-sum price index"""
+        tier = booking_window_tier(days_until_checkin, self.tables.booking_window_tiers)
+        base_room_total = self.price_index.range_total(cabin_type, tier, check_in, check_out)
+        return base_room_total * self.tables.cabins[cabin_type]["multiplier"] * cabin_count
+
+    def quote(self, request, now=None):
+        """Price a single quote request.
+
+        A request is a dict with "cabin_type", "check_in", "check_out" and
+        optionally "cabin_count" (default 1) and "activities" (activity key ->
+        guest count). Raises ValueError for requests that cannot be quoted,
+        including (with a ledger attached) stays without enough free cabins.
+        With a cache attached, repeated requests are answered from it; each
+        call still gets its own result dict that the caller may change.
+        """
+        now = now or datetime.now()
+        cabin_key, start_date, end_date, cabin_count, activity_counts = self.parse_request(request, now)
+        tier = booking_window_tier((start_date - now).days, self.tables.booking_window_tiers)
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(cabin_key, start_date, end_date, cabin_count, activity_counts,
+                                            tier, self.calendar.version)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return copy_quote(cached)
+
+        # Nightly room prices come from the prefix-sum price index
+        nightly_data = self.nightly_data(cabin_key, tier, start_date, end_date)
+        base_room_total = self.price_index.range_total(cabin_key, tier, start_date, end_date)
+        selected_activities, activities_total = self.price_activities(activity_counts, start_date, end_date)
+
+        quote = self.assemble_quote(cabin_key, start_date, end_date, cabin_count, base_room_total,
+                                    nightly_data, selected_activities, activities_total)
+        if cache_key is not None:
+            self.cache.put(cache_key, copy_quote(quote))
+        return quote
+
+    # Quote building blocks, also used by live_quote.LiveQuote to re-price
+    # only the part of a quote that changed
+
+    def parse_request(self, request, now):
+        """Validate a quote request; returns (cabin_type, check_in, check_out, cabin_count, activities)
+
+        With a ledger attached this also checks that enough cabins are free.
+        Raises TypeError for a request or activities that is not a mapping.
+        """
+        if not isinstance(request, Mapping):
+            raise TypeError(f"A quote request must be an object, not {type(request).__name__}")
+        cabin_key = request.get("cabin_type", "forest")
+        if cabin_key not in self.tables.cabins:
+            raise ValueError(f"Unknown cabin type: {cabin_key}")
+
+        start_date = parse_date(request["check_in"])
+        end_date = parse_date(request["check_out"])
+
+        if start_date.date() < now.date():
+            raise ValueError("Check-in date cannot be in the past.")
+        if end_date <= start_date:
+            raise ValueError("Check-out date must be after check-in date.")
+
+        cabin_count = int(request.get("cabin_count", 1))
+        if cabin_count < 1:
+            raise ValueError("Cabin count must be at least 1.")
+        activities = request.get("activities") or {}
+        if not isinstance(activities, Mapping):
+            raise TypeError(f"activities must be an object of activity -> guest count, not {type(activities).__name__}")
+        if self.ledger is not None:
+            self.ledger.check(cabin_key, start_date, end_date, cabin_count)
+
+        return cabin_key, start_date, end_date, cabin_count, activities
+
+    def nightly_data(self, cabin_type, tier, start_date, end_date):
+        """Nightly base price and weekend/holiday flags for each night in [start_date, end_date)"""
+        nightly_prices = self.price_index.nightly_prices(cabin_type, tier, start_date, end_date)
+        nightly_data = []
+
+        for i, price_per_night in enumerate(nightly_prices):
+            current_date = start_date + timedelta(days=i)
+            is_weekend = self.calendar.is_weekend(current_date)
+            is_holiday = self.calendar.holiday_kind(current_date) != HOLIDAY_NONE
+
+            nightly_data.append({
+                'date': current_date,
+                'price': price_per_night,
+                'is_weekend': is_weekend,
+                'is_holiday': is_holiday
+            })
+        return nightly_data
+
+    def price_activities(self, activity_counts, start_date, end_date):
+        """(selected_activities, activities_total) for a stay; raises ValueError for unbookable activities"""
+        selected_activities = []
+        activities_total = 0
+        stay_mask = season_mask_in_range(start_date, end_date) if activity_counts else 0
+
+        activities = self.tables.activities
+        for key, count in activity_counts.items():
+            if key not in activities:
+                raise ValueError(f"Unknown activity: {key}")
+            activity = activities[key]
+            if not self.tables.activity_season_masks[key] & stay_mask:
+                raise ValueError(f"{activity['name']} is not available for the selected dates.")
+            count = int(count)
+            if count < 1:
+                raise ValueError(f"Guest count for {activity['name']} must be at least 1.")
+            total = activity['price'] * count
+
+            selected_activities.append({
+                'key': key,
+                'name': activity['name'],
+                'icon': activity['icon'],
+                'price': activity['price'],
+                'count': count,
+                'total': total
+            })
+            activities_total += total
+        return selected_activities, activities_total
+
+    def assemble_quote(self, cabin_type, start_date, end_date, cabin_count, base_room_total,
+                       nightly_data, selected_activities, activities_total):
+        """The quote dict for already priced parts"""
+        cabin_info = self.tables.cabins[cabin_type]
+        cabin_multiplier = cabin_info["multiplier"]
+
+        # Apply cabin multiplier and count
+        room_total = base_room_total * cabin_multiplier * cabin_count
+        grand_total = room_total + activities_total
+
+        return {
+            'grand_total': grand_total,
+            'room_total': room_total,
+            'activities_total': activities_total,
+            'nights': (end_date - start_date).days,
+            'cabin_type': cabin_type,
+            'cabin_count': cabin_count,
+            'cabin_name': cabin_info['name'],
+            'cabin_multiplier': cabin_multiplier,
+            'check_in': start_date,
+            'check_out': end_date,
+            'nightly_data': nightly_data,
+            'selected_activities': selected_activities
+        }
+
+    def quote_batch(self, requests, now=None):
+        """Price many quote requests in one call.
+
+        Returns one result per request, in order. Requests that cannot be
+        quoted produce {"error": message} instead of aborting the batch.
+        """
+        now = now or datetime.now()
+        results = []
+        for request in requests:
+            try:
+                results.append(self.quote(request, now=now))
+            except KeyError as e:
+                results.append({'error': f"Missing field: {e.args[0]}"})
+            except (TypeError, ValueError) as e:
+                results.append({'error': str(e)})
+        return results
+
+
+# Instrumentation points (see instrumentation.py); timed only while enabled
+instrument(PricingEngine, "calculate_seasonality", "pricing.seasonality")
+instrument(PricingEngine, "calculate_booking_window", "pricing.booking_window")
+instrument(sys.modules[__name__], "noise_uniform", "pricing.noise")
+instrument(PricingEngine, "calculate_price_for_date", "pricing.price_for_date")
+instrument(PricingEngine, "nightly_data", "quote.nightly_data")
+instrument(PricingEngine, "price_activities", "quote.activities")
+instrument(PricingEngine, "quote", "quote.total")
@@ -0,0 +1,99 @@
+"""
+Quote Cache
+
+Bounded LRU cache with a time-to-live for finished quotes. Prices are pure
+functions of the request (see noise.py) and only depend on lead time through
+the booking window tier, so a quote can be reused for any request with the
+same cabin type, dates, cabin count, activity selection and tier.
+
+The pricing engine clears its cache whenever base_price, competitor_price,
+weights or external_factors change.
+"""
+
+from collections import OrderedDict
+import threading
+import time
+
+
+class QuoteCache:
+    """Thread-safe LRU cache with per-entry TTL and hit/miss counters"""
+
+    def __init__(self, maxsize=1024, ttl=300.0, clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(cabin_type, check_in, check_out, cabin_count, activities, lead_tier, version=0):
+        """Build a cache key from the parts of a request that affect its price.
+
+        version lets callers fold in anything else prices depend on, such as
+        the calendar factor index's configuration version.
+        """
+        return (
+            cabin_type,
+            check_in.toordinal(),
+            check_out.toordinal(),
+            cabin_count,
+            tuple(sorted(activities.items())),
+            lead_tier,
+            version
+        )
+
+    def get(self, key):
+        """Return the cached quote for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if self.ttl is not None and self.clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self):
+        """Drop every entry, e.g. after pricing parameters change"""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations
+        }
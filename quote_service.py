@@ -0,0 +1,381 @@
+"""
+Quote Service
+
+Long-running asyncio HTTP service that serves the same quotes as the booking
+calculator and the same forecasts as the revenue model, as JSON. It uses
+only the standard library and is meant to run on localhost:
+
+    python3 quote_service.py --port 8080
+
+Endpoints:
+- GET  /health     liveness check
+- GET  /stats      request, coalescing and quote cache counters
+- GET  /metrics    stage timings in the Prometheus text format (--instrument)
+- POST /quote      one quote request (see PricingEngine.quote)
+- POST /quotes     {"requests": [...]} batch of quote requests
+- POST /forecast   {"start_date": "YYYY-MM-DD", "end_date": "YYYY-MM-DD"}
+
+With --reservations quotes are checked against a reservation ledger
+(reservations.py) and three more endpoints book against it:
+- POST /availability  {"check_in": ..., "check_out": ...} -> free cabins per type
+- POST /reserve       a quote request (plus optional "guest") -> reservation and quote
+- POST /cancel        {"id": reservation id}
+
+Identical requests that arrive while one is already being computed share
+its result, a semaphore caps how many requests are worked on at once, and
+forecasts run in a process pool so they never block the event loop.
+
+With --config the pricing tables come from a JSON or TOML file (see
+pricing_config.py) that is reloaded when it changes: the new tables are
+compiled on a watcher thread and a new engine is swapped in with a single
+assignment, so each request is priced entirely by the old or the new
+configuration.
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from http import HTTPStatus
+import json
+
+from batch_cli import to_json
+import instrumentation
+from pricing_config import DEFAULT_TABLES, ConfigWatcher, compile_config, load_tables
+from pricing_engine import PricingEngine, parse_date
+from quote_cache import QuoteCache
+from reservations import ReservationLedger, UnavailableError
+
+MAX_BODY_BYTES = 4 * 1024 * 1024
+MAX_BATCH_SIZE = 1000
+
+# Compiled tables per configuration digest, in each forecast worker
+_worker_tables = {}
+
+
+class ServiceError(Exception):
+    """Error with an HTTP status, reported to the client as JSON"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _date_string(payload, key):
+    """payload[key] as a valid YYYY-MM-DD string; raises ServiceError (400) otherwise"""
+    value = payload[key]
+    if not isinstance(value, str):
+        raise ServiceError(HTTPStatus.BAD_REQUEST, f"{key} must be a YYYY-MM-DD date")
+    try:
+        parse_date(value)
+    except ValueError:
+        raise ServiceError(HTTPStatus.BAD_REQUEST, f"{key} must be a YYYY-MM-DD date")
+    return value
+
+def run_forecast(start, end, config=None, digest=None):
+    """Forecast worker (runs in the process pool)
+
+    config is the service's configuration as a plain dict (None for the
+    defaults); each worker compiles a configuration once per digest.
+    """
+    from forecast_vectorized import predict_period_revenue_vectorized
+
+    start_date, end_date = parse_date(start), parse_date(end)
+    if end_date <= start_date:
+        raise ValueError("End date must be after start date.")
+    tables = None
+    if config is not None:
+        tables = _worker_tables.get(digest)
+        if tables is None:
+            tables = _worker_tables[digest] = compile_config(config)
+    forecast = predict_period_revenue_vectorized(start_date, end_date, tables=tables)
+    columns = forecast.pop("columns")
+    del forecast["days"], forecast["arrays"]
+    forecast["daily"] = {
+        "date": [date.fromordinal(int(o)).strftime("%Y-%m-%d") for o in columns.ordinals],
+        "cabin_revenue": columns.cabin_revenue.tolist(),
+        "activity_revenue": columns.activity_revenue.tolist(),
+        "total_revenue": columns.total_revenue.tolist()
+    }
+    return forecast
+
+
+class QuoteService:
+    """HTTP front end for PricingEngine and the revenue forecast"""
+
+    def __init__(self, engine=None, max_concurrency=64, forecast_workers=None, config_path=None,
+                 reload_interval=1.0, ledger=None, reservations=False):
+        tables = load_tables(config_path) if config_path is not None else None
+        if ledger is None and engine is not None:
+            ledger = engine.ledger
+        if ledger is None and reservations:
+            # The ledger's cabins follow the configuration the service prices from
+            ledger = ReservationLedger((tables or DEFAULT_TABLES).cabins)
+        self.ledger = ledger
+        self.watcher = None
+        if tables is not None:
+            engine = self._make_engine(tables)
+            self.watcher = ConfigWatcher(config_path, self._swap_tables, reload_interval)
+        self.engine = engine or PricingEngine(cache=QuoteCache(), ledger=self.ledger)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.forecast_pool = ProcessPoolExecutor(max_workers=forecast_workers)
+        self._inflight = {}
+        self.counters = {"requests": 0, "coalesced": 0, "errors": 0}
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/stats"): self.stats,
+            ("GET", "/metrics"): self.metrics,
+            ("POST", "/quote"): self.quote,
+            ("POST", "/quotes"): self.quote_batch,
+            ("POST", "/forecast"): self.forecast
+        }
+        if self.ledger is not None:
+            self.routes.update({
+                ("POST", "/availability"): self.availability,
+                ("POST", "/reserve"): self.reserve,
+                ("POST", "/cancel"): self.cancel
+            })
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        if self.watcher is not None:
+            self.watcher.start()
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.forecast_pool.shutdown(cancel_futures=True)
+
+    # --- Configuration ---
+
+    def _make_engine(self, tables):
+        # The ledger is shared by every engine: bookings survive a reload
+        engine = PricingEngine(tables=tables, cache=QuoteCache(), ledger=self.ledger)
+        # Build this year's calendar table now rather than on the first request
+        tables.calendar.year(date.today().year)
+        return engine
+
+    def _swap_tables(self, tables):
+        # Called on the watcher thread; handlers read self.engine once per
+        # request, so a request in progress finishes on the engine it started with.
+        # A new inventory that would drop booked cabins raises, and the
+        # watcher keeps the current configuration.
+        if self.ledger is not None:
+            self.ledger.set_inventory(tables.cabins)
+        self.engine = self._make_engine(tables)
+
+    # --- HTTP plumbing ---
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.send(writer, HTTPStatus.BAD_REQUEST, {"error": "Malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                length = headers.get("content-length") or "0"
+                if not (length.isascii() and length.isdigit()):
+                    await self.send(writer, HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length"}, False)
+                    break
+                length = int(length)
+                if length > MAX_BODY_BYTES:
+                    await self.send(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self.dispatch(method, path.split("?", 1)[0], body)
+                await self.send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def send(self, writer, status, payload, keep_alive):
+        # Plain-text payloads (the metrics export) are sent as they are
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload, default=to_json).encode("utf-8"), "application/json"
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def dispatch(self, method, path, body):
+        self.counters["requests"] += 1
+        handler = self.routes.get((method, path))
+        try:
+            if handler is None:
+                if any(route_path == path for _, route_path in self.routes):
+                    raise ServiceError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {path}")
+                raise ServiceError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+            payload = None
+            if method == "POST":
+                try:
+                    payload = json.loads(body or b"null")
+                except ValueError:
+                    raise ServiceError(HTTPStatus.BAD_REQUEST, "Request body must be JSON")
+            async with self.semaphore:
+                return HTTPStatus.OK, await handler(payload)
+        except ServiceError as e:
+            self.counters["errors"] += 1
+            return e.status, {"error": str(e)}
+        except UnavailableError as e:
+            self.counters["errors"] += 1
+            return HTTPStatus.CONFLICT, {"error": str(e)}
+        except (KeyError, TypeError, ValueError) as e:
+            self.counters["errors"] += 1
+            message = f"Missing field: {e.args[0]}" if isinstance(e, KeyError) else str(e)
+            return HTTPStatus.BAD_REQUEST, {"error": message}
+        except Exception as e:
+            self.counters["errors"] += 1
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"An error occurred: {e}"}
+
+    async def coalesce(self, key, compute):
+        """Share one in-flight computation between identical requests"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.counters["coalesced"] += 1
+            return await asyncio.shield(future)
+        future = asyncio.ensure_future(compute())
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    # --- Endpoints ---
+
+    async def health(self, payload):
+        return {"status": "ok"}
+
+    async def stats(self, payload):
+        engine = self.engine
+        stats = dict(self.counters, inflight=len(self._inflight))
+        if engine.cache is not None:
+            stats["quote_cache"] = engine.cache.stats()
+        stats["config"] = {"digest": engine.tables.digest, "source": engine.tables.source}
+        if self.watcher is not None:
+            stats["config"].update(reloads=self.watcher.reloads, last_error=self.watcher.last_error)
+        if self.ledger is not None:
+            stats["reservations"] = len(self.ledger)
+        return stats
+
+    async def metrics(self, payload):
+        return instrumentation.export_text()
+
+    async def quote(self, payload):
+        if not isinstance(payload, dict):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Expected a quote request object")
+        engine = self.engine
+        key = ("quote", engine.tables.digest, json.dumps(payload, sort_keys=True))
+        return await self.coalesce(key, lambda: self._run_quote(engine, payload))
+
+    async def _run_quote(self, engine, payload):
+        return engine.quote(payload)
+
+    async def quote_batch(self, payload):
+        requests = payload.get("requests") if isinstance(payload, dict) else payload
+        if not isinstance(requests, list):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Expected {\"requests\": [...]}")
+        if len(requests) > MAX_BATCH_SIZE:
+            raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"At most {MAX_BATCH_SIZE} requests per batch")
+        engine = self.engine
+        key = ("quotes", engine.tables.digest, json.dumps(requests, sort_keys=True))
+        # Large batches are priced off the event loop thread
+        loop = asyncio.get_running_loop()
+        results = await self.coalesce(key, lambda: loop.run_in_executor(None, engine.quote_batch, requests))
+        return {"results": results}
+
+    async def forecast(self, payload):
+        if not isinstance(payload, dict):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Expected a forecast request object")
+        # Bad dates are client errors, answered before anything is sent to the pool
+        start, end = _date_string(payload, "start_date"), _date_string(payload, "end_date")
+        tables = self.engine.tables
+        # Worker processes are sent the configuration itself, unless it is their default
+        config = None if tables is DEFAULT_TABLES else tables.config()
+        loop = asyncio.get_running_loop()
+        key = ("forecast", tables.digest, start, end)
+        return await self.coalesce(key, lambda: loop.run_in_executor(self.forecast_pool, run_forecast, start, end,
+                                                                     config, tables.digest))
+
+    async def availability(self, payload):
+        if not isinstance(payload, dict):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Expected an availability request object")
+        check_in, check_out = _date_string(payload, "check_in"), _date_string(payload, "check_out")
+        return self.ledger.availability(parse_date(check_in), parse_date(check_out))
+
+    async def reserve(self, payload):
+        if not isinstance(payload, dict):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Expected a quote request object")
+        # Never coalesced: every request books its own cabins. The quote
+        # checks availability; reserve re-checks it atomically, as another
+        # booking may have taken the last cabins in between (both answer 409).
+        quote = self.engine.quote(payload)
+        reservation = self.ledger.reserve(quote["cabin_type"], quote["check_in"], quote["check_out"],
+                                          quote["cabin_count"], guest=payload.get("guest"))
+        return {"reservation": reservation, "quote": quote}
+
+    async def cancel(self, payload):
+        if not isinstance(payload, dict):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Expected {\"id\": reservation id}")
+        try:
+            return {"reservation": self.ledger.cancel(payload["id"])}
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.NOT_FOUND, str(e))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve cabin quotes and revenue forecasts over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-concurrency", type=int, default=64, help="requests worked on at once")
+    parser.add_argument("--forecast-workers", type=int, default=None, help="processes for forecasts")
+    parser.add_argument("--instrument", action="store_true", help="time quote stages for GET /metrics")
+    parser.add_argument("--config", help="JSON or TOML pricing configuration, reloaded when it changes")
+    parser.add_argument("--reload-interval", type=float, default=1.0, help="seconds between config checks")
+    parser.add_argument("--reservations", action="store_true",
+                        help="check quotes against a reservation ledger and serve /reserve and /cancel")
+    args = parser.parse_args()
+    if args.instrument:
+        instrumentation.enable()
+
+    async def run():
+        service = QuoteService(max_concurrency=args.max_concurrency, forecast_workers=args.forecast_workers,
+                               config_path=args.config, reload_interval=args.reload_interval,
+                               reservations=args.reservations)
+        print(f"Serving quotes on http://{args.host}:{args.port}")
+        try:
+            await service.serve(args.host, args.port)
+        finally:
+            service.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
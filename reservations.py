@@ -0,0 +1,192 @@
+"""
+Reservation Ledger
+
+Keeps track of which cabins are actually booked, so quotes can be checked
+against real availability instead of the forecast's fractional occupancy.
+
+Every cabin (unit) of every type has an occupancy bitmap: one Python int per
+calendar year with bit i set when night i of the year is booked. A stay is
+turned into a mask per year it touches (usually one), so whether a unit is
+free for a stay is an AND per year, and "how many lakeview cabins are free
+for these nights" is one such test per lakeview unit, however many
+reservations the ledger holds. Reserving ORs the mask into free units and
+cancelling clears it again.
+
+A lock makes reserve and cancel atomic, so concurrent bookings can never be
+given the same unit for overlapping nights.
+
+    ledger = ReservationLedger()
+    ledger.free_count("lakeview", date(2027, 7, 9), date(2027, 7, 12))
+    reservation = ledger.reserve("lakeview", date(2027, 7, 9), date(2027, 7, 12), cabin_count=2)
+    ledger.cancel(reservation["id"])
+"""
+
+from datetime import date
+from itertools import count
+import threading
+
+from pricing_config import DEFAULT_TABLES
+
+
+class UnavailableError(ValueError):
+    """Fewer cabins of a type are free for the requested nights than were asked for"""
+
+
+def night_masks(check_in, check_out):
+    """[(year, mask)] for the nights [check_in, check_out): bit i of mask is night i of year"""
+    masks = []
+    start, end = check_in.toordinal(), check_out.toordinal()
+    while start < end:
+        year = date.fromordinal(start).year
+        year_start = date(year, 1, 1).toordinal()
+        stop = min(end, date(year, 12, 31).toordinal() + 1)
+        masks.append((year, ((1 << (stop - start)) - 1) << (start - year_start)))
+        start = stop
+    return masks
+
+
+class ReservationLedger:
+    """Thread-safe bookings per cabin unit with per-unit occupancy bitmaps
+
+    inventory is {cabin_type: {"count": units, ...}} (default: the cabin
+    types of the pricing configuration). Reservations are dicts with "id",
+    "cabin_type", "check_in", "check_out", "nights", "cabin_count", "units"
+    (the unit numbers assigned) and "guest".
+    """
+
+    def __init__(self, inventory=None):
+        inventory = DEFAULT_TABLES.cabins if inventory is None else inventory
+        self.inventory = {cabin_type: info["count"] for cabin_type, info in inventory.items()}
+        self._names = {cabin_type: info.get("name", cabin_type) for cabin_type, info in inventory.items()}
+        # cabin type -> one {year: bitmap} dict per unit
+        self._units = {cabin_type: [{} for _ in range(units)] for cabin_type, units in self.inventory.items()}
+        self._reservations = {}
+        self._ids = count(1)
+        self._lock = threading.Lock()
+        self.version = 0   # bumped by every reserve and cancel
+
+    def set_inventory(self, inventory):
+        """Follow a new cabin inventory, e.g. after a configuration reload
+
+        Cabin types and units are added or removed to match. Raises
+        ValueError (leaving the ledger unchanged) if a cabin type or unit
+        that would be removed holds a reservation.
+        """
+        counts = {cabin_type: info["count"] for cabin_type, info in inventory.items()}
+        with self._lock:
+            for reservation in self._reservations.values():
+                cabin_type = reservation["cabin_type"]
+                if max(reservation["units"]) >= counts.get(cabin_type, 0):
+                    raise ValueError(f"Cannot remove {cabin_type} cabins that hold reservation {reservation['id']}")
+            self._units = {cabin_type: (self._units.get(cabin_type, []) + [{} for _ in range(units)])[:units]
+                           for cabin_type, units in counts.items()}
+            self.inventory = counts
+            self._names = {cabin_type: info.get("name", cabin_type) for cabin_type, info in inventory.items()}
+            self.version += 1
+
+    def _validate(self, cabin_type, check_in, check_out, cabin_count=1):
+        if cabin_type not in self._units:
+            raise ValueError(f"Unknown cabin type: {cabin_type}")
+        if check_out <= check_in:
+            raise ValueError("Check-out date must be after check-in date.")
+        if cabin_count < 1:
+            raise ValueError("Cabin count must be at least 1.")
+        return night_masks(check_in, check_out)
+
+    def _free_units(self, cabin_type, masks):
+        return [unit for unit, bitmaps in enumerate(self._units[cabin_type])
+                if not any(bitmaps.get(year, 0) & mask for year, mask in masks)]
+
+    # --- Queries ---
+
+    def free_count(self, cabin_type, check_in, check_out):
+        """Number of cabins of a type free for every night of [check_in, check_out)"""
+        masks = self._validate(cabin_type, check_in, check_out)
+        with self._lock:
+            return len(self._free_units(cabin_type, masks))
+
+    def availability(self, check_in, check_out):
+        """{cabin_type: free cabins} for [check_in, check_out)"""
+        if check_out <= check_in:
+            raise ValueError("Check-out date must be after check-in date.")
+        masks = night_masks(check_in, check_out)
+        with self._lock:
+            return {cabin_type: len(self._free_units(cabin_type, masks)) for cabin_type in self._units}
+
+    def check(self, cabin_type, check_in, check_out, cabin_count=1):
+        """Raise UnavailableError unless cabin_count cabins of a type are free for the stay"""
+        free = self.free_count(cabin_type, check_in, check_out)
+        if free < cabin_count:
+            raise UnavailableError(self._unavailable_message(cabin_type, free, cabin_count))
+
+    def booked_count(self, cabin_type, night):
+        """Number of cabins of a type booked for one night"""
+        year, mask = night_masks(night, date.fromordinal(night.toordinal() + 1))[0]
+        with self._lock:
+            return sum(1 for bitmaps in self._units[cabin_type] if bitmaps.get(year, 0) & mask)
+
+    def get(self, reservation_id):
+        """The reservation with an id, or None"""
+        return self._reservations.get(reservation_id)
+
+    def reservations(self):
+        """Every current reservation, in booking order"""
+        with self._lock:
+            return list(self._reservations.values())
+
+    def __len__(self):
+        return len(self._reservations)
+
+    # --- Booking ---
+
+    def reserve(self, cabin_type, check_in, check_out, cabin_count=1, guest=None):
+        """Book cabin_count cabins of a type for [check_in, check_out); returns the reservation
+
+        The lowest-numbered free units are assigned. Raises UnavailableError
+        (leaving the ledger unchanged) if not enough cabins are free.
+        """
+        masks = self._validate(cabin_type, check_in, check_out, cabin_count)
+        with self._lock:
+            free = self._free_units(cabin_type, masks)
+            if len(free) < cabin_count:
+                raise UnavailableError(self._unavailable_message(cabin_type, len(free), cabin_count))
+            units = free[:cabin_count]
+            for unit in units:
+                bitmaps = self._units[cabin_type][unit]
+                for year, mask in masks:
+                    bitmaps[year] = bitmaps.get(year, 0) | mask
+            reservation = {
+                "id": next(self._ids),
+                "cabin_type": cabin_type,
+                "check_in": check_in,
+                "check_out": check_out,
+                "nights": check_out.toordinal() - check_in.toordinal(),
+                "cabin_count": cabin_count,
+                "units": units,
+                "guest": guest
+            }
+            self._reservations[reservation["id"]] = reservation
+            self.version += 1
+        return reservation
+
+    def cancel(self, reservation_id):
+        """Cancel a reservation and free its nights; returns it. Raises ValueError for unknown ids."""
+        with self._lock:
+            reservation = self._reservations.pop(reservation_id, None)
+            if reservation is None:
+                raise ValueError(f"No such reservation: {reservation_id}")
+            masks = night_masks(reservation["check_in"], reservation["check_out"])
+            for unit in reservation["units"]:
+                bitmaps = self._units[reservation["cabin_type"]][unit]
+                for year, mask in masks:
+                    remaining = bitmaps.get(year, 0) & ~mask
+                    if remaining:
+                        bitmaps[year] = remaining
+                    else:
+                        bitmaps.pop(year, None)
+            self.version += 1
+        return reservation
+
+    def _unavailable_message(self, cabin_type, free, cabin_count):
+        return (f"Only {free} {self._names[cabin_type]}{'' if free == 1 else 's'} free for the selected dates "
+                f"({cabin_count} requested).")
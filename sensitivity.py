@@ -0,0 +1,275 @@
+"""
+Sensitivity Analysis
+
+Sweeps the revenue forecast over many configurations of its assumptions and
+reports how much each one moves forecast revenue. Parameters are named
+"<group>.<key>":
+
+- weights.seasonality, weights.noise            WEIGHTS (the terms the forecast uses)
+- seasonal_occupancy.<season>                   SEASONAL_OCCUPANCY
+- holiday_boost.<major|season|weekend>          HOLIDAY_OCCUPANCY_BOOST
+- participation.<activity>                      ACTIVITIES[...]["participation_rate"]
+
+Configurations come from a grid, uniform random or Sobol samples (Sobol
+needs scipy), or one-at-a-time low/high values around the current
+settings. They are forecast with the vectorized model across a process
+pool; the calendar factors of the range are computed once and handed to each
+worker when it starts. sweep() yields results in order as they arrive, so
+callers can report partial results, and tornado() ranks the parameters by
+their revenue swing:
+
+    python3 sensitivity.py 2027-01-01 2028-01-01 --method random --samples 2000 --workers 4
+    python3 sensitivity.py 2027-01-01 2028-01-01 --method oat --spread 0.2
+    python3 sensitivity.py 2027-01-01 2028-01-01 --method grid --levels 5 \\
+        --range seasonal_occupancy.summer 1.0 1.4 --range participation.kayaking 0.2 0.5
+"""
+
+import argparse
+from itertools import product
+import json
+import sys
+
+import numpy as np
+
+from forecast_vectorized import calendar_arrays, predict_period_revenue_vectorized
+from parallel import init_shared_range, parallel_map, shared_range
+import predicted_revenue as model
+
+# Largest grid the command line will run
+MAX_GRID_SIZE = 1_000_000
+
+
+# --- Parameters ---
+
+def default_parameters():
+    """Every parameter the forecast depends on"""
+    names = ["weights.seasonality", "weights.noise"]
+    names += [f"seasonal_occupancy.{season}" for season in model.SEASONAL_OCCUPANCY]
+    names += [f"holiday_boost.{kind}" for kind in model.HOLIDAY_OCCUPANCY_BOOST]
+    names += [f"participation.{key}" for key in model.ACTIVITIES]
+    return names
+
+def current_value(name):
+    """Current setting of a parameter in predicted_revenue.py"""
+    group, _, key = name.partition(".")
+    tables = {
+        "weights": model.WEIGHTS,
+        "seasonal_occupancy": model.SEASONAL_OCCUPANCY,
+        "holiday_boost": model.HOLIDAY_OCCUPANCY_BOOST,
+        "participation": {k: a["participation_rate"] for k, a in model.ACTIVITIES.items()}
+    }
+    if group not in tables or key not in tables[group]:
+        raise ValueError(f"Unknown parameter: {name}")
+    return tables[group][key]
+
+def default_ranges(parameters=None, spread=0.2):
+    """{name: (low, high)}: each parameter's current value +/- spread (relative)"""
+    return {name: (current_value(name) * (1 - spread), current_value(name) * (1 + spread))
+            for name in parameters or default_parameters()}
+
+def forecast_overrides(params):
+    """Forecast keyword arguments for {name: value}; unnamed parameters keep their current value"""
+    weights = dict(model.WEIGHTS)
+    seasonal_occupancy = dict(model.SEASONAL_OCCUPANCY)
+    holiday_boost = dict(model.HOLIDAY_OCCUPANCY_BOOST)
+    activities = dict(model.ACTIVITIES)
+    for name, value in params.items():
+        current_value(name)  # raises ValueError for unknown names
+        group, _, key = name.partition(".")
+        if group == "weights":
+            weights[key] = value
+        elif group == "seasonal_occupancy":
+            seasonal_occupancy[key] = value
+        elif group == "holiday_boost":
+            holiday_boost[key] = value
+        else:
+            activities[key] = dict(activities[key], participation_rate=value)
+    return {"weights": weights, "seasonal_occupancy": seasonal_occupancy,
+            "holiday_boost": holiday_boost, "activities": activities}
+
+
+# --- Samples ---
+# Each sampler returns or yields {name: value} configurations.
+
+def grid_samples(grid):
+    """Every combination of {name: [values]} (lazily; grids grow fast)"""
+    names = list(grid)
+    for values in product(*(grid[name] for name in names)):
+        yield dict(zip(names, values))
+
+def grid_levels(ranges, levels):
+    """{name: levels evenly spaced values} over {name: (low, high)}, for grid_samples"""
+    return {name: np.linspace(low, high, levels).tolist() for name, (low, high) in ranges.items()}
+
+def random_samples(ranges, n, seed=0):
+    """n configurations drawn uniformly from {name: (low, high)}"""
+    return _scale(np.random.default_rng(seed).random((n, len(ranges))), ranges)
+
+def sobol_samples(ranges, n, seed=0):
+    """n scrambled Sobol configurations over {name: (low, high)}; n should be a power of two.
+
+    Needs scipy (pip install scipy).
+    """
+    try:
+        from scipy.stats import qmc
+    except ImportError:
+        raise ImportError("Sobol sampling needs scipy: pip install scipy") from None
+    return _scale(qmc.Sobol(d=len(ranges), scramble=True, seed=seed).random(n), ranges)
+
+def one_at_a_time_samples(ranges):
+    """The current settings, then each parameter alone at its low and at its high value"""
+    samples = [{}]
+    for name, (low, high) in ranges.items():
+        samples.append({name: low})
+        samples.append({name: high})
+    return samples
+
+def _scale(unit, ranges):
+    lows = np.array([low for low, _ in ranges.values()])
+    highs = np.array([high for _, high in ranges.values()])
+    names = list(ranges)
+    return [dict(zip(names, row)) for row in (lows + unit * (highs - lows)).tolist()]
+
+
+# --- Sweep ---
+
+def evaluate(item):
+    """(index, params) -> result dict; runs in a worker process"""
+    index, params = item
+    result = predict_period_revenue_vectorized(shared_range["start_date"], shared_range["end_date"],
+                                               days=shared_range["days"], **forecast_overrides(params))
+    return {
+        "index": index,
+        "params": params,
+        "total_revenue": result["total_revenue"],
+        "total_cabin_revenue": result["total_cabin_revenue"],
+        "total_activity_revenue": result["total_activity_revenue"],
+        "avg_occupancy": result["avg_occupancy"]
+    }
+
+def sweep(samples, start_date, end_date, workers=1, chunksize=16):
+    """Lazily yield one result per configuration in samples, in order.
+
+    Results are yielded as soon as they (and all before them) are done, so
+    the caller can report partial results while the sweep runs.
+    """
+    days = calendar_arrays(start_date, end_date)
+    return parallel_map(evaluate, enumerate(samples), workers=workers, chunksize=chunksize,
+                        initializer=init_shared_range, initargs=(start_date, end_date, days))
+
+
+# --- Tornado ---
+
+def tornado(results, parameters=None):
+    """Revenue swing of each parameter, largest first.
+
+    Fits total revenue as a linear function of the swept parameters (least
+    squares; a parameter a configuration leaves out is at its current value)
+    and evaluates the fit at each parameter's lowest and highest sampled
+    value with the others at their mean. Works on partial results.
+    Returns [{"parameter", "low", "high", "low_revenue", "high_revenue", "swing"}].
+    """
+    results = list(results)
+    if not results:
+        return []
+    if parameters is None:
+        parameters = sorted({name for result in results for name in result["params"]})
+    x = np.array([[result["params"].get(name, current_value(name)) for name in parameters] for result in results])
+    y = np.array([result["total_revenue"] for result in results])
+
+    lows, highs, means = x.min(axis=0), x.max(axis=0), x.mean(axis=0)
+    varied = highs > lows
+    slopes = np.zeros(len(parameters))
+    if varied.any():
+        design = np.column_stack([x[:, varied] - means[varied], np.ones(len(y))])
+        slopes[varied] = np.linalg.lstsq(design, y, rcond=None)[0][:-1]
+    centre = y.mean()
+
+    bars = []
+    for i, name in enumerate(parameters):
+        low_revenue = centre + slopes[i] * (lows[i] - means[i])
+        high_revenue = centre + slopes[i] * (highs[i] - means[i])
+        bars.append({
+            "parameter": name,
+            "low": float(lows[i]),
+            "high": float(highs[i]),
+            "low_revenue": float(low_revenue),
+            "high_revenue": float(high_revenue),
+            "swing": float(high_revenue - low_revenue)
+        })
+    bars.sort(key=lambda bar: -abs(bar["swing"]))
+    return bars
+
+def format_tornado(bars, limit=None):
+    lines = [f"{'parameter':<30}{'low':>9}{'high':>9}{'revenue at low':>18}{'revenue at high':>18}{'swing':>14}"]
+    for bar in bars[:limit]:
+        lines.append(f"{bar['parameter']:<30}{bar['low']:>9.3f}{bar['high']:>9.3f}{bar['low_revenue']:>18,.0f}"
+                     f"{bar['high_revenue']:>18,.0f}{bar['swing']:>+14,.0f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    from pricing_engine import parse_date
+
+    parser = argparse.ArgumentParser(description="Sensitivity of forecast revenue to the model's assumptions.")
+    parser.add_argument("start_date", help="YYYY-MM-DD")
+    parser.add_argument("end_date", help="YYYY-MM-DD")
+    parser.add_argument("--method", choices=["oat", "grid", "random", "sobol"], default="oat")
+    parser.add_argument("--range", nargs=3, action="append", metavar=("NAME", "LOW", "HIGH"),
+                        help="parameter to sweep (repeatable; default: every parameter +/- --spread)")
+    parser.add_argument("--spread", type=float, default=0.2, help="default range around current values")
+    parser.add_argument("--samples", type=int, default=1024, help="random/sobol configurations")
+    parser.add_argument("--levels", type=int, default=3, help="grid values per parameter")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--chunksize", type=int, default=16, help="configurations per worker task")
+    parser.add_argument("--report-every", type=int, default=0, help="print the tornado every N results")
+    parser.add_argument("--output", help="write every result as JSON lines to this file")
+    args = parser.parse_args(argv)
+
+    start_date, end_date = parse_date(args.start_date), parse_date(args.end_date)
+    if end_date <= start_date:
+        parser.error("end_date must be after start_date")
+    try:
+        if args.range:
+            ranges = {name: (float(low), float(high)) for name, low, high in args.range}
+            for name in ranges:
+                current_value(name)
+        else:
+            ranges = default_ranges(spread=args.spread)
+        if args.method == "grid":
+            if args.levels ** len(ranges) > MAX_GRID_SIZE:
+                parser.error(f"a {args.levels}-level grid over {len(ranges)} parameters is too large; "
+                             "use --range to pick fewer parameters")
+            samples = grid_samples(grid_levels(ranges, args.levels))
+        elif args.method == "random":
+            samples = random_samples(ranges, args.samples, args.seed)
+        elif args.method == "sobol":
+            samples = sobol_samples(ranges, args.samples, args.seed)
+        else:
+            samples = one_at_a_time_samples(ranges)
+    except (ImportError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else None
+    results = []
+    try:
+        for result in sweep(samples, start_date, end_date, args.workers, args.chunksize):
+            results.append(result)
+            if output:
+                output.write(json.dumps(result) + "\n")
+            if args.report_every and len(results) % args.report_every == 0:
+                print(f"--- after {len(results)} configurations ---")
+                print(format_tornado(tornado(results, list(ranges)), limit=10))
+    finally:
+        if output:
+            output.close()
+
+    print(f"--- {len(results)} configurations ---")
+    print(format_tornado(tornado(results, list(ranges))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
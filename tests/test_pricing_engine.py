@@ -0,0 +1,40 @@
+"""Regression tests for PricingEngine.quote_batch input validation"""
+
+from datetime import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pricing_engine import PricingEngine
+
+NOW = datetime(2027, 1, 1)
+GOOD = {"cabin_type": "forest", "check_in": "2027-07-09", "check_out": "2027-07-12"}
+
+
+def quote_batch(bad):
+    return PricingEngine().quote_batch([GOOD, bad, GOOD], now=NOW)
+
+
+def assert_one_error(results):
+    assert len(results) == 3
+    assert "error" not in results[0] and "error" not in results[2]
+    assert set(results[1]) == {"error"}
+
+
+def test_non_date_check_in_is_a_per_request_error():
+    results = quote_batch({**GOOD, "check_in": 5})
+    assert_one_error(results)
+    assert "int" in results[1]["error"]
+
+
+def test_non_dict_request_is_a_per_request_error():
+    results = quote_batch([1, 2])
+    assert_one_error(results)
+    assert "list" in results[1]["error"]
+
+
+def test_non_dict_activities_is_a_per_request_error():
+    results = quote_batch({**GOOD, "activities": ["hiking"]})
+    assert_one_error(results)
+    assert "activities" in results[1]["error"]
@@ -0,0 +1,131 @@
+"""
+Virtualized List Widget
+
+A scrollable list for long, uniform rows (nightly prices, monthly forecast
+totals). Only the rows that fit on screen are ever created; scrolling
+refills those same row widgets with other items, so showing 3 nights or
+3,650 costs the same number of widgets. set_text is the matching helper for
+labels that are updated in place.
+"""
+
+import tkinter
+import customtkinter as ctk
+
+from instrumentation import instrument
+
+
+def set_text(label, text):
+    """Change a label's text, skipping the redraw when it is unchanged"""
+    if label.cget("text") != text:
+        label.configure(text=text)
+
+
+class VirtualList(ctk.CTkFrame):
+    """Fixed-height-row list that recycles a small pool of row widgets
+
+    create_row(parent) builds one empty row widget and returns it;
+    fill_row(row, item) shows an item in it. At most visible_rows rows are
+    created, each row_height pixels tall. items can be any sequence (a list,
+    DayRows, ...); only the visible ones are read.
+    """
+
+    def __init__(self, master, create_row, fill_row, row_height=36, visible_rows=10, **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(master, **kwargs)
+        self.create_row = create_row
+        self.fill_row = fill_row
+        self.row_height = row_height
+        self.visible_rows = visible_rows
+        self.items = []
+        self.first = 0
+        self.rows = []
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent", height=0)
+        self.body.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self._bind_wheel(self.body)
+
+    # --- Items ---
+
+    def set_items(self, items, keep_position=False):
+        """Show a new sequence of items, scrolled to the top unless keep_position"""
+        self.items = items
+        if not keep_position:
+            self.first = 0
+        self.refresh()
+
+    def append_items(self, items):
+        """Add items at the end (the list keeps its scroll position)"""
+        if not items:
+            return
+        if not isinstance(self.items, list):
+            self.items = list(self.items)
+        self.items.extend(items)
+        self.refresh()
+
+    def refresh(self):
+        """Refill the visible rows from items"""
+        count = min(len(self.items), self.visible_rows)
+        while len(self.rows) < count:
+            row = self.create_row(self.body)
+            # Every row is exactly row_height tall whatever it contains
+            row.configure(height=self.row_height)
+            row.pack_propagate(False)
+            row.grid_propagate(False)
+            self._bind_wheel(row)
+            self.rows.append(row)
+
+        self.body.configure(height=count * self.row_height)
+        self.first = max(0, min(self.first, len(self.items) - count))
+        for position, row in enumerate(self.rows):
+            if position < count:
+                self.fill_row(row, self.items[self.first + position])
+                row.place(x=0, y=position * self.row_height, relwidth=1)
+            else:
+                row.place_forget()
+
+        if len(self.items) > self.visible_rows:
+            self.scrollbar.pack(side="right", fill="y", before=self.body)
+            self.scrollbar.set(self.first / len(self.items), (self.first + count) / len(self.items))
+        else:
+            self.scrollbar.pack_forget()
+
+    # --- Scrolling ---
+
+    def scroll_to(self, first):
+        first = max(0, min(first, len(self.items) - self.visible_rows))
+        if first != self.first:
+            self.first = first
+            self.refresh()
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"|"pages")"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * len(self.items)))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.scroll_to(self.first + int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        if len(self.items) <= self.visible_rows:
+            return None
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.first - 1)
+        else:
+            self.scroll_to(self.first + 1)
+        # Keep an enclosing scrollable frame from scrolling as well
+        return "break"
+
+    def _bind_wheel(self, widget):
+        # Plain Tk bindings on every underlying widget; CTk's own bind()
+        # does not reach all of a compound widget's parts
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tkinter.Misc.bind(widget, sequence, self._on_wheel, add="+")
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+
+# Instrumentation points (see instrumentation.py); timed only while enabled
+instrument(VirtualList, "refresh", "ui.virtual_list")